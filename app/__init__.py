@@ -60,6 +60,24 @@ def get_runtime_audio_file(filename):
     return os.path.join(get_runtime_audio_dir(), filename)
 
 
+def get_user_data_dir():
+    """
+    Returns a writable per-user directory for state kept across restarts
+    (caches, etc.). Uses %LOCALAPPDATA% on Windows, ~/.cache elsewhere.
+    """
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    data_dir = os.path.join(base, 'AutoBOT')
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def get_user_data_file(filename):
+    """
+    Returns the full path to a file in the per-user data directory.
+    """
+    return os.path.join(get_user_data_dir(), filename)
+
+
 # Package version
 __version__ = "1.0.0"
 __app_name__ = "Auto-BOT"
@@ -0,0 +1,336 @@
+"""
+Audio Capture - Persistent Microphone Stream
+One long-lived input stream read by a dedicated thread, instead of opening
+the microphone and calibrating for 300 ms on every turn. The thread runs
+every chunk through the voice activity detector, whose noise statistics
+(an exponentially weighted noise floor from non-speech chunks) are always
+current, so listening starts instantly.
+Chunks land in a preallocated ring buffer; during a turn the thread wakes
+the event loop through an asyncio queue (call_soon_threadsafe), so the
+engine awaits audio instead of blocking the loop on device reads. The
+ring also holds the pre-roll, so the start of a command spoken right after
+the previous one is not clipped.
+
+Any object with read(frames), open(), close(), SAMPLE_RATE, SAMPLE_WIDTH
+and CHUNK can be the source - WavFileSource replays WAV files for tests
+and benchmarks.
+"""
+
+import asyncio
+import threading
+import time
+import wave
+from collections import deque
+from typing import List, Optional, Tuple, Union
+
+from app.vad import VadFrame, VoiceActivityDetector
+
+try:
+    import speech_recognition as sr
+except ImportError:
+    sr = None
+
+
+# Audio kept from before listen() starts, audio held in the ring (how far
+# the consumer may fall behind), and the longest utterance
+PREROLL_SECONDS = 0.3
+RING_SECONDS = 30.0
+MAX_UTTERANCE_SECONDS = 30.0
+
+
+# =============================================================================
+# AUDIO SOURCES
+# =============================================================================
+
+class MicrophoneSource:
+    """The default microphone via speech_recognition (PyAudio), opened once."""
+
+    def __init__(self, device_index: Optional[int] = None, sample_rate: Optional[int] = None,
+                 chunk: int = 1024):
+        if sr is None:
+            raise RuntimeError("speech_recognition is required for microphone input")
+        self._mic = sr.Microphone(device_index=device_index, sample_rate=sample_rate,
+                                  chunk_size=chunk)
+        self.SAMPLE_RATE = self._mic.SAMPLE_RATE
+        self.SAMPLE_WIDTH = self._mic.SAMPLE_WIDTH
+        self.CHUNK = self._mic.CHUNK
+
+    def open(self):
+        self._mic.__enter__()
+
+    def read(self, frames: int) -> bytes:
+        return self._mic.stream.read(frames)
+
+    def close(self):
+        self._mic.__exit__(None, None, None)
+
+
+class WavFileSource:
+    """
+    Fake microphone that plays mono PCM WAV files back to back.
+    read() returns b"" once the files (and trailing silence) are used up.
+    """
+
+    def __init__(self, paths: Union[str, List[str]], chunk: int = 1024,
+                 realtime: bool = False, speed: float = 1.0, trailing_silence: float = 0.0):
+        """
+        Args:
+            paths: WAV file(s); all must share rate and sample width
+            chunk: Frames per read()
+            realtime: Pace reads like a live device (sped up by `speed`)
+            trailing_silence: Seconds of digital silence after the last file
+        """
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.CHUNK = chunk
+        self.realtime = realtime
+        self.speed = speed
+        self.trailing_silence = trailing_silence
+
+        with wave.open(self.paths[0], "rb") as w:
+            self.SAMPLE_RATE = w.getframerate()
+            self.SAMPLE_WIDTH = w.getsampwidth()
+        self._pending: deque = deque()
+        self._wav = None
+        self._silence_left = 0
+        self._next_read = 0.0
+
+    def open(self):
+        self._pending = deque(self.paths)
+        self._silence_left = int(self.trailing_silence * self.SAMPLE_RATE)
+        self._next_read = time.perf_counter()
+        self._open_next()
+
+    def _open_next(self):
+        self._wav = None
+        while self._pending and self._wav is None:
+            wav = wave.open(self._pending.popleft(), "rb")
+            if (wav.getnchannels() != 1 or wav.getframerate() != self.SAMPLE_RATE or
+                    wav.getsampwidth() != self.SAMPLE_WIDTH):
+                wav.close()
+                raise ValueError("WAV files must be mono with matching rate and sample width")
+            self._wav = wav
+
+    def read(self, frames: int) -> bytes:
+        if self.realtime:
+            self._next_read += frames / self.SAMPLE_RATE / self.speed
+            delay = self._next_read - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        data = b""
+        while len(data) < frames * self.SAMPLE_WIDTH and self._wav is not None:
+            data += self._wav.readframes(frames - len(data) // self.SAMPLE_WIDTH)
+            if len(data) < frames * self.SAMPLE_WIDTH:
+                self._wav.close()
+                self._open_next()
+        if not data and self._silence_left > 0:
+            count = min(frames, self._silence_left)
+            self._silence_left -= count
+            data = b"\x00" * (count * self.SAMPLE_WIDTH)
+        return data
+
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+
+# =============================================================================
+# CAPTURE STREAM
+# =============================================================================
+
+class CaptureStream:
+    """
+    Reads the source on a background thread for as long as the bot runs.
+    Call listen() at the start of a turn (from the event loop), await
+    read() for chunks, then stop_listening().
+
+    Chunks are written into fixed slots of one preallocated ring; read()
+    returns a view of a slot, valid until the ring wraps around to it
+    (RING_SECONDS later), so copy it before falling that far behind.
+    """
+
+    def __init__(self, source, vad: Optional[VoiceActivityDetector] = None,
+                 preroll: float = PREROLL_SECONDS, ring_seconds: float = RING_SECONDS):
+        self.source = source
+        self.sample_rate = source.SAMPLE_RATE
+        self.sample_width = source.SAMPLE_WIDTH
+        self.chunk = source.CHUNK
+        self.chunk_seconds = chunk_seconds = self.chunk / self.sample_rate
+        self.chunk_bytes = self.chunk * self.sample_width
+        self.vad = vad or VoiceActivityDetector(self.sample_rate, self.sample_width, self.chunk)
+        self.chunks_read = 0
+        self.dropped = 0
+
+        self._preroll_chunks = max(1, round(preroll / chunk_seconds))
+        self._slots = max(self._preroll_chunks + 1, round(ring_seconds / chunk_seconds))
+        self._ring = bytearray(self._slots * self.chunk_bytes)
+        self._view = memoryview(self._ring)
+        self._lengths = [0] * self._slots
+        self._frames: List[Optional[VadFrame]] = [None] * self._slots
+        self._read_seq = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._signal: Optional[asyncio.Queue] = None
+        self._listening = False
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.ended = False
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self):
+        """Open the source and start the capture thread."""
+        if self._running:
+            return self
+        self.source.open()
+        self._running = True
+        self.ended = False
+        self._thread = threading.Thread(target=self._run, name="mic-capture", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the capture thread and close the source."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        try:
+            self.source.close()
+        except Exception as e:
+            print(f"[CAPTURE] Close error: {e}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        while self._running:
+            try:
+                buffer = self.source.read(self.chunk)
+            except Exception as e:
+                print(f"[CAPTURE] Read error: {e}")
+                buffer = b""
+            if not buffer:
+                break
+            self.process(buffer)
+        self.ended = True
+        self._notify(None)
+
+    # ==================== PER-CHUNK ====================
+
+    @property
+    def noise_floor(self) -> Optional[float]:
+        return self.vad.noise_floor
+
+    @property
+    def energy_threshold(self) -> float:
+        return self.vad.energy_threshold
+
+    def process(self, buffer: bytes) -> VadFrame:
+        """Run one chunk through the VAD (updating the noise floor) and store it."""
+        frame = self.vad.process(buffer)
+        seq = self.chunks_read
+        slot = seq % self._slots
+        size = min(len(buffer), self.chunk_bytes)
+        offset = slot * self.chunk_bytes
+        self._view[offset:offset + size] = buffer[:size]
+        self._lengths[slot] = size
+        self._frames[slot] = frame
+        # Publish only after the slot is complete
+        self.chunks_read = seq + 1
+        self._notify(seq)
+        return frame
+
+    def _notify(self, seq: Optional[int]):
+        # Wake the consumer's loop; never blocks the capture thread
+        with self._lock:
+            if not self._listening:
+                return
+            loop, signal = self._loop, self._signal
+        try:
+            loop.call_soon_threadsafe(signal.put_nowait, seq)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    # ==================== CONSUMER ====================
+
+    def listen(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start a turn on the running (or given) loop: the pre-roll, then every new chunk."""
+        with self._lock:
+            self._loop = loop or asyncio.get_running_loop()
+            self._signal = asyncio.Queue()
+            self._read_seq = max(0, self.chunks_read - self._preroll_chunks)
+            self._listening = True
+
+    def stop_listening(self):
+        """End the turn; the ring keeps filling for the next pre-roll."""
+        with self._lock:
+            self._listening = False
+
+    async def read(self, timeout: float = 1.0) -> Optional[Tuple[memoryview, VadFrame]]:
+        """Next (chunk, VAD frame) of the turn, or None if the source ended or stalled."""
+        while self._read_seq >= self.chunks_read:
+            if self.ended:
+                return None
+            try:
+                await asyncio.wait_for(self._signal.get(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        behind = self.chunks_read - self._read_seq
+        if behind > self._slots:
+            # Lapped by the writer - skip to the oldest chunk still in the ring
+            self.dropped += behind - self._slots
+            self._read_seq += behind - self._slots
+        slot = self._read_seq % self._slots
+        self._read_seq += 1
+        offset = slot * self.chunk_bytes
+        return self._view[offset:offset + self._lengths[slot]], self._frames[slot]
+
+
+# =============================================================================
+# UTTERANCE BUFFER
+# =============================================================================
+
+class PcmBuffer:
+    """
+    One preallocated byte buffer an utterance is copied into chunk by chunk,
+    reused across turns instead of joining a list of chunks.
+    """
+
+    def __init__(self, capacity: int):
+        self._data = bytearray(capacity)
+        self._view = memoryview(self._data)
+        self.length = 0
+
+    @classmethod
+    def for_stream(cls, capture: CaptureStream, seconds: float = MAX_UTTERANCE_SECONDS):
+        chunks = max(1, round(seconds / capture.chunk_seconds))
+        return cls(chunks * capture.chunk_bytes)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def clear(self):
+        self.length = 0
+
+    def append(self, chunk) -> bool:
+        """Copy a chunk in; False (nothing copied) once the buffer is full."""
+        end = self.length + len(chunk)
+        if end > len(self._data):
+            return False
+        self._view[self.length:end] = chunk
+        self.length = end
+        return True
+
+    def getvalue(self) -> bytes:
+        return bytes(self._view[:self.length])
@@ -0,0 +1,104 @@
+"""
+Cancellation - Cooperative Cancel Tokens
+Each executing command gets a CancelToken. Saying "stop" cancels it, and
+NovaOS macros check it between primitive actions (press, write, click,
+wait), aborting with CommandCancelled. Waits sleep on the token, so a
+macro paused in a long wait stops at once instead of at its next action.
+
+The token travels in a context variable, so it follows the step into the
+executor thread without changing any NovaOS signatures.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+
+class CommandCancelled(BaseException):
+    """
+    Raised at a cancel point once the command's token is cancelled.
+    A BaseException (like asyncio.CancelledError) so the macros'
+    `except Exception` fallbacks don't swallow it and carry on.
+    """
+
+
+class CancelToken:
+    """Set once; remembers when, so time-to-abort can be measured."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._children: List["CancelToken"] = []
+        self.cancelled_at: Optional[float] = None   # perf_counter
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "stop"):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.cancelled_at = time.perf_counter()
+            self.reason = reason
+            self._event.set()
+            children, self._children = self._children, []
+        for child in children:
+            child.cancel(reason)
+
+    def child(self) -> "CancelToken":
+        """Token cancelled along with this one, or on its own (e.g. one step's timeout)."""
+        child = CancelToken()
+        with self._lock:
+            if not self._event.is_set():
+                self._children.append(child)
+                return child
+        child.cancel(self.reason)
+        return child
+
+    def check(self):
+        if self._event.is_set():
+            raise CommandCancelled(self.reason)
+
+    def sleep(self, seconds: float):
+        """Sleep, waking (and raising) as soon as the token is cancelled."""
+        if self._event.wait(max(0.0, seconds)):
+            raise CommandCancelled(self.reason)
+
+
+_current_token = contextvars.ContextVar("cancel_token", default=None)
+
+
+def current_token() -> Optional[CancelToken]:
+    """Token of the command running in this context (None = not cancellable)."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancel_scope(token: CancelToken):
+    """Make `token` the current token inside the block."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def checkpoint():
+    """Cancel point: raise CommandCancelled if the current command was cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+
+def sleep(seconds: float):
+    """time.sleep that is also a cancel point."""
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.check()
+        token.sleep(seconds)
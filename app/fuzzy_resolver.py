@@ -0,0 +1,228 @@
+"""
+Fuzzy Resolver - Typo-Tolerant Site and App Name Resolution
+Resolves near-miss names from speech recognition ("you tube", "git hub",
+"stack over flow", "linkdin") against the known site/app tables using a
+BK-tree over edit distance. Lookups take microseconds, so the expensive
+fallbacks (Google search, "Don't recognize") only run on real unknowns.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def compact_name(text: str) -> str:
+    """Lowercase and drop everything but letters, digits and '+'."""
+    return re.sub(r'[^a-z0-9+]', '', text.lower())
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Levenshtein distance (insert/delete/substitute, all cost 1).
+    Bit-parallel (Myers/Hyyro): one pass over `a` with integer ops per char.
+    With a limit, any distance above it is reported as limit + 1.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    m = len(b)
+    if not m:
+        return len(a)
+
+    # Bitmask of positions for each character of the shorter string
+    peq: Dict[str, int] = {}
+    for i, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    for ch in a:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+
+    if limit is not None and score > limit:
+        return limit + 1
+    return score
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """A resolved name"""
+    name: str        # Canonical key in the source table
+    value: str       # URL or launch target
+    kind: str        # "website", "app" or "download"
+    source: str      # Table the entry came from
+    distance: int    # Edit distance between the compacted query and name
+
+
+class BKTree:
+    """Burkhard-Keller tree keyed by compacted names."""
+
+    def __init__(self):
+        # node: [word, {distance: child_node}]
+        self._root = None
+
+    def add(self, word: str):
+        if self._root is None:
+            self._root = [word, {}]
+            return
+        node = self._root
+        while True:
+            d = edit_distance(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """All (distance, word) pairs within max_distance."""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            # Past this bound neither the node nor any child can match
+            bound = max_distance + (max(children) if children else 0)
+            d = edit_distance(word, node_word, bound)
+            if d > bound:
+                continue
+            if d <= max_distance:
+                found.append((d, node_word))
+            for child_d, child in children.items():
+                if d - max_distance <= child_d <= d + max_distance:
+                    stack.append(child)
+        return found
+
+
+class FuzzyResolver:
+    """
+    Typo-tolerant resolver over registered name tables.
+    Each table has a kind ("website", "app", "download"). Earlier
+    registrations win ties at the same distance.
+    """
+
+    def __init__(self):
+        # compacted name -> [(order, FuzzyMatch template), ...]
+        self._entries: Dict[str, List[Tuple[int, FuzzyMatch]]] = {}
+        self._sources: Dict[str, int] = {}
+        self._tree = None
+        self._lock = threading.Lock()
+
+    def register(self, source: str, table: Dict[str, str], kind: str):
+        """Register (or replace) a {name: value} table under a source name."""
+        with self._lock:
+            order = self._sources.setdefault(source, len(self._sources))
+            for key in list(self._entries):
+                kept = [e for e in self._entries[key] if e[1].source != source]
+                if kept:
+                    self._entries[key] = kept
+                else:
+                    del self._entries[key]
+
+            for name, value in table.items():
+                key = compact_name(name)
+                if key:
+                    self._entries.setdefault(key, []).append(
+                        (order, FuzzyMatch(name, value, kind, source, 0))
+                    )
+            self._tree = None
+
+    def _get_tree(self) -> BKTree:
+        tree = self._tree
+        if tree is None:
+            with self._lock:
+                if self._tree is None:
+                    tree = BKTree()
+                    for key in self._entries:
+                        tree.add(key)
+                    self._tree = tree
+                tree = self._tree
+        return tree
+
+    @staticmethod
+    def max_distance_for(key: str) -> int:
+        """
+        Edit budget scales with length. Names up to 6 characters must match
+        exactly once compacted - one edit turns "print" into "paint" and
+        "email" into "gmail"; two edits on 7-9 characters turn "chatbot"
+        into "chatgpt" and "telegraph" into "telegram".
+        """
+        if len(key) <= 6:
+            return 0
+        if len(key) <= 9:
+            return 1
+        return 2
+
+    def resolve(self, text: str, kinds: Optional[Sequence[str]] = None,
+                max_distance: Optional[int] = None) -> Optional[FuzzyMatch]:
+        """
+        Best match for text, or None.
+        Ranked by distance, then by position of the kind in `kinds`,
+        then by registration order.
+        """
+        key = compact_name(text)
+        if not key:
+            return None
+        if max_distance is None:
+            max_distance = self.max_distance_for(key)
+
+        # Exact compact hit ("you tube" -> "youtube") skips the tree walk
+        if key in self._entries:
+            best = self._best([(0, key)], kinds)
+            if best is not None:
+                return best
+
+        # Near misses keep the first letter ("interest" is not "pinterest")
+        candidates = [(distance, name_key)
+                      for distance, name_key in self._get_tree().search(key, max_distance)
+                      if name_key[0] == key[0]]
+        return self._best(candidates, kinds)
+
+    def _best(self, candidates: List[Tuple[int, str]],
+              kinds: Optional[Sequence[str]]) -> Optional[FuzzyMatch]:
+        best = None
+        best_rank = None
+        for distance, name_key in candidates:
+            for order, entry in self._entries.get(name_key, ()):
+                if kinds is not None and entry.kind not in kinds:
+                    continue
+                kind_rank = kinds.index(entry.kind) if kinds is not None else 0
+                rank = (distance, kind_rank, order)
+                if best_rank is None or rank < best_rank:
+                    best_rank = rank
+                    best = FuzzyMatch(entry.name, entry.value, entry.kind, entry.source, distance)
+        return best
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_fuzzy_resolver = None
+
+def get_fuzzy_resolver() -> FuzzyResolver:
+    """Get or create the shared fuzzy resolver"""
+    global _fuzzy_resolver
+    if _fuzzy_resolver is None:
+        _fuzzy_resolver = FuzzyResolver()
+    return _fuzzy_resolver
@@ -0,0 +1,126 @@
+"""
+Groq Client - Shared, Pooled Groq Client
+One Groq client for the whole app (commands, essays, warm-up) over a single
+keep-alive httpx pool, so only the first request - or the background
+warm-up - pays for DNS, TCP and TLS. Every request logs connect time vs.
+time-to-first-byte via the httpcore trace extension.
+"""
+
+import os
+import threading
+import time
+
+import httpx
+from groq import Groq
+
+from app.latency import LatencyRecorder
+
+
+# Pool sizing - a voice assistant rarely has more than a couple in flight
+MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "4"))
+KEEPALIVE_EXPIRY = float(os.getenv("GROQ_KEEPALIVE_SECONDS", "120"))
+REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Per-request connect / TTFB histograms (ms)
+GROQ_LATENCY = LatencyRecorder()
+
+# httpcore trace events that make up connection setup
+_CONNECT_EVENTS = ("connection.connect_tcp", "connection.start_tls")
+
+
+class _RequestTrace:
+    """httpcore trace callback for one request: connect time and TTFB."""
+
+    def __init__(self, request: httpx.Request):
+        self.request = request
+        self.start = time.perf_counter()
+        self.connect = 0.0
+        self.ttfb = None
+        self._started = {}
+
+    def __call__(self, event_name: str, info: dict):
+        now = time.perf_counter()
+        if event_name.endswith(".started"):
+            self._started[event_name[:-8]] = now
+        elif event_name.endswith(".complete"):
+            name = event_name[:-9]
+            began = self._started.pop(name, now)
+            if name in _CONNECT_EVENTS:
+                self.connect += now - began
+            elif name.endswith(".receive_response_headers"):
+                self.ttfb = now - self.start
+
+    def report(self, status_code: int):
+        ttfb = self.ttfb if self.ttfb is not None else time.perf_counter() - self.start
+        reused = self.connect == 0.0
+        GROQ_LATENCY.record("connect", self.connect)
+        GROQ_LATENCY.record("ttfb.reused" if reused else "ttfb.new", ttfb)
+        print(f"[GROQ] {self.request.method} {self.request.url.path} {status_code} | "
+              f"connect {self.connect * 1000:.0f}ms | ttfb {ttfb * 1000:.0f}ms"
+              f"{' (reused connection)' if reused else ''}")
+
+
+def _on_request(request: httpx.Request):
+    request.extensions["trace"] = _RequestTrace(request)
+
+
+def _on_response(response: httpx.Response):
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, _RequestTrace):
+        trace.report(response.status_code)
+
+
+def _build_http_client() -> httpx.Client:
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_groq_client = None
+_groq_lock = threading.Lock()
+
+def get_groq_client(api_key: str = None) -> Groq:
+    """Get or create the shared Groq client (api_key defaults to GROQ_API_KEY)"""
+    global _groq_client
+    if _groq_client is None:
+        with _groq_lock:
+            if _groq_client is None:
+                _groq_client = Groq(
+                    api_key=api_key or os.getenv("GROQ_API_KEY"),
+                    http_client=_build_http_client(),
+                )
+    return _groq_client
+
+
+def warm_up_groq_client(background: bool = True):
+    """
+    Open the pooled connection before the first command (GROQ_WARMUP=0 to skip).
+    Uses the models listing, which costs no tokens.
+    """
+    if os.getenv("GROQ_WARMUP", "1").lower() not in ("1", "true", "yes"):
+        return None
+
+    def _warm():
+        try:
+            get_groq_client().models.list()
+            print("[GROQ] Connection warmed up.")
+        except Exception as e:
+            print(f"[GROQ] Warm-up failed: {e}")
+
+    if not background:
+        _warm()
+        return None
+    thread = threading.Thread(target=_warm, name="groq-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,173 @@
+"""
+Keyword Engine - Shared Aho-Corasick Keyword Automaton
+One automaton built from every keyword table in the app (Sentinel, FastPath,
+shortcut intents). A single O(len(text)) pass reports every keyword hit with
+its category and position, so adding phrases never slows classification.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """A keyword occurrence found in the scanned text"""
+    keyword: str
+    category: str
+    value: Any
+    start: int
+    end: int
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over registered keywords.
+    Keywords are grouped by category; the automaton is rebuilt lazily on the
+    first scan after a registration.
+    """
+
+    def __init__(self):
+        # keyword -> [(category, value), ...]
+        self._entries: Dict[str, List[Tuple[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = True
+
+        # Built tables (node 0 is the root)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+
+    # ==================== REGISTRATION ====================
+
+    def add(self, keyword: str, category: str, value: Any = None):
+        """Add a single keyword under a category."""
+        if not keyword:
+            return
+        with self._lock:
+            self._entries.setdefault(keyword, []).append((category, value))
+            self._dirty = True
+
+    def register(self, category: str, keywords: Iterable, value: Any = None):
+        """
+        Replace every keyword of a category.
+        Items may be plain strings or (keyword, value) pairs.
+        Re-registering a category is idempotent (safe on module reload).
+        """
+        with self._lock:
+            self._drop_category(category)
+            for item in keywords:
+                keyword, item_value = item if isinstance(item, tuple) else (item, value)
+                if keyword:
+                    self._entries.setdefault(keyword, []).append((category, item_value))
+            self._dirty = True
+
+    def _drop_category(self, category: str):
+        for keyword in list(self._entries):
+            kept = [e for e in self._entries[keyword] if e[0] != category]
+            if kept:
+                self._entries[keyword] = kept
+            else:
+                del self._entries[keyword]
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ==================== CONSTRUCTION ====================
+
+    def _build(self):
+        """Build trie, failure links and merged output sets (BFS order)."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[str]] = [[]]
+
+        for keyword in self._entries:
+            node = 0
+            for ch in keyword:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(keyword)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                # Suffix keywords end here too
+                outputs[child].extend(outputs[fail[child]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(o) for o in outputs]
+        self._dirty = False
+
+    def _ensure_built(self):
+        if self._dirty:
+            with self._lock:
+                if self._dirty:
+                    self._build()
+
+    # ==================== SCANNING ====================
+
+    def scan(self, text: str, categories: Optional[Set[str]] = None) -> List[KeywordHit]:
+        """
+        Report every keyword occurrence in text (overlapping hits included).
+        Optionally restrict the result to a set of categories.
+        """
+        self._ensure_built()
+        goto, fail, out, entries = self._goto, self._fail, self._out, self._entries
+
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword in out[node]:
+                start = i + 1 - len(keyword)
+                for category, value in entries[keyword]:
+                    if categories is None or category in categories:
+                        hits.append(KeywordHit(keyword, category, value, start, i + 1))
+        return hits
+
+    def categories(self, text: str) -> Set[str]:
+        """Return the set of categories with at least one hit in text."""
+        self._ensure_built()
+        goto, fail, out, entries = self._goto, self._fail, self._out, self._entries
+
+        found = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword in out[node]:
+                for category, _ in entries[keyword]:
+                    found.add(category)
+        return found
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_keyword_engine = None
+
+def get_keyword_engine() -> KeywordAutomaton:
+    """Get or create the shared keyword automaton"""
+    global _keyword_engine
+    if _keyword_engine is None:
+        _keyword_engine = KeywordAutomaton()
+    return _keyword_engine
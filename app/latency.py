@@ -0,0 +1,114 @@
+"""
+Latency - Lightweight Latency Histograms
+Fixed log-spaced buckets plus a bounded window of raw samples for
+percentiles. Recording is a lock, a bisect and two appends, so it is cheap
+enough to leave on in production.
+"""
+
+import bisect
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+# Bucket upper bounds in milliseconds (last bucket is open-ended)
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Histogram of durations (recorded in seconds, reported in ms)."""
+
+    def __init__(self, max_samples: int = 2048):
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.samples: deque = deque(maxlen=max_samples)
+        self.count = 0
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        ms = seconds * 1000.0
+        with self._lock:
+            self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+            self.samples.append(ms)
+            self.count += 1
+            self.total_ms += ms
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p-th percentile (0-100) in ms over the recent sample window."""
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        # Nearest-rank
+        rank = max(1, math.ceil(p / 100.0 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def summary(self) -> dict:
+        """count, mean and p50/p95/p99 in ms"""
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+    def format(self, width: int = 30) -> str:
+        """ASCII bar chart of the bucket counts."""
+        peak = max(self.counts) or 1
+        lines = []
+        lower = 0
+        for i, count in enumerate(self.counts):
+            label = f"{lower}-{BUCKETS_MS[i]}ms" if i < len(BUCKETS_MS) else f">{lower}ms"
+            if count:
+                bar = "#" * max(1, count * width // peak)
+                lines.append(f"  {label:>13} | {bar} {count}")
+            if i < len(BUCKETS_MS):
+                lower = BUCKETS_MS[i]
+        return "\n".join(lines)
+
+
+class LatencyRecorder:
+    """Named set of histograms (e.g. 'speculative.llm', 'sequential.local')."""
+
+    def __init__(self, max_samples: int = 2048):
+        self.max_samples = max_samples
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram(self.max_samples))
+        return histogram
+
+    def record(self, name: str, seconds: float):
+        self.get(name).record(seconds)
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the enclosed block into histogram `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.get(name).record(time.perf_counter() - start)
+
+    def report(self) -> str:
+        """Per-histogram percentiles and bars, for the log."""
+        blocks = []
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            s = histogram.summary()
+            if not s["count"]:
+                continue
+            blocks.append(
+                f"{name}: n={s['count']} mean={s['mean_ms']:.1f}ms "
+                f"p50={s['p50_ms']:.1f}ms p95={s['p95_ms']:.1f}ms p99={s['p99_ms']:.1f}ms\n"
+                + histogram.format()
+            )
+        return "\n".join(blocks) if blocks else "(no samples)"
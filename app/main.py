@@ -10,105 +10,227 @@ LIGHTNING-FAST TTS SYSTEM:
 - Non-blocking async architecture
 """
 
+import abc
 import asyncio
+import contextvars
+import functools
+import importlib.util
+import itertools
+import json
 import threading
 import os
-import audioop
+import time
 import speech_recognition as sr
-import edge_tts
 import pygame
-import win32com.client
-import pythoncom
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any, Optional
 
-from app import nova_brain, nova_os, get_runtime_audio_file, get_runtime_audio_dir
+from app import nova_brain, nova_os
+from app.groq_client import warm_up_groq_client, GROQ_LATENCY
+from app.latency import LatencyRecorder
+from app.tracing import get_tracer, TRACE_EXPORT
+from app.audio_capture import CaptureStream, MicrophoneSource, PcmBuffer
+from app.cancellation import CancelToken, CommandCancelled, cancel_scope, current_token
+from app.scheduler import CommandQueue, Priority
+from app.step_executor import StepExecutor, CANCELLED, TIMEOUT
+from app.plan_executor import PlanExecutor, OS, SPEECH
+from app.tts import SpeechRules, get_instant_tts, TTS_LATENCY
+from app.speech_cache import get_speech_cache, static_phrases, edge_audio, EDGE_VOICE, EDGE_RATE
+from app.speech_stream import StreamPlayer
+from app.sentinel_core import Intent, IntentClassifier
+from app.vad import Endpointer
 
 
 # ============================================================
-# LIGHTNING-FAST TTS ENGINE
+# SPEECH RECOGNITION BACKENDS
 # ============================================================
 
-class InstantTTS:
+# Backends tried in order (google, whisper, vosk, replay); the next one is
+# used when a backend is not installed or fails (network down, no model)
+ASR_BACKENDS = [b.strip().lower() for b in os.getenv("ASR_BACKENDS", "google").split(",") if b.strip()]
+ASR_WHISPER_MODEL = os.getenv("ASR_WHISPER_MODEL", "base.en")
+ASR_VOSK_MODEL = os.getenv("ASR_VOSK_MODEL", "model")
+ASR_REPLAY_FILE = os.getenv("ASR_REPLAY_FILE", "")
+
+# Recognition time per backend (errors under "<name>.error")
+ASR_LATENCY = LatencyRecorder()
+
+
+class RecognizerBackend(abc.ABC):
     """
-    Ultra-fast text-to-speech using Windows SAPI.
-    Latency: ~20ms (vs 500-1000ms for Edge-TTS)
+    Turns sr.AudioData into text. Raises sr.UnknownValueError when the
+    audio is unintelligible and sr.RequestError when the backend can't run.
     """
     
-    # Common responses to pre-optimize
-    SHORT_RESPONSES = {
-        "done", "ok", "opened", "created", "deleted", "error", 
-        "listening", "processing", "executing", "complete",
-        "yes", "no", "starting", "stopping", "ready"
-    }
+    name = "base"
     
-    def __init__(self, rate=4):
-        """
-        Initialize SAPI voice.
-        rate: -10 (slowest) to 10 (fastest), default 4 for snappy responses
-        """
-        self.rate = rate
-        self._executor = ThreadPoolExecutor(max_workers=1)
-        self._speaker = None
-    
-    def _init_sapi(self):
-        """Initialize SAPI in the current thread (COM requirement)."""
-        pythoncom.CoInitialize()
-        speaker = win32com.client.Dispatch("SAPI.SpVoice")
-        speaker.Rate = self.rate
-        
-        # Try to get a better voice if available
-        voices = speaker.GetVoices()
-        for i in range(voices.Count):
-            voice = voices.Item(i)
-            name = voice.GetDescription()
-            # Prefer Zira (female) or David (male) - clearer than default
-            if "Zira" in name or "David" in name:
-                speaker.Voice = voice
-                break
-        
-        return speaker
+    @property
+    def available(self):
+        return True
     
-    def _speak_sync(self, text):
-        """Synchronous SAPI speak (runs in thread pool)."""
-        try:
-            pythoncom.CoInitialize()
-            speaker = win32com.client.Dispatch("SAPI.SpVoice")
-            speaker.Rate = self.rate
-            speaker.Speak(text)
-            pythoncom.CoUninitialize()
-        except Exception as e:
-            print(f"SAPI Error: {e}")
+    @abc.abstractmethod
+    def recognize(self, audio):
+        """Text of `audio`."""
+
+
+class GoogleBackend(RecognizerBackend):
+    """Google Web Speech API (online)."""
+    
+    name = "google"
+    
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+    
+    def recognize(self, audio):
+        return self.recognizer.recognize_google(audio)
+
+
+class WhisperBackend(RecognizerBackend):
+    """Local Whisper model via speech_recognition (offline, needs openai-whisper)."""
+    
+    name = "whisper"
+    
+    def __init__(self, recognizer, model=ASR_WHISPER_MODEL):
+        self.recognizer = recognizer
+        self.model = model
     
-    def speak(self, text):
+    @property
+    def available(self):
+        return importlib.util.find_spec("whisper") is not None
+    
+    def recognize(self, audio):
+        # The recognizer keeps the loaded model between calls
+        text = self.recognizer.recognize_whisper(audio, model=self.model, language="english")
+        if not text or not text.strip():
+            raise sr.UnknownValueError()
+        return text.strip()
+
+
+class VoskBackend(RecognizerBackend):
+    """Local Vosk model via speech_recognition (offline, needs vosk and a model folder)."""
+    
+    name = "vosk"
+    
+    def __init__(self, recognizer, model_path=ASR_VOSK_MODEL):
+        self.recognizer = recognizer
+        self.model_path = model_path
+    
+    @property
+    def available(self):
+        return importlib.util.find_spec("vosk") is not None and os.path.isdir(self.model_path)
+    
+    def recognize(self, audio):
+        if getattr(self.recognizer, "vosk_model", None) is None:
+            from vosk import Model
+            self.recognizer.vosk_model = Model(self.model_path)
+        text = json.loads(self.recognizer.recognize_vosk(audio)).get("text", "")
+        if not text.strip():
+            raise sr.UnknownValueError()
+        return text.strip()
+
+
+class ReplayBackend(RecognizerBackend):
+    """
+    Returns prepared transcripts in order, one per utterance - pairs with
+    WavFileSource for tests. A blank transcript means "not understood".
+    """
+    
+    name = "replay"
+    
+    def __init__(self, transcripts):
         """
-        Instant non-blocking speak.
-        Returns immediately, audio plays in background.
+        Args:
+            transcripts: List of strings, or a text file with one per line
         """
-        # Fire and forget - don't wait
-        self._executor.submit(self._speak_sync, text)
+        if isinstance(transcripts, str):
+            with open(transcripts, encoding="utf-8") as f:
+                transcripts = [line.rstrip("\n") for line in f]
+        self._pending = deque(transcripts)
+        self._lock = threading.Lock()
     
-    def speak_wait(self, text):
-        """Blocking speak - waits for completion."""
-        self._speak_sync(text)
+    def recognize(self, audio):
+        with self._lock:
+            text = self._pending.popleft() if self._pending else ""
+        if not text.strip():
+            raise sr.UnknownValueError()
+        return text.strip()
+
+
+class RecognizerChain:
+    """
+    Tries backends in order and records each one's latency. A backend that
+    is unavailable or raises RequestError falls through to the next; an
+    unintelligible result (UnknownValueError) is final.
+    """
     
-    def is_short(self, text):
-        """Check if text should use instant TTS."""
-        if not text:
-            return False
-        words = text.lower().split()
-        # Short = under 10 words OR contains common short response
-        return len(words) <= 10 or any(w in self.SHORT_RESPONSES for w in words)
+    def __init__(self, backends):
+        self.backends = list(backends)
+    
+    @classmethod
+    def from_config(cls, recognizer, names=None, replay_file=ASR_REPLAY_FILE):
+        """Build the chain from backend names (default: ASR_BACKENDS)."""
+        backends = []
+        for name in names or ASR_BACKENDS:
+            if name == "google":
+                backends.append(GoogleBackend(recognizer))
+            elif name == "whisper":
+                backends.append(WhisperBackend(recognizer))
+            elif name == "vosk":
+                backends.append(VoskBackend(recognizer))
+            elif name == "replay":
+                if replay_file:
+                    backends.append(ReplayBackend(replay_file))
+                else:
+                    print("[ASR] replay backend needs ASR_REPLAY_FILE - skipped")
+            else:
+                print(f"[ASR] Unknown backend '{name}' - skipped")
+        return cls(backends)
+    
+    @property
+    def names(self):
+        return [b.name for b in self.backends if b.available]
+    
+    def recognize(self, audio):
+        """(text, backend name). Raises UnknownValueError, or RequestError if every backend failed."""
+        errors = []
+        for backend in self.backends:
+            if not backend.available:
+                continue
+            start = time.perf_counter()
+            try:
+                text = backend.recognize(audio)
+            except sr.UnknownValueError:
+                ASR_LATENCY.record(backend.name, time.perf_counter() - start)
+                raise
+            except Exception as e:
+                ASR_LATENCY.record(f"{backend.name}.error", time.perf_counter() - start)
+                errors.append(f"{backend.name}: {e}")
+                continue
+            ASR_LATENCY.record(backend.name, time.perf_counter() - start)
+            return text, backend.name
+        raise sr.RequestError("; ".join(errors) or "no speech recognition backend available")
+
+
+# ============================================================
+# COMMAND PIPELINE
+# ============================================================
 
+# Commands waiting between two stages; when a stage falls behind, its
+# oldest waiting command is dropped rather than executed late
+PIPELINE_QUEUE_SIZE = max(1, int(os.getenv("PIPELINE_QUEUE_SIZE", "2")))
 
-# Global instant TTS engine
-_instant_tts = None
 
-def get_instant_tts():
-    """Get or create the global instant TTS engine."""
-    global _instant_tts
-    if _instant_tts is None:
-        _instant_tts = InstantTTS(rate=1)  # Slower for clarity (was 4)
-    return _instant_tts
+@dataclass(frozen=True)
+class VoiceCommand:
+    """One command as it moves through the pipeline stages"""
+    trace_id: int
+    started: float               # perf_counter when the utterance ended (or text arrived)
+    source: str = "voice"        # "voice" or "text" (GUI quick actions)
+    audio: Any = None            # sr.AudioData until recognized
+    text: str = ""
+    plan: Optional[Any] = None   # List of steps, or an iterator for streamed plans
+    priority: Priority = Priority.NORMAL
 
 
 class NovaBotEngine:
@@ -117,7 +239,8 @@ class NovaBotEngine:
     Designed to run in a background thread with status callbacks.
     """
     
-    def __init__(self, status_callback=None, log_callback=None, audio_level_callback=None):
+    def __init__(self, status_callback=None, log_callback=None, audio_level_callback=None,
+                 audio_source=None, asr_backends=None, speech_rules=None):
         """
         Initialize the bot engine.
         
@@ -125,6 +248,10 @@ class NovaBotEngine:
             status_callback: Function to call when status changes (e.g., "Listening", "Processing")
             log_callback: Function to call for log messages
             audio_level_callback: Function to call with audio level (0.0 to 1.0) for visual feedback
+            audio_source: Audio input (default: the microphone; e.g. a WavFileSource for tests)
+            asr_backends: Backend names or RecognizerBackend objects, in fallback
+                order (default: ASR_BACKENDS)
+            speech_rules: What of a reply is spoken (default: SpeechRules() from env)
         """
         self.status_callback = status_callback or (lambda s: None)
         self.log_callback = log_callback or (lambda m: print(m))
@@ -134,6 +261,21 @@ class NovaBotEngine:
         self._thread = None
         self._loop = None
         
+        # Persistent capture stream - opened once when the loop starts
+        self.audio_source = audio_source
+        self.capture = None
+        self._utterance = None    # Preallocated per-turn audio buffer
+        
+        # Pipeline queues (created when the loop starts)
+        self._recognize_queue = None
+        self._plan_queue = None
+        self._execute_queue = None
+        self._in_flight = 0       # Commands between capture and the end of execution
+        self._active_token = None # CancelToken of the executing command
+        self._cancel_before = 0   # Traces older than the last STOP are dropped
+        self.steps = StepExecutor()  # OS actions run on its worker thread
+        self.speech_rules = speech_rules or SpeechRules()
+        
         # Audio setup
         self._init_audio()
         
@@ -142,6 +284,11 @@ class NovaBotEngine:
         self.recognizer.pause_threshold = 1.0  # Faster response
         self.recognizer.energy_threshold = 300
         self.recognizer.dynamic_energy_threshold = True
+        if asr_backends and not isinstance(asr_backends[0], str):
+            self.asr = RecognizerChain(asr_backends)
+        else:
+            self.asr = RecognizerChain.from_config(self.recognizer, asr_backends)
+        self.log(f"Speech recognition: {' -> '.join(self.asr.names) or 'no backend available'}")
         
         self.log("NovaBotEngine initialized - LIGHTNING MODE")
     
@@ -169,29 +316,29 @@ class NovaBotEngine:
     async def speak(self, text, is_content=False):
         """
         UNIFIED TTS - Single voice (Windows SAPI).
+        Spoken sentence by sentence, so long answers start as fast as short ones.
         
         Args:
             text: Text to speak
-            is_content: If True, this is document content - DON'T speak it
+            is_content: If True, this is document content - only spoken if
+                speech_rules allow it
+        
+        Returns the queued SpeechHandle (None if nothing is spoken).
         """
         if not text:
             return
         
         self.log(f"FOX-3: {text}")
         
-        # NEVER speak document content (essays, etc.) - too long
-        if is_content:
+        # Document content and over-long replies per speech_rules
+        text = self.speech_rules.apply(text, is_content)
+        if text is None:
             return
         
-        # Limit what we speak - max 50 words
-        words = text.split()
-        if len(words) > 50:
-            # Truncate and add summary
-            text = ' '.join(words[:15]) + '... Response logged.'
-        
         # Single voice: Windows SAPI only
-        self.instant_tts.speak(text)
+        handle = self.instant_tts.speak(text)
         await asyncio.sleep(0.05)
+        return handle
     
     def speak_instant(self, text):
         """
@@ -201,25 +348,34 @@ class NovaBotEngine:
         if text:
             self.instant_tts.speak(text)
     
-    async def _listen_with_level_monitoring(self, source, timeout=10):
+    async def _listen_with_level_monitoring(self, capture, timeout=10):
         """
         Listen for audio while monitoring and reporting audio levels.
         This makes the orb respond dynamically to voice input.
-        """
-        import time
-        
-        frames = []
-        sample_width = source.SAMPLE_WIDTH
-        sample_rate = source.SAMPLE_RATE
-        chunk_size = source.CHUNK
         
-        # Calculate thresholds
-        energy_threshold = self.recognizer.energy_threshold
-        pause_threshold = self.recognizer.pause_threshold
+        Awaits chunks (already classified by the VAD) from the persistent
+        capture stream, so the loop never blocks on the device. The utterance
+        ends after the Endpointer's adaptive hangover (VAD_MIN_HANGOVER to
+        VAD_MAX_HANGOVER seconds of silence) or when the buffer is full.
+        """
+        tracer = get_tracer()
+        capture_start = time.perf_counter()
+        speech_at = None
+        pause_at = None
+        
+        # One preallocated buffer, reused every turn
+        if self._utterance is None:
+            self._utterance = PcmBuffer.for_stream(capture)
+        utterance = self._utterance
+        utterance.clear()
+        chunks = 0
+        sample_width = capture.sample_width
+        sample_rate = capture.sample_rate
+        
+        # Adaptive hangover instead of the fixed pause_threshold
+        endpointer = Endpointer(capture.chunk_seconds)
         
         start_time = time.time()
-        speech_started = False
-        pause_start = None
         
         # Normalization factor for level (typical max RMS)
         max_rms = 8000  # Typical max for speech
@@ -228,27 +384,25 @@ class NovaBotEngine:
             elapsed = time.time() - start_time
             
             # Timeout check
-            if not speech_started and elapsed > timeout:
+            if not endpointer.speech_started and elapsed > timeout:
                 return None
             
-            # Read audio chunk
-            try:
-                buffer = source.stream.read(chunk_size)
-                if len(buffer) == 0:
-                    break
-            except Exception:
+            # Await audio chunk (features computed by the capture thread)
+            item = await capture.read(timeout=1.0)
+            if item is None:
+                # Source ended or stalled - nothing to recognize without speech
+                if not endpointer.speech_started:
+                    return None
                 break
+            buffer, vad_frame = item
             
-            frames.append(buffer)
-            
-            # Calculate RMS (volume level)
-            try:
-                rms = audioop.rms(buffer, sample_width)
-            except:
-                rms = 0
+            if not utterance.append(buffer):
+                # Longest utterance reached
+                break
+            chunks += 1
             
             # Normalize to 0.0-1.0 range
-            level = min(1.0, rms / max_rms)
+            level = min(1.0, vad_frame.rms / max_rms)
             
             # Boost the level for visual effect (square root for better perception)
             visual_level = min(1.0, (level ** 0.5) * 1.5)
@@ -257,142 +411,323 @@ class NovaBotEngine:
             self.audio_level_callback(visual_level)
             
             # Check if speech is happening
-            is_speech = rms > energy_threshold
-            
-            if is_speech:
-                speech_started = True
-                pause_start = None
-            elif speech_started:
-                # In pause
-                if pause_start is None:
-                    pause_start = time.time()
-                elif time.time() - pause_start > pause_threshold:
-                    # Pause threshold exceeded, done listening
-                    break
+            ended = endpointer.feed(vad_frame)
+            if vad_frame.is_speech:
+                if speech_at is None and endpointer.speech_started:
+                    speech_at = time.perf_counter()
+                pause_at = None
+            elif endpointer.speech_started and pause_at is None:
+                pause_at = time.perf_counter()
             
-            # Small async yield to keep GUI responsive
-            await asyncio.sleep(0.01)
+            if ended:
+                # Hangover exceeded, done listening
+                break
         
-        # Build AudioData from frames
-        frame_data = b''.join(frames)
-        return sr.AudioData(frame_data, sample_rate, sample_width)
+        # Capture = waiting for speech + speech; endpointing = trailing pause
+        capture_end = time.perf_counter()
+        if speech_at is not None:
+            tracer.record("capture.wait", capture_start, speech_at)
+        if pause_at is not None:
+            tracer.record("endpointing", pause_at, capture_end,
+                          hangover=round(endpointer.hangover(), 3))
+        tracer.record("capture", capture_start, pause_at or capture_end, chunks=chunks,
+                      noise_floor=round(capture.noise_floor or 0.0, 1))
+        
+        return sr.AudioData(utterance.getvalue(), sample_rate, sample_width)
+    
+    def _plan_steps(self, user_text):
+        """
+        Plan steps for a command. With STREAM_LLM_PLAN this is a generator
+        that yields LLM steps as they arrive; otherwise the full plan list.
+        """
+        if nova_brain.STREAM_LLM_PLAN:
+            return nova_brain.iter_operator_plan(user_text)
+        return nova_brain.get_operator_plan(user_text).get("plan", [])
     
     async def _listen_and_execute(self):
-        """Main listening and execution loop - LIGHTNING FAST."""
+        """
+        Main loop - LIGHTNING FAST. Capture, recognition, planning and
+        execution run as concurrent stages joined by bounded queues, so the
+        bot keeps listening while the previous command plans and executes.
+        """
         self.log("\n" + "="*50)
         self.log("AUTO-BOT v2.0 - LIGHTNING MODE")
         self.log("="*50)
         
-        while self._running:
-            try:
-                # LISTENING MODE
-                self.set_status("Listening...")
-                
-                with sr.Microphone() as source:
-                    self.log("LISTENING... (Speak your command)")
-                    self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
+        self._recognize_queue = CommandQueue(PIPELINE_QUEUE_SIZE)
+        self._plan_queue = CommandQueue(PIPELINE_QUEUE_SIZE)
+        self._execute_queue = CommandQueue(PIPELINE_QUEUE_SIZE)
+        self._in_flight = 0
+        
+        try:
+            self.capture = CaptureStream(self.audio_source or MicrophoneSource()).start()
+        except Exception as e:
+            self.log(f"[ERROR] Audio input unavailable: {e}")
+            self.set_status("Error")
+            return
+        
+        workers = [asyncio.create_task(stage()) for stage in
+                   (self._recognition_stage, self._planning_stage, self._execution_stage)]
+        try:
+            await self._capture_stage()
+            # Input is over (stopped or source ended) - let queued commands finish
+            for queue in (self._recognize_queue, self._plan_queue, self._execute_queue):
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.capture.stop()
+            self.capture = None
+        
+        self.set_status("Stopped")
+        self.log("Bot stopped.")
+    
+    async def _capture_stage(self):
+        """Cut the microphone stream into utterances; never waits on later stages."""
+        tracer = get_tracer()
+        self.capture.listen()
+        try:
+            while self._running:
+                try:
+                    # One trace per voice command
+                    trace_id = tracer.start_trace()
+                    
+                    # LISTENING MODE - the stream is already open and calibrated
+                    if not self._in_flight:
+                        self.set_status("Listening...")
+                        self.log("LISTENING... (Speak your command)")
+                    
+                    # Listen with audio level monitoring
+                    audio = await self._listen_with_level_monitoring(self.capture, timeout=10)
                     
-                    try:
-                        # Listen with audio level monitoring
-                        audio = await self._listen_with_level_monitoring(source, timeout=10)
-                        
-                        if audio is None:
+                    if audio is None:
+                        if self.capture.ended:
+                            self.log("Audio input ended.")
+                            break
+                        if not self._in_flight:
                             self.log("Timeout. Waiting...")
-                            continue
-                        
-                        self.audio_level_callback(0.0)  # Reset level
-                        self.log("PROCESSING...")
-                        self.set_status("Processing...")
-                    except sr.WaitTimeoutError:
-                        self.audio_level_callback(0.0)
-                        self.log("Timeout. Waiting...")
                         continue
-                
-                # Check if still running before processing
+                    
+                    self.audio_level_callback(0.0)  # Reset level
+                    self._in_flight += 1
+                    self._offer(self._recognize_queue,
+                                VoiceCommand(trace_id, time.perf_counter(), audio=audio))
+                except Exception as e:
+                    self.log(f"[ERROR] {e}")
+                    self.set_status("Error")
+                    await asyncio.sleep(1)
+        finally:
+            self.capture.stop_listening()
+    
+    async def _recognition_stage(self):
+        """Speech to text, off the event loop."""
+        tracer = get_tracer()
+        while True:
+            command = await self._recognize_queue.get()
+            try:
                 if not self._running:
-                    break
+                    self._finish(command)
+                    continue
+                tracer.resume_trace(command.trace_id)
+                self.log("PROCESSING...")
+                self.set_status("Processing...")
                 
-                # RECOGNITION
+                # RECOGNITION - online backends wait on the network
+                start = time.perf_counter()
                 try:
-                    user_text = self.recognizer.recognize_google(audio)
-                    self.log(f"Heard: \"{user_text}\"")
+                    user_text, backend = await self._in_thread(self.asr.recognize, command.audio)
+                    tracer.record("asr", start, backend=backend)
+                    self.log(f"Heard: \"{user_text}\" ({backend})")
                 except sr.UnknownValueError:
                     self.log("Could not understand audio.")
+                    self._finish(command)
                     continue
                 except sr.RequestError as e:
-                    self.log(f"Network error: {e}")
+                    self.log(f"Recognition failed: {e}")
+                    self._finish(command)
                     continue
                 
-                # PLANNING (via LLM)
-                self.set_status("Planning...")
-                plan_data = nova_brain.get_operator_plan(user_text)
-                plan = plan_data.get("plan", [])
-                
-                # EXECUTION LOOP - Speak FIRST, then execute
-                self.set_status("Executing...")
-                for step in plan:
-                    if not self._running:
-                        break
-                    
-                    action = step.get("action")
-                    payload = step.get("payload")
-                    
-                    # INSTANT verbal responses - speak immediately
-                    if action == "RESPONSE":
-                        await self.speak(payload)
-                        continue  # Don't execute, just speak
-                    
-                    if action == "CHAT":
-                        await self.speak(payload)
-                        continue  # Don't execute, just speak
-                    
-                    # For all other actions, execute them
-                    result = nova_os.execute_step(step)
-                    
-                    # Log the result
-                    if result:
-                        self.log(f"[OK] {result}")
-                        # Speak completion for long tasks
-                        if action == "WRITE_ESSAY" and "successfully" in result.lower():
-                            await self.speak("Essay complete. Check Word.")
-                        elif "ERROR" in result:
-                            await self.speak("Something went wrong. Check the log.")
+                command = self._prioritize(replace(command, audio=None, text=user_text))
+                self._offer(self._plan_queue, command)
+            except Exception as e:
+                self.log(f"[ERROR] {e}")
+                self._finish(command)
+            finally:
+                self._recognize_queue.task_done()
+    
+    async def _planning_stage(self):
+        """Text to plan (LLM calls run off the loop), while the previous plan executes."""
+        tracer = get_tracer()
+        while True:
+            command = await self._plan_queue.get()
+            try:
+                if self._is_stale(command):
+                    self._finish(command)
+                    continue
+                tracer.resume_trace(command.trace_id)
                 
-                self.log("\n[READY] Awaiting next command.\n")
-                self.set_status("Ready")
+                # PLANNING (via LLM) - streamed plans start executing at step 1
+                self.set_status("Planning...")
+                plan = await self._in_thread(self._plan_steps, command.text)
+                if not isinstance(plan, list):
+                    # Wait for the first streamed step here; the rest arrive during execution
+                    first = await self._in_thread(next, plan, None)
+                    plan = itertools.chain([] if first is None else [first], plan)
                 
+                self._offer(self._execute_queue, replace(command, plan=plan))
+            except Exception as e:
+                self.log(f"[ERROR] {e}")
+                self._finish(command)
+            finally:
+                self._plan_queue.task_done()
+    
+    async def _execution_stage(self):
+        """Run plans one at a time, in order."""
+        tracer = get_tracer()
+        while True:
+            command = await self._execute_queue.get()
+            try:
+                if not self._is_stale(command):
+                    tracer.resume_trace(command.trace_id)
+                    self.set_status("Executing...")
+                    # Cancelled by a STOP heard while this command runs
+                    self._active_token = CancelToken()
+                    with cancel_scope(self._active_token):
+                        await self._execute_plan(command.plan)
+                    tracer.record("command", command.started, source=command.source)
+                    self.log("\n[READY] Awaiting next command.\n")
+                    self.set_status("Ready")
             except Exception as e:
                 self.log(f"[ERROR] {e}")
                 self.set_status("Error")
-                await asyncio.sleep(1)
+            finally:
+                self._active_token = None
+                self._finish(command)
+                self._execute_queue.task_done()
+    
+    async def _execute_plan(self, plan):
+        """
+        EXECUTION - Speech and OS actions as concurrent tracks.
+        Spoken steps are heard while the actions they announce run (see
+        app/plan_executor.py). Actions run on the step executor's worker
+        thread so the loop (and a STOP) stays live; a cancelled or timed-out
+        macro stops at its next cancel point (NovaOS primitive or wait).
+        """
+        token = current_token()
+        executor = PlanExecutor(self._speak_step, self._act_step)
+        try:
+            await executor.run(self._plan_steps_async(plan))
+        except CommandCancelled:
+            # Time-to-abort: STOP heard -> macro actually stopped
+            step = executor.running[OS] or executor.running[SPEECH]
+            action = step.get("action") if step else None
+            get_tracer().record("abort", token.cancelled_at, action=action, reason=token.reason)
+            self.log(f"[STOP] Aborted {action or 'plan'} "
+                     f"{(time.perf_counter() - token.cancelled_at) * 1000:.0f} ms after {token.reason}")
+    
+    async def _plan_steps_async(self, plan):
+        """Steps of a plan list, or of a streamed plan as the LLM produces them."""
+        if isinstance(plan, list):
+            for step in plan:
+                yield step
+            return
+        while self._running:
+            step = await self._in_thread(next, plan, None)
+            if step is None:
+                return
+            yield step
+    
+    async def _speak_step(self, step):
+        """Speech track: say a RESPONSE/CHAT payload; done once it is heard."""
+        token = current_token()
+        if token is not None:
+            token.check()
+        handle = await self.speak(step.get("payload"))
+        if handle is not None:
+            # Waiting for the voice keeps a plan's own replies in order
+            # (and out of the TTS queue's latest-wins dropping)
+            await self._in_thread(handle.wait_started)
+    
+    async def _act_step(self, step):
+        """OS track: run one action. Returns False when the rest of the plan should be skipped."""
+        token = current_token()
+        if token is not None:
+            token.check()
+        if not self._running:
+            return False
+        action = step.get("action")
+        start = time.perf_counter()
+        outcome = await self.steps.run(step)
+        get_tracer().record("step", start, action=action, status=outcome.status)
+        
+        if outcome.status == CANCELLED:
+            raise CommandCancelled(outcome.error)
+        if outcome.status == TIMEOUT:
+            # Unknown screen state - don't run the rest of the plan on top of it
+            self.log(f"[TIMEOUT] {action} {outcome.error}")
+            await self.speak("That took too long, so I stopped it.")
+            return False
         
-        self.set_status("Stopped")
-        self.log("Bot stopped.")
+        # Log the result
+        result = outcome.result
+        if result:
+            self.log(f"[OK] {result}" if outcome.ok else f"[ERROR] {result}")
+            # Speak completion for long tasks
+            if action == "WRITE_ESSAY" and "successfully" in result.lower():
+                await self.speak("Essay complete. Check Word.")
+            elif "ERROR" in result:
+                await self.speak("Something went wrong. Check the log.")
+        elif not outcome.ok:
+            self.log(f"[ERROR] {action}: {outcome.error}")
+        return True
+    
+    def _offer(self, queue, command):
+        """Hand a command to the next stage without waiting; a full queue drops its oldest command."""
+        stale = queue.offer(command, command.priority)
+        if stale is not None:
+            self.log(f"[QUEUE] Dropped stale command: \"{stale.text or 'unrecognized audio'}\"")
+            self._finish(stale)
+    
+    def _prioritize(self, command):
+        """STOP-class commands jump the queues and abort what came before them."""
+        intent, _ = IntentClassifier.classify(command.text)
+        if intent != Intent.STOP_COMMAND:
+            return command
+        self._cancel_before = command.trace_id
+        if self._active_token is not None:
+            self._active_token.cancel("stop")
+        self.instant_tts.interrupt()
+        for queue in (self._plan_queue, self._execute_queue):
+            for stale in queue.discard(self._is_stale):
+                self.log(f"[STOP] Dropped queued command: \"{stale.text}\"")
+                self._finish(stale)
+        return replace(command, priority=Priority.STOP)
+    
+    def _is_stale(self, command):
+        """Bot stopping, or the command was spoken before the last STOP."""
+        return not self._running or command.trace_id < self._cancel_before
+    
+    def _finish(self, command):
+        """A command left the pipeline (executed, failed or dropped)."""
+        self._in_flight = max(0, self._in_flight - 1)
+    
+    async def _in_thread(self, fn, *args):
+        """Run a blocking call in the default executor, keeping the trace context."""
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(context.run, fn, *args))
     
     async def _execute_text_command(self, user_text):
-        """Execute a text command directly (for quick actions)."""
+        """Queue a text command (quick actions) straight for planning."""
         self.log(f"Command: \"{user_text}\"")
-        
-        # PLANNING (via LLM)
-        self.set_status("Planning...")
-        plan_data = nova_brain.get_operator_plan(user_text)
-        plan = plan_data.get("plan", [])
-        
-        # EXECUTION LOOP
-        self.set_status("Executing...")
-        for step in plan:
-            result = nova_os.execute_step(step)
-            
-            # If the step was a verbal response or chat, speak it
-            if step.get("action") == "RESPONSE":
-                await self.speak(step.get("payload"))
-            elif step.get("action") == "CHAT":
-                await self.speak(step.get("payload"))
-            elif result:
-                self.log(f"[OK] {result}")
-        
-        self.log("Command completed.")
-        self.set_status("Listening...")
+        if self._plan_queue is None:
+            self.log("[WARN] Bot pipeline not ready.")
+            return
+        trace_id = get_tracer().start_trace()
+        self._in_flight += 1
+        command = VoiceCommand(trace_id, time.perf_counter(), source="text", text=user_text)
+        self._offer(self._plan_queue, self._prioritize(command))
     
     def execute_command(self, command_text):
         """
@@ -432,6 +767,7 @@ class NovaBotEngine:
             return
         
         self._running = True
+        warm_up_groq_client()  # Open the Groq connection before the first command
         self._thread = threading.Thread(target=self._run_async_loop, daemon=True)
         self._thread.start()
         self.log("[LAUNCH] Bot started!")
@@ -445,6 +781,22 @@ class NovaBotEngine:
         
         self.log("[STOP] Stopping bot...")
         self._running = False
+        token = self._active_token
+        if token is not None:
+            token.cancel("shutdown")
+        self.log(nova_brain.plan_latency_report())
+        self.log(f"[LATENCY] Groq requests\n{GROQ_LATENCY.report()}")
+        self.log(f"[LATENCY] Speech recognition\n{ASR_LATENCY.report()}")
+        self.log(f"[LATENCY] Speech output\n{TTS_LATENCY.report()}")
+        self.log(f"[TRACE] Voice command spans\n{get_tracer().summary()}")
+        if TRACE_EXPORT:
+            try:
+                count = get_tracer().export(TRACE_EXPORT)
+                self.log(f"[TRACE] {count} spans appended to {TRACE_EXPORT}")
+            except OSError as e:
+                self.log(f"[TRACE] Export failed: {e}")
+        
+        self.instant_tts.interrupt()
         
         # Clean up pygame
         try:
@@ -466,13 +818,22 @@ class NovaBotEngine:
 async def speak(text):
     """
     LIGHTNING-FAST TTS (legacy function).
-    Uses Windows SAPI for instant response.
+    Cached Edge-TTS audio when the phrase was said (or pre-rendered)
+    before, otherwise Windows SAPI for instant response.
     """
     if not text:
         return
     
     print(f"FOX-3: {text}")
     
+    cache = get_speech_cache()
+    
+    # Canned replies = cached neural voice, no synthesis
+    audio_file = cache.get(text)
+    if audio_file is not None:
+        await _play_file(audio_file)
+        return
+    
     tts = get_instant_tts()
     
     # Short responses = instant SAPI
@@ -481,32 +842,26 @@ async def speak(text):
         await asyncio.sleep(0.05)
         return
     
-    # Longer responses = Edge-TTS
+    # Longer responses = Edge-TTS, played as it streams in
+    # (and kept in the cache for next time)
     try:
-        audio_file = get_runtime_audio_file("response.mp3")
-        
-        comm = edge_tts.Communicate(text, "en-GB-RyanNeural", rate="+10%")
-        
-        with open(audio_file, "wb") as f:
-            async for chunk in comm.stream():
-                if chunk["type"] == "audio":
-                    f.write(chunk["data"])
-        
-        if not os.path.exists(audio_file) or os.path.getsize(audio_file) == 0:
-            return
-        
-        pygame.mixer.music.load(audio_file)
-        pygame.mixer.music.play()
-        
-        while pygame.mixer.music.get_busy():
-            await asyncio.sleep(0.03)
-        
-        pygame.mixer.music.unload()
-        
+        result = await StreamPlayer().play(edge_audio(text, EDGE_VOICE, EDGE_RATE))
+        cache.put(text, result.audio, EDGE_VOICE, EDGE_RATE)
     except Exception as e:
         print(f"TTS Error: {e}")
 
 
+async def _play_file(audio_file):
+    """Play an audio file through the pygame mixer until it ends."""
+    pygame.mixer.music.load(audio_file)
+    pygame.mixer.music.play()
+    
+    while pygame.mixer.music.get_busy():
+        await asyncio.sleep(0.03)
+    
+    pygame.mixer.music.unload()
+
+
 async def main():
     """Legacy main function for command-line usage."""
     # Initialize audio with low latency
@@ -516,6 +871,9 @@ async def main():
     tts = get_instant_tts()
     print("Instant TTS ready!")
     
+    # Canned replies synthesized while the user gets ready
+    get_speech_cache().prerender_in_background(static_phrases())
+    
     recognizer = sr.Recognizer()
     recognizer.pause_threshold = 1.2
     recognizer.energy_threshold = 300
@@ -0,0 +1,289 @@
+"""
+Nearest Intent - Local TF-IDF Nearest-Neighbour Tier
+Char n-gram TF-IDF index over known command phrasings (SYSTEM_PROMPT
+examples, Windows shortcut phrases, and the user's own corpus). Paraphrases
+of a known command ("bring up the task manager", "lock up my computer")
+get its plan locally instead of a Groq round-trip. Negated requests, and
+matches whose words disagree with the request ("unlock" vs. "lock", "save
+everything" vs. "hide everything"), are left to the LLM.
+
+NumPy is optional - without it the same scores come from an inverted index.
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Actions whose payload does not depend on the wording of the request.
+# Examples with other actions (open X, play Y, essay on Z) would hand a
+# near-but-different request the wrong target, so they are left to the LLM.
+FIXED_PAYLOAD_ACTIONS = {"SCREENSHOT", "WINDOWS_SHORTCUT", "MINIMIZE_ALL"}
+SPEECH_ACTIONS = {"CHAT", "RESPONSE"}
+
+
+# Politeness and filler words carry no intent ("can you please lock my pc")
+FILLER_WORDS = {
+    "please", "kindly", "can", "could", "would", "you", "just", "now",
+    "the", "a", "an", "my", "me", "for", "up", "hey", "jarvis", "sentinel",
+}
+
+# A negated request ("don't take a screenshot") is never answered locally
+NEGATION_WORDS = {
+    "not", "no", "never", "dont", "don't", "cannot", "can't", "cant",
+    "won't", "wont", "doesn't", "doesnt",
+}
+
+# "unlock" / "reopen" / "disconnect" are a different command than the word
+# they are built on, however many trigrams they share
+OPPOSING_PREFIXES = ("un", "re", "dis")
+
+
+def normalize_phrase(text: str) -> str:
+    """Lowercase, letters/digits only, filler words dropped, single spaces."""
+    words = re.sub(r'[^a-z0-9\s]', ' ', text.lower()).split()
+    return ' '.join(w for w in words if w not in FILLER_WORDS)
+
+
+def is_negated(text: str) -> bool:
+    """True when the request contains a negation ("don't", "never", "not"...)."""
+    return any(w in NEGATION_WORDS for w in re.findall(r"[a-z']+", text.lower()))
+
+
+def char_ngrams(text: str, n: int = 3) -> Counter:
+    """Character n-gram counts of the normalized, space-padded text."""
+    padded = f" {normalize_phrase(text)} "
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+@dataclass(frozen=True)
+class NearestMatch:
+    """Closest known phrasing for a query"""
+    text: str          # Known phrasing that matched
+    plan: tuple        # Its plan steps
+    score: float       # Cosine similarity (0-1)
+    source: str        # "prompt", "shortcuts" or "user"
+
+
+class NearestIntentIndex:
+    """
+    TF-IDF (smoothed idf, l2-normalized) over char n-grams.
+    Add phrasings with add(), then query(); the index builds lazily.
+    """
+
+    def __init__(self, threshold: float = 0.8, ngram: int = 3):
+        self.threshold = threshold
+        self.ngram = ngram
+        self.lookups = 0
+        self.answered = 0
+
+        self._texts: List[str] = []
+        self._words: List[set] = []
+        self._plans: List[tuple] = []
+        self._sources: List[str] = []
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._built = False
+
+        self._vocab: Dict[str, int] = {}
+        self._idf: List[float] = []
+        self._unknown_idf = 1.0
+        self._verbs: set = set()   # Leading words of known phrasings
+        self._matrix = None        # NumPy: vocab x docs (float32)
+        self._postings = None      # Fallback: gram id -> [(doc, weight)]
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, text: str, plan: List[dict], source: str = "user"):
+        """Add one phrasing and its plan (first phrasing of a text wins)."""
+        key = normalize_phrase(text)
+        if not key or not plan or key in self._seen:
+            return
+        with self._lock:
+            self._seen.add(key)
+            self._texts.append(text)
+            self._words.append(set(key.split()))
+            self._plans.append(tuple(dict(step) for step in plan))
+            self._sources.append(source)
+            self._built = False
+
+    # ==================== CONSTRUCTION ====================
+
+    def _build(self):
+        docs = [char_ngrams(text, self.ngram) for text in self._texts]
+        df: Counter = Counter()
+        for grams in docs:
+            df.update(grams.keys())
+
+        n_docs = len(docs)
+        self._vocab = {gram: i for i, gram in enumerate(df)}
+        self._idf = [math.log((1 + n_docs) / (1 + df[gram])) + 1 for gram in df]
+        self._unknown_idf = math.log(1 + n_docs) + 1
+        self._verbs = {normalize_phrase(text).split()[0] for text in self._texts}
+
+        weighted = []
+        for grams in docs:
+            vec = {self._vocab[g]: tf * self._idf[self._vocab[g]] for g, tf in grams.items()}
+            norm = math.sqrt(sum(w * w for w in vec.values())) or 1.0
+            weighted.append({i: w / norm for i, w in vec.items()})
+
+        if np is not None:
+            matrix = np.zeros((len(self._vocab), n_docs), dtype=np.float32)
+            for doc, vec in enumerate(weighted):
+                for i, w in vec.items():
+                    matrix[i, doc] = w
+            self._matrix, self._postings = matrix, None
+        else:
+            postings: Dict[int, list] = {}
+            for doc, vec in enumerate(weighted):
+                for i, w in vec.items():
+                    postings.setdefault(i, []).append((doc, w))
+            self._matrix, self._postings = None, postings
+        self._built = True
+
+    def _ensure_built(self):
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self._build()
+
+    # ==================== QUERY ====================
+
+    def query(self, text: str, threshold: Optional[float] = None) -> Optional[NearestMatch]:
+        """
+        Closest known phrasing if its cosine similarity passes the threshold
+        and its words agree with the request (see _agrees).
+        """
+        self._ensure_built()
+        self.lookups += 1
+        if not self._texts or is_negated(text):
+            return None
+
+        grams = char_ngrams(text, self.ngram)
+        ids, weights, norm_sq = [], [], 0.0
+        for gram, tf in grams.items():
+            i = self._vocab.get(gram)
+            w = tf * (self._idf[i] if i is not None else self._unknown_idf)
+            norm_sq += w * w
+            if i is not None:
+                ids.append(i)
+                weights.append(w)
+        if not ids:
+            return None
+        norm = math.sqrt(norm_sq)
+
+        if self._matrix is not None:
+            scores = np.asarray(weights, dtype=np.float32) @ self._matrix[ids]
+            best = int(scores.argmax())
+            score = float(scores[best]) / norm
+        else:
+            totals: Dict[int, float] = {}
+            for i, w in zip(ids, weights):
+                for doc, dw in self._postings[i]:
+                    totals[doc] = totals.get(doc, 0.0) + w * dw
+            best = min(totals, key=lambda d: (-totals[d], d))
+            score = totals[best] / norm
+
+        if score < (self.threshold if threshold is None else threshold):
+            return None
+        if not self._agrees(normalize_phrase(text).split(), self._words[best]):
+            return None
+        self.answered += 1
+        return NearestMatch(self._texts[best], self._plans[best], score, self._sources[best])
+
+    def _agrees(self, words: List[str], example: set) -> bool:
+        """
+        Trigram similarity ignores which word carries the intent. Require a
+        shared word, no conflicting command verb ("save everything" vs.
+        "hide everything"), and no prefixed opposite ("unlock" vs. "lock").
+        """
+        if not example.intersection(words):
+            return False
+        verb = words[0]
+        example_verbs = example & self._verbs
+        if verb in self._verbs and verb not in example and example_verbs.isdisjoint(words):
+            return False
+        for word in words:
+            if word in example:
+                continue
+            for prefix in OPPOSING_PREFIXES:
+                if word.startswith(prefix) and word[len(prefix):] in example:
+                    return False
+        return True
+
+
+# =============================================================================
+# CORPUS BUILDERS
+# =============================================================================
+
+def prompt_examples(system_prompt: str):
+    """(text, plan) pairs from the 'User: "..."' examples of a system prompt."""
+    pattern = re.compile(r'^User: "([^"]+)"\s*\n(\{.*\})\s*$', re.MULTILINE)
+    for match in pattern.finditer(system_prompt):
+        try:
+            plan = json.loads(match.group(2)).get("plan", [])
+        except ValueError:
+            continue
+        actions = {step.get("action") for step in plan}
+        if actions - SPEECH_ACTIONS and actions <= FIXED_PAYLOAD_ACTIONS | SPEECH_ACTIONS:
+            yield match.group(1), plan
+
+
+def shortcut_examples(intent_patterns: Dict[str, List[str]]):
+    """
+    (phrase, plan) pairs for every shortcut phrase. The payload is a phrase
+    that match_intent maps straight back to the same shortcut.
+    """
+    owner: Dict[str, str] = {}
+    for key, phrases in intent_patterns.items():
+        for phrase in phrases:
+            owner.setdefault(phrase.lower(), key)
+
+    for key, phrases in intent_patterns.items():
+        canonical = next((p.lower() for p in phrases if owner[p.lower()] == key), None)
+        if canonical is None:
+            continue
+        plan = [
+            {"action": "WINDOWS_SHORTCUT", "payload": canonical},
+            {"action": "RESPONSE", "payload": "Done."},
+        ]
+        for phrase in phrases:
+            if owner[phrase.lower()] == key:
+                yield phrase, plan
+
+
+def user_examples(path: str):
+    """(text, plan) pairs from a JSON list of {"text": ..., "plan": [...]}."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return
+    for entry in entries if isinstance(entries, list) else []:
+        if isinstance(entry, dict) and entry.get("text") and entry.get("plan"):
+            yield entry["text"], entry["plan"]
+
+
+def build_nearest_intent_index(system_prompt: str, intent_patterns: Dict[str, List[str]],
+                               user_corpus_path: Optional[str] = None,
+                               threshold: float = 0.8) -> NearestIntentIndex:
+    """Index the user corpus first (it wins duplicates), then prompt and shortcuts."""
+    index = NearestIntentIndex(threshold=threshold)
+    if user_corpus_path:
+        for text, plan in user_examples(user_corpus_path):
+            index.add(text, plan, "user")
+    for text, plan in prompt_examples(system_prompt):
+        index.add(text, plan, "prompt")
+    for text, plan in shortcut_examples(intent_patterns):
+        index.add(text, plan, "shortcuts")
+    return index
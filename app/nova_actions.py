@@ -14,6 +14,7 @@ import pygetwindow as gw
 
 # Import path utilities from package
 from app import get_runtime_audio_file
+from app.shortcut_index import ShortcutIndex
 
 
 # =============================================================================
@@ -267,10 +268,10 @@ INTENT_PATTERNS = {
         "switch desktop", "change desktop", "next desktop", "other desktop"
     ],
     "zoom_in": [
-        "zoom in", "make bigger", "enlarge", "increase size"
+        "zoom in", "make bigger", "enlarge", "increase size", "make text bigger"
     ],
     "zoom_out": [
-        "zoom out", "make smaller", "reduce", "decrease size"
+        "zoom out", "make smaller", "reduce", "decrease size", "make text smaller"
     ],
     "zoom_reset": [
         "reset zoom", "normal zoom", "100%", "actual size"
@@ -302,10 +303,15 @@ def normalize_intent(text):
     return text
 
 
+# Precomputed inverted index over INTENT_PATTERNS
+_SHORTCUT_INDEX = ShortcutIndex(INTENT_PATTERNS)
+
+
 def match_intent(text):
     """
     Match user text to a shortcut intent using keyword matching.
     Uses priority scoring: exact match > contains > partial match.
+    Only patterns sharing a word with the text (or contained in it) are scored.
     
     Args:
         text: Normalized user speech text
@@ -315,36 +321,7 @@ def match_intent(text):
     """
     text = normalize_intent(text)
     
-    best_match = None
-    best_score = 0
-    
-    for shortcut_key, patterns in INTENT_PATTERNS.items():
-        for pattern in patterns:
-            pattern_lower = pattern.lower()
-            
-            # EXACT MATCH - Highest priority
-            if text == pattern_lower:
-                return (shortcut_key, 1.0)
-            
-            # CONTAINS - High priority (text contains the pattern)
-            if pattern_lower in text:
-                # Score based on how much of the text the pattern covers
-                score = len(pattern_lower) / len(text) * 0.9
-                if score > best_score:
-                    best_score = score
-                    best_match = shortcut_key
-            
-            # PARTIAL MATCH - Medium priority (pattern words in text)
-            else:
-                pattern_words = set(pattern_lower.split())
-                text_words = set(text.split())
-                common_words = pattern_words & text_words
-                
-                if common_words and len(common_words) >= len(pattern_words) * 0.5:
-                    score = len(common_words) / len(pattern_words) * 0.7
-                    if score > best_score:
-                        best_score = score
-                        best_match = shortcut_key
+    best_match, best_score = _SHORTCUT_INDEX.score(text)
     
     # Only return if confidence is above threshold
     if best_score >= 0.4:
@@ -13,8 +13,10 @@ Integrated with Sentinel Core for safe, accurate execution.
 import json
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
 from dotenv import load_dotenv
-from groq import Groq
 
 # Import Sentinel Core
 from app.sentinel_core import (
@@ -23,6 +25,16 @@ from app.sentinel_core import (
     DOMAIN_MAP, 
     Personality
 )
+from app.keyword_engine import get_keyword_engine
+from app.fuzzy_resolver import get_fuzzy_resolver
+from app.plan_cache import get_plan_cache, normalize_plan_key
+from app.latency import LatencyRecorder
+from app.plan_stream import PlanStreamParser
+from app.groq_client import get_groq_client
+from app.nearest_intent import build_nearest_intent_index
+from app.utterance import Utterance
+from app.tracing import get_tracer
+from app import get_user_data_file
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +43,16 @@ API_KEY = os.getenv("GROQ_API_KEY")
 if not API_KEY:
     raise ValueError("GROQ_API_KEY environment variable not set. See .env.example")
 
+# Speculative mode: start the Groq request while the local tiers run
+SPECULATIVE_LLM = os.getenv("SPECULATIVE_LLM", "0").lower() in ("1", "true", "yes")
+
+# Streaming mode: hand out LLM plan steps as they are generated
+STREAM_LLM_PLAN = os.getenv("STREAM_LLM_PLAN", "0").lower() in ("1", "true", "yes")
+
+# Local nearest-neighbour tier between FastPath and the LLM
+LOCAL_INTENT_TIER = os.getenv("LOCAL_INTENT_TIER", "1").lower() in ("1", "true", "yes")
+LOCAL_INTENT_THRESHOLD = float(os.getenv("LOCAL_INTENT_THRESHOLD", "0.8"))
+
 
 # =============================================================================
 # SYSTEM PROMPT - JARVIS Personality (Witty & Sharp)
@@ -146,13 +168,32 @@ class FastPath:
     # Stop commands
     STOPS = {'stop', 'cancel', 'abort', 'halt', 'nevermind', 'never mind', 'quit'}
     
+    # Keyword tiers (steps 10-13) - matched by the shared keyword automaton
+    SCREENSHOT_KEYWORDS = ['screenshot', 'screen shot', 'capture screen', 'take a picture']
+    MINIMIZE_KEYWORDS = ['minimize all', 'show desktop', 'clear screen', 'go to desktop']
+    LOCK_KEYWORDS = ['lock pc', 'lock computer', 'lock my pc', 'lock screen']
+    STATUS_KEYWORDS = ['status', 'system status', 'cpu', 'battery', 'memory usage']
+    
+    # App launch table: spoken name -> launch target
+    APPS = {
+        'notepad': 'notepad', 'calculator': 'calc', 'calc': 'calc',
+        'explorer': 'explorer', 'file explorer': 'explorer', 'files': 'explorer',
+        'settings': 'ms-settings:', 'chrome': 'chrome', 'brave': 'brave',
+        'firefox': 'firefox', 'edge': 'msedge', 'word': 'winword',
+        'excel': 'excel', 'powerpoint': 'powerpnt', 'vscode': 'code',
+        'vs code': 'code', 'terminal': 'wt', 'cmd': 'cmd',
+        'task manager': 'taskmgr', 'paint': 'mspaint', 'whatsapp': 'whatsapp',
+        'discord': 'discord', 'spotify': 'spotify', 'slack': 'slack'
+    }
+    
     @classmethod
-    def process(cls, text: str) -> dict:
+    def process(cls, text: Union[str, Utterance]) -> dict:
         """
         Fast local processing. Returns plan or None if LLM needed.
         """
-        text_clean = text.lower().strip()
-        text_words = set(text_clean.replace("'", "").split())
+        utterance = Utterance.of(text)
+        text_clean = utterance.lower
+        text_words = utterance.words
         
         # 1. STOP COMMANDS - Highest priority
         if text_clean in cls.STOPS or text_words & cls.STOPS:
@@ -228,7 +269,7 @@ class FastPath:
                 return {
                     "plan": [
                         {"action": "BROWSER_DIRECT", "payload": url},
-                        {"action": "RESPONSE", "payload": f"Opening {target}."}
+                        {"action": "RESPONSE", "payload": f"Opening {target}.", "after": []}
                     ],
                     "fast_path": True,
                     "intent": "open_website",
@@ -236,22 +277,29 @@ class FastPath:
                 }
             
             # Check if it's an app
-            apps = {
-                'notepad': 'notepad', 'calculator': 'calc', 'calc': 'calc',
-                'explorer': 'explorer', 'file explorer': 'explorer', 'files': 'explorer',
-                'settings': 'ms-settings:', 'chrome': 'chrome', 'brave': 'brave',
-                'firefox': 'firefox', 'edge': 'msedge', 'word': 'winword',
-                'excel': 'excel', 'powerpoint': 'powerpnt', 'vscode': 'code',
-                'vs code': 'code', 'terminal': 'wt', 'cmd': 'cmd',
-                'task manager': 'taskmgr', 'paint': 'mspaint', 'whatsapp': 'whatsapp',
-                'discord': 'discord', 'spotify': 'spotify', 'slack': 'slack'
-            }
+            app_target = cls.APPS.get(target)
             
-            if target in apps:
+            # Near-miss names from speech ("you tube", "git hub")
+            if app_target is None:
+                near = _RESOLVER.resolve(target, kinds=("website", "app"))
+                if near and near.kind == "website":
+                    return {
+                        "plan": [
+                            {"action": "BROWSER_DIRECT", "payload": near.value},
+                            {"action": "RESPONSE", "payload": f"Opening {near.name}.", "after": []}
+                        ],
+                        "fast_path": True,
+                        "intent": "open_website",
+                        "target": near.name
+                    }
+                if near:
+                    target, app_target = near.name, cls.APPS.get(near.name, near.value)
+            
+            if app_target:
                 return {
                     "plan": [
-                        {"action": "LAUNCH_SYS", "payload": apps[target]},
-                        {"action": "RESPONSE", "payload": f"Launching {target}."}
+                        {"action": "LAUNCH_SYS", "payload": app_target},
+                        {"action": "RESPONSE", "payload": f"Launching {target}.", "after": []}
                     ],
                     "fast_path": True,
                     "intent": "open_app",
@@ -273,7 +321,7 @@ class FastPath:
                 return {
                     "plan": [
                         {"action": "PLAY_MUSIC", "payload": song},
-                        {"action": "RESPONSE", "payload": f"Playing {song}."}
+                        {"action": "RESPONSE", "payload": f"Playing {song}.", "after": []}
                     ],
                     "fast_path": True,
                     "intent": "play_music",
@@ -302,8 +350,11 @@ class FastPath:
                     "target": topic
                 }
         
+        # 10-13. Keyword tiers - one automaton pass reports every category hit
+        hits = utterance.keyword_categories()
+        
         # 10. Screenshot
-        if any(kw in text_clean for kw in ['screenshot', 'screen shot', 'capture screen', 'take a picture']):
+        if "fastpath.screenshot" in hits:
             return {
                 "plan": [
                     {"action": "SCREENSHOT", "payload": "capture"},
@@ -314,7 +365,7 @@ class FastPath:
             }
         
         # 11. Minimize/Desktop
-        if any(kw in text_clean for kw in ['minimize all', 'show desktop', 'clear screen', 'go to desktop']):
+        if "fastpath.minimize" in hits:
             return {
                 "plan": [
                     {"action": "MINIMIZE_ALL", "payload": ""},
@@ -325,7 +376,7 @@ class FastPath:
             }
         
         # 12. Lock PC
-        if any(kw in text_clean for kw in ['lock pc', 'lock computer', 'lock my pc', 'lock screen']):
+        if "fastpath.lock" in hits:
             return {
                 "plan": [
                     {"action": "WINDOWS_SHORTCUT", "payload": "lock pc"},
@@ -336,7 +387,7 @@ class FastPath:
             }
         
         # 13. System status
-        if any(kw in text_clean for kw in ['status', 'system status', 'cpu', 'battery', 'memory usage']):
+        if "fastpath.status" in hits:
             return {
                 "plan": [{"action": "SYSTEM_CHECK", "payload": ""}],
                 "fast_path": True,
@@ -347,6 +398,16 @@ class FastPath:
         return None
 
 
+_KEYWORDS = get_keyword_engine()
+_KEYWORDS.register("fastpath.screenshot", FastPath.SCREENSHOT_KEYWORDS)
+_KEYWORDS.register("fastpath.minimize", FastPath.MINIMIZE_KEYWORDS)
+_KEYWORDS.register("fastpath.lock", FastPath.LOCK_KEYWORDS)
+_KEYWORDS.register("fastpath.status", FastPath.STATUS_KEYWORDS)
+
+_RESOLVER = get_fuzzy_resolver()
+_RESOLVER.register("fastpath_apps", FastPath.APPS, "app")
+
+
 # =============================================================================
 # LLM PROCESSOR  
 # =============================================================================
@@ -357,11 +418,13 @@ class LLMProcessor:
     """
     
     def __init__(self):
-        self.client = Groq(api_key=API_KEY)
+        self.client = get_groq_client(API_KEY)
         self.model = "llama-3.1-8b-instant"
     
-    def process(self, user_text: str) -> dict:
+    def process(self, user_text: Union[str, Utterance]) -> dict:
         """Process through LLM"""
+        utterance = Utterance.of(user_text)
+        user_text = utterance.raw
         try:
             completion = self.client.chat.completions.create(
                 model=self.model,
@@ -378,7 +441,7 @@ class LLMProcessor:
             result["intent"] = "llm_processed"
             
             # SAFETY: Validate the plan doesn't contain browser actions for greetings
-            if self._is_conversational(user_text):
+            if self._is_conversational(utterance):
                 # Filter out any non-CHAT/RESPONSE actions
                 result["plan"] = [
                     action for action in result.get("plan", [])
@@ -399,22 +462,49 @@ class LLMProcessor:
                 "intent": "error"
             }
     
-    def _is_conversational(self, text: str) -> bool:
-        """Check if input is conversational (should NOT trigger actions)"""
-        text_lower = text.lower().strip()
+    def stream(self, user_text: str):
+        """
+        Stream the plan through the LLM, yielding each step as soon as it is
+        complete. Unlike process(), errors propagate to the caller.
+        """
+        completion = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_text}
+            ],
+            temperature=0.0,  # Deterministic
+            response_format={"type": "json_object"},
+            stream=True
+        )
         
-        # Direct matches
-        conversational = ['hello', 'hi', 'hey', 'yo', 'sup', 'thanks', 'thank you',
-                         'bye', 'goodbye', 'ok', 'okay', 'yes', 'no', 'sure']
+        parser = PlanStreamParser()
+        for chunk in completion:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                yield from parser.feed(content)
+        yield from parser.close()
+    
+    # Direct matches for _is_conversational
+    CONVERSATIONAL = {'hello', 'hi', 'hey', 'yo', 'sup', 'thanks', 'thank you',
+                      'bye', 'goodbye', 'ok', 'okay', 'yes', 'no', 'sure'}
+    QUESTION_START = re.compile(r'^(what|how|why|when|where|who|can|could|would|should|is|are|do|does)\b')
+    
+    def _is_conversational(self, text: Union[str, Utterance]) -> bool:
+        """Check if input is conversational (should NOT trigger actions)"""
+        return Utterance.of(text).derive("llm.conversational", self._check_conversational)
+    
+    @classmethod
+    def _check_conversational(cls, utterance: Utterance) -> bool:
+        text_lower = utterance.lower
         
-        if text_lower in conversational:
+        if text_lower in cls.CONVERSATIONAL:
             return True
         
         # Question patterns
-        if re.match(r'^(what|how|why|when|where|who|can|could|would|should|is|are|do|does)\b', text_lower):
-            return True
-        
-        return False
+        return cls.QUESTION_START.match(text_lower) is not None
 
 
 # =============================================================================
@@ -424,6 +514,23 @@ class LLMProcessor:
 # Global instances
 _sentinel = None
 _llm = None
+_llm_executor = None
+_nearest_intent = None
+
+# End-to-end get_operator_plan latency, keyed "<mode>.<tier>"
+PLAN_LATENCY = LatencyRecorder()
+
+# Time spent inside each tier, keyed by tier (whether or not it answered)
+TIER_LATENCY = LatencyRecorder()
+
+_TRACER = get_tracer()
+
+def _tier_span(tier: str):
+    """Time a planning tier into TIER_LATENCY and the current voice trace."""
+    return _TRACER.span(f"plan.{tier}", TIER_LATENCY.get(tier))
+
+# What happened to speculative requests
+SPECULATION_STATS = {"started": 0, "used": 0, "cancelled": 0, "discarded": 0}
 
 def _get_sentinel():
     global _sentinel
@@ -437,6 +544,31 @@ def _get_llm():
         _llm = LLMProcessor()
     return _llm
 
+def _get_nearest_intent():
+    global _nearest_intent
+    if _nearest_intent is None:
+        # Imported here - nova_actions pulls in the GUI automation stack
+        from app.nova_actions import INTENT_PATTERNS
+        _nearest_intent = build_nearest_intent_index(
+            SYSTEM_PROMPT, INTENT_PATTERNS,
+            user_corpus_path=get_user_data_file("intent_corpus.json"),
+            threshold=LOCAL_INTENT_THRESHOLD,
+        )
+    return _nearest_intent
+
+def _get_llm_executor():
+    global _llm_executor
+    if _llm_executor is None:
+        _llm_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nova-llm")
+    return _llm_executor
+
+def _drop_speculation(future):
+    """Cancel a speculative LLM request, or discard its result if already sent."""
+    if future.cancel():
+        SPECULATION_STATS["cancelled"] += 1
+    else:
+        SPECULATION_STATS["discarded"] += 1
+
 
 def _filter_long_content(plan: list) -> list:
     """
@@ -466,22 +598,136 @@ def get_operator_plan(user_text: str) -> dict:
     MAIN ENTRY POINT - Process user command.
     
     Pipeline:
+    0. Plan cache (repeated commands, guarded intents bypass it)
     1. Sentinel Core pre-check (safety, duplicates)
-    2. Fast Path (local, ~0ms)
+    2. Fast Path (local, ~0ms), then nearest known phrasing (TF-IDF)
     3. LLM Fallback (complex commands)
     4. Post-validation (filter long content)
+    
+    With SPECULATIVE_LLM the Groq request for step 3 starts on a worker
+    before step 1 and is dropped if a local tier answers.
+    """
+    start = time.perf_counter()
+    mode = "speculative" if SPECULATIVE_LLM else "sequential"
+    sentinel = _get_sentinel()
+    cache = get_plan_cache()
+    
+    # 0. Plan cache - STOP and guarded actions always go through Sentinel
+    with _tier_span("normalize"):
+        utterance = Utterance.of(user_text)
+        cache_key = normalize_plan_key(user_text)
+    with _tier_span("classify"):
+        cache_intent, cache_target = sentinel.classifier.classify(utterance)
+    cached_plan = cache.get(cache_key, cache_intent)
+    if cached_plan is not None:
+        print(f"[CACHE] Hit: {user_text}")
+        sentinel.record_cached(user_text, cache_intent, cached_plan)
+        PLAN_LATENCY.record(f"{mode}.cache", time.perf_counter() - start)
+        _TRACER.record("plan", start, tier="cache")
+        return {"plan": cached_plan}
+    
+    # Speculate only when Sentinel is going to hand the command to the LLM -
+    # small talk it answers itself ("hello", "thanks") would waste a request
+    llm_future = None
+    if SPECULATIVE_LLM and sentinel.defers_to_llm(cache_intent, cache_target, utterance.text):
+        llm_future = _get_llm_executor().submit(_get_llm().process, user_text)
+        SPECULATION_STATS["started"] += 1
+    
+    tier = None
+    try:
+        result = _plan_locally(utterance, sentinel, cache, cache_key, cache_intent)
+        if result is None:
+            result = _plan_with_llm(utterance, cache, cache_key, cache_intent, llm_future), "llm"
+        plan, tier = result
+    finally:
+        if llm_future is not None and tier != "llm":
+            _drop_speculation(llm_future)
+    
+    PLAN_LATENCY.record(f"{mode}.{tier}", time.perf_counter() - start)
+    _TRACER.record("plan", start, tier=tier)
+    return {"plan": plan}
+
+
+def iter_operator_plan(user_text: str):
     """
+    Streaming variant of get_operator_plan - yields plan steps one by one.
+    Local tiers yield their whole plan at once; the LLM tier yields each
+    step as soon as it has been generated, so the first utterance or action
+    can start while later steps are still streaming. No speculation here.
+    """
+    start = time.perf_counter()
     sentinel = _get_sentinel()
+    cache = get_plan_cache()
+    
+    with _tier_span("normalize"):
+        utterance = Utterance.of(user_text)
+        cache_key = normalize_plan_key(user_text)
+    with _tier_span("classify"):
+        cache_intent, _ = sentinel.classifier.classify(utterance)
+    cached_plan = cache.get(cache_key, cache_intent)
+    if cached_plan is not None:
+        print(f"[CACHE] Hit: {user_text}")
+        sentinel.record_cached(user_text, cache_intent, cached_plan)
+        PLAN_LATENCY.record("stream.cache", time.perf_counter() - start)
+        _TRACER.record("plan", start, tier="cache")
+        yield from cached_plan
+        return
+    
+    result = _plan_locally(utterance, sentinel, cache, cache_key, cache_intent)
+    if result is not None:
+        plan, tier = result
+        PLAN_LATENCY.record(f"stream.{tier}", time.perf_counter() - start)
+        _TRACER.record("plan", start, tier=tier)
+        yield from plan
+        return
+    
+    print(f"[LLM] Streaming: {user_text}")
+    llm = _get_llm()
+    conversational = llm._is_conversational(utterance)
+    plan = []
+    failed = False
+    try:
+        for step in llm.stream(user_text):
+            # Same post-validation as get_operator_plan, one step at a time
+            if conversational and step.get("action") not in ["CHAT", "RESPONSE"]:
+                continue
+            for kept in _filter_long_content([step]):
+                if not plan:
+                    PLAN_LATENCY.record("stream.llm_first_step", time.perf_counter() - start)
+                    _TRACER.record("plan.first_step", start)
+                plan.append(kept)
+                yield kept
+    except Exception as e:
+        print(f"[LLM ERROR] {e}")
+        failed = True
+    
+    if not plan:
+        fallback = ("Had an issue processing that. Try again?" if failed
+                    else "What can I help with?")
+        plan.append({"action": "CHAT", "payload": fallback})
+        yield plan[-1]
+    elif not failed:
+        cache.put(cache_key, cache_intent, plan, tier="llm")
+    PLAN_LATENCY.record("stream.llm", time.perf_counter() - start)
+    _TRACER.record("plan", start, tier="llm")
+
+
+def _plan_locally(utterance, sentinel, cache, cache_key, cache_intent):
+    """
+    Steps 1-2 of get_operator_plan.
+    Returns (plan, tier) with tier "blocked", "sentinel", "fast" or
+    "nearest", or None when the command needs the LLM.
+    """
+    user_text = utterance.raw
     
     # 1. Pre-check with Sentinel
-    sentinel_result = sentinel.process(user_text)
+    with _tier_span("sentinel"):
+        sentinel_result = sentinel.process(utterance)
     
     # If Sentinel blocked it (duplicate, already open, etc.)
     if sentinel_result.get("blocked"):
         print(f"[SENTINEL] Blocked: {sentinel_result.get('reason')}")
-        return {
-            "plan": [{"action": "RESPONSE", "payload": sentinel_result.get("response", "Blocked.")}]
-        }
+        return [{"action": "RESPONSE", "payload": sentinel_result.get("response", "Blocked.")}], "blocked"
     
     # If Sentinel has a complete plan (conversational, known actions)
     if sentinel_result.get("plan") and sentinel_result["intent"] != Intent.UNKNOWN:
@@ -493,21 +739,49 @@ def get_operator_plan(user_text: str) -> dict:
             pass
         else:
             print(f"[SENTINEL] Handled: {sentinel_result['intent']}")
-            return {"plan": _filter_long_content(sentinel_result["plan"])}
+            plan = _filter_long_content(sentinel_result["plan"])
+            # Local small talk picks a fresh Personality line each time
+            if sentinel_result["intent"] != Intent.CONVERSATIONAL:
+                cache.put(cache_key, cache_intent, plan, tier="sentinel")
+            return plan, "sentinel"
     
     # 2. Try Fast Path
-    fast_result = FastPath.process(user_text)
+    with _tier_span("fast"):
+        fast_result = FastPath.process(utterance)
     if fast_result:
         print(f"[FAST] {fast_result.get('intent', 'matched')}: {user_text}")
-        return {"plan": _filter_long_content(fast_result["plan"])}
+        plan = _filter_long_content(fast_result["plan"])
+        cache.put(cache_key, cache_intent, plan, tier="fast")
+        return plan, "fast"
+    
+    # 2b. Nearest known phrasing - questions always go to the LLM
+    if LOCAL_INTENT_TIER and cache_intent != Intent.CONVERSATIONAL:
+        with _tier_span("nearest"):
+            near = _get_nearest_intent().query(user_text)
+        if near:
+            print(f"[NEAREST] {user_text!r} ~ {near.text!r} ({near.score:.2f})")
+            plan = _filter_long_content([dict(step) for step in near.plan])
+            cache.put(cache_key, cache_intent, plan, tier="nearest")
+            return plan, "nearest"
     
-    # 3. LLM Fallback
-    print(f"[LLM] Processing: {user_text}")
+    return None
+
+
+def _plan_with_llm(utterance, cache, cache_key, cache_intent, llm_future):
+    """Steps 3-4 of get_operator_plan (the request may already be in flight)."""
+    user_text = utterance.raw
     llm = _get_llm()
-    llm_result = llm.process(user_text)
+    with _tier_span("llm"):
+        if llm_future is not None:
+            print(f"[LLM] Awaiting speculative request: {user_text}")
+            llm_result = llm_future.result()
+            SPECULATION_STATS["used"] += 1
+        else:
+            print(f"[LLM] Processing: {user_text}")
+            llm_result = llm.process(utterance)
     
     # 4. Post-validation - Ensure no browser actions for conversational input
-    if llm._is_conversational(user_text):
+    if llm._is_conversational(utterance):
         safe_plan = []
         for action in llm_result.get("plan", []):
             if action.get("action") in ["CHAT", "RESPONSE"]:
@@ -519,7 +793,21 @@ def get_operator_plan(user_text: str) -> dict:
         llm_result["plan"] = safe_plan
     
     # Filter out long content (prevents essay content from being spoken)
-    return {"plan": _filter_long_content(llm_result.get("plan", []))}
+    plan = _filter_long_content(llm_result.get("plan", []))
+    if llm_result.get("intent") != "error":
+        cache.put(cache_key, cache_intent, plan, tier="llm")
+    return plan
+
+
+def plan_latency_report() -> str:
+    """Latency histograms per mode and tier, plus speculation and local-tier counters."""
+    stats = ", ".join(f"{k}={v}" for k, v in SPECULATION_STATS.items())
+    report = f"[LATENCY] get_operator_plan ({stats})\n{PLAN_LATENCY.report()}"
+    report += f"\n[LATENCY] Per-tier spans\n{TIER_LATENCY.report()}"
+    if _nearest_intent is not None:
+        report += (f"\n[NEAREST] {_nearest_intent.answered} LLM calls avoided "
+                   f"({_nearest_intent.lookups} lookups)")
+    return report
 
 
 # =============================================================================
@@ -623,7 +911,7 @@ def generate_essay(topic: str) -> dict:
     print(f"[ESSAY] Generating essay on '{topic}'...")
     
     try:
-        client = Groq(api_key=API_KEY)
+        client = get_groq_client(API_KEY)
         
         # First attempt
         result = _generate_essay_attempt(client, topic)
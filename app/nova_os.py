@@ -4,7 +4,6 @@ High-speed GUI automation with instant clicks (no demo animations).
 """
 
 import os
-import time
 import shutil
 import subprocess
 import pyautogui
@@ -14,6 +13,11 @@ import pygetwindow as gw
 
 # Import path utilities from package
 from app import get_runtime_audio_file
+from app import cancellation
+from app.fuzzy_resolver import get_fuzzy_resolver
+
+# Characters typed between cancel points when write() types slowly
+WRITE_CHUNK_CHARS = 20
 
 
 class NovaOS:
@@ -90,27 +94,39 @@ class NovaOS:
     
     # ==================== BASE PRIMITIVES ====================
     
+    # Every primitive is a cancel point: a "stop" aborts a macro between actions
+    
     def press(self, *keys):
         """Press key(s). Instant."""
+        cancellation.checkpoint()
         pyautogui.hotkey(*keys)
     
     def write(self, text, interval=0.0):
-        """Type text. Instant by default."""
-        pyautogui.write(text, interval=interval)
+        """Type text. Instant by default; slow typing is a cancel point every few characters."""
+        step = WRITE_CHUNK_CHARS if interval else len(text) or 1
+        for start in range(0, len(text) or 1, step):
+            cancellation.checkpoint()
+            pyautogui.write(text[start:start + step], interval=interval)
     
     def mouse(self, x_pct, y_pct):
         """
         Click at percentage coordinates. INSTANT (no animation).
         x_pct, y_pct are floats between 0.0 and 1.0.
         """
+        cancellation.checkpoint()
         x = int(self.screen_width * x_pct)
         y = int(self.screen_height * y_pct)
         pyautogui.click(x, y)
         return x, y
     
+    def click_at(self, x, y, clicks=1):
+        """Click at pixel coordinates (clicks=2 for a double-click)."""
+        cancellation.checkpoint()
+        pyautogui.click(x, y, clicks=clicks)
+    
     def wait(self, seconds):
-        """Wait for specified seconds."""
-        time.sleep(seconds)
+        """Wait for specified seconds (returns early, raising, if cancelled)."""
+        cancellation.sleep(seconds)
     
     # ==================== FOCUS UTILITIES ====================
     
@@ -143,7 +159,7 @@ class NovaOS:
             print(f"   -> '{app_name}' not found. Launching...")
             self.press('win')
             self.wait(0.5)
-            pyautogui.write(app_name, interval=0.05)
+            self.write(app_name, interval=0.05)
             self.wait(0.5)
             self.press('enter')
             self.wait(3.0)  # Wait for app to start
@@ -169,7 +185,7 @@ class NovaOS:
                 win.minimize()
                 self.wait(0.2)
                 win.restore()
-            except:
+            except Exception:
                 pass
         self.wait(0.3)
         
@@ -179,7 +195,7 @@ class NovaOS:
                 print(f"   -> Window not maximized. Maximizing...")
                 try:
                     win.maximize()
-                except:
+                except Exception:
                     self.press('win', 'up')
                 self.wait(1.5)  # CRITICAL: Wait for animation to finish
             else:
@@ -191,7 +207,7 @@ class NovaOS:
         
         # Step 5: Focus Anchor - Physical click to steal focus from Taskbar
         print(f"   -> Focus anchor click (center of screen)")
-        pyautogui.click(int(w * 0.5), int(h * 0.5))
+        self.click_at(int(w * 0.5), int(h * 0.5))
         self.wait(0.3)
         
         print(f"   ✅ '{app_name}' is ready and maximized.")
@@ -208,7 +224,7 @@ class NovaOS:
                     try:
                         win.maximize()
                         self.wait(0.5)
-                    except:
+                    except Exception:
                         self.press('win', 'up')
                         self.wait(0.5)
                 else:
@@ -302,7 +318,7 @@ class NovaOS:
             click_x = int(w * x_pct)
             click_y = int(h * y_pct)
             print(f"      -> {label}: ({click_x}, {click_y})")
-            pyautogui.click(click_x, click_y)
+            self.click_at(click_x, click_y)
             self.wait(0.1)  # Brief pause between clicks
         
         print(f"   ✅ Playing '{song_name}'")
@@ -329,10 +345,17 @@ class NovaOS:
         
         # Check knowledge base
         site_key = site_name.lower().replace(" ", "").strip()
+        direct_url = self.KNOWN_SITES.get(site_key)
         
-        if site_key in self.KNOWN_SITES:
+        if direct_url is None:
+            # Near-miss names from speech ("stack over flow", "discrod")
+            near = _RESOLVER.resolve(site_name, kinds=("website",))
+            if near:
+                print(f"   -> 🧠 NEAR MATCH: '{site_name}' -> {near.name}")
+                direct_url = near.value
+        
+        if direct_url:
             # KNOWN - Direct URL
-            direct_url = self.KNOWN_SITES[site_key]
             print(f"   -> 🧠 KNOWN: {direct_url}")
             self.write(direct_url, interval=0.02)
             self.wait(0.1)
@@ -393,7 +416,7 @@ class NovaOS:
             from urllib.parse import urlparse
             domain = urlparse(url).netloc.replace("www.", "")
             site_name = domain.split(".")[0].capitalize()
-        except:
+        except Exception:
             site_name = url
         
         self.wait(1.5)
@@ -418,8 +441,14 @@ class NovaOS:
         self.wait(0.5)
         
         # Navigate to download page
-        if app_key in self.DIRECT_URLS:
-            target_url = self.DIRECT_URLS[app_key]
+        target_url = self.DIRECT_URLS.get(app_key)
+        if target_url is None:
+            near = _RESOLVER.resolve(app_key, kinds=("download",))
+            if near:
+                print(f"   -> Near match: '{app_name}' -> {near.name}")
+                target_url = near.value
+        
+        if target_url:
             print(f"   -> Known URL: {target_url}")
             self.press('ctrl', 'l')
             self.wait(0.3)
@@ -482,14 +511,14 @@ class NovaOS:
         """Minimize all windows - show desktop. Win+M"""
         print("🖥️ Minimizing all windows...")
         self.press('win', 'm')
-        time.sleep(0.5)
+        self.wait(0.5)
         return "All windows minimized. Desktop shown."
     
     def show_desktop(self):
         """Alias for minimize_all - show desktop. Win+D"""
         print("🖥️ Showing desktop...")
         self.press('win', 'd')
-        time.sleep(0.5)
+        self.wait(0.5)
         return "Desktop shown."
     
     def execute_windows_shortcut(self, intent_text):
@@ -569,7 +598,7 @@ class NovaOS:
                     self.wait(0.2)
                     word_doc_window.restore()
                     self.wait(0.5)
-                except:
+                except Exception:
                     pass
         elif word_start_window:
             # Word is at startup screen - click Blank document
@@ -577,7 +606,7 @@ class NovaOS:
             try:
                 word_start_window.activate()
                 self.wait(0.5)
-            except:
+            except Exception:
                 pass
             
             # Click "Blank document" - it's in the upper-left area of the window
@@ -586,7 +615,7 @@ class NovaOS:
             click_x = int(w * 0.17)
             click_y = int(h * 0.32)
             print(f"   -> Clicking Blank document at ({click_x}, {click_y})")
-            pyautogui.click(click_x, click_y)
+            self.click_at(click_x, click_y)
             
             # Wait for document to open
             print("   -> Waiting for document to open...")
@@ -604,7 +633,7 @@ class NovaOS:
             if not word_doc_window:
                 # Fallback: try double-click
                 print("   -> Double-clicking Blank document...")
-                pyautogui.doubleClick(click_x, click_y)
+                self.click_at(click_x, click_y, clicks=2)
                 self.wait(2.0)
         else:
             # Word not open at all - launch it
@@ -636,7 +665,7 @@ class NovaOS:
             click_x = int(w * 0.17)
             click_y = int(h * 0.32)
             print(f"   -> Clicking Blank document at ({click_x}, {click_y})")
-            pyautogui.doubleClick(click_x, click_y)
+            self.click_at(click_x, click_y, clicks=2)
             
             # Wait for document
             print("   -> Waiting for document...")
@@ -645,7 +674,7 @@ class NovaOS:
         # Step 2: Click in document area to ensure focus (center-right of screen, avoiding ribbon)
         print("   -> Clicking document area to focus...")
         w, h = self.screen_width, self.screen_height
-        pyautogui.click(int(w * 0.5), int(h * 0.55))  # Below ribbon area
+        self.click_at(int(w * 0.5), int(h * 0.55))  # Below ribbon area
         self.wait(0.3)
         
         # Step 3: Type text using clipboard (reliable for all characters)
@@ -658,7 +687,7 @@ class NovaOS:
         except ImportError:
             # Fallback: use typewrite with slower interval for reliability
             print("   -> pyperclip not available, using typewrite...")
-            pyautogui.typewrite(text, interval=0.03)
+            self.write(text, interval=0.03)
         
         print(f"   ✅ Text written to Word.")
         return f"Typed {len(text)} characters in Microsoft Word."
@@ -698,11 +727,11 @@ class NovaOS:
             
         except ImportError:
             print("   -> pyperclip not available, using typewrite...")
-            pyautogui.write(text, interval=0.015)
+            self.write(text, interval=0.015)
             return True
         except Exception as e:
             print(f"   ⚠️ Clipboard error: {e}, using typewrite...")
-            pyautogui.write(text[:500], interval=0.015)  # Limit for safety
+            self.write(text[:500], interval=0.015)  # Limit for safety
             return True
 
     def launch_word_robust(self):
@@ -721,10 +750,10 @@ class NovaOS:
                 print(f"   ✅ Document already open: '{win.title}'")
                 try:
                     win.activate()
-                    time.sleep(0.5)
+                    self.wait(0.5)
                     # Click document area to focus cursor
-                    pyautogui.click(int(w * 0.5), int(h * 0.5))
-                    time.sleep(0.3)
+                    self.click_at(int(w * 0.5), int(h * 0.5))
+                    self.wait(0.3)
                     return True
                 except Exception as e:
                     print(f"   ⚠️ Could not activate: {e}")
@@ -736,8 +765,8 @@ class NovaOS:
                 print(f"   -> Word home screen detected, clicking Blank Document...")
                 try:
                     win.activate()
-                    time.sleep(1.0)
-                except:
+                    self.wait(1.0)
+                except Exception:
                     pass
                 
                 # Click Blank Document (multiple attempts at different positions)
@@ -746,16 +775,16 @@ class NovaOS:
                     click_x = int(w * px)
                     click_y = int(h * py)
                     print(f"   -> Clicking at ({click_x}, {click_y})...")
-                    pyautogui.click(click_x, click_y)
-                    time.sleep(0.5)
+                    self.click_at(click_x, click_y)
+                    self.wait(0.5)
                 
                 # Wait for document
                 print("   -> Waiting 3s for document...")
-                time.sleep(3.0)
+                self.wait(3.0)
                 
                 # Click document area
-                pyautogui.click(int(w * 0.5), int(h * 0.5))
-                time.sleep(0.5)
+                self.click_at(int(w * 0.5), int(h * 0.5))
+                self.wait(0.5)
                 
                 print("   ✅ Word ready from home screen!")
                 return True
@@ -769,14 +798,14 @@ class NovaOS:
         # Method 1: Start menu search
         print("   -> Method 1: Start menu search...")
         self.press('win')
-        time.sleep(1.0)
-        pyautogui.write("Microsoft Word", interval=0.05)
-        time.sleep(1.5)
+        self.wait(1.0)
+        self.write("Microsoft Word", interval=0.05)
+        self.wait(1.5)
         self.press('enter')
         
         # Wait for Word to load
         print("   -> Waiting 6s for Word to launch...")
-        time.sleep(6.0)
+        self.wait(6.0)
         
         # Check if Word opened
         for win in gw.getAllWindows():
@@ -799,7 +828,7 @@ class NovaOS:
                     try:
                         subprocess.Popen([path])
                         print(f"   -> Launched: {path}")
-                        time.sleep(6.0)
+                        self.wait(6.0)
                         
                         # Verify it opened
                         for win in gw.getAllWindows():
@@ -819,13 +848,13 @@ class NovaOS:
             return False
         
         # Activate Word window
-        time.sleep(0.5)
+        self.wait(0.5)
         for win in gw.getAllWindows():
             if 'word' in win.title.lower():
                 try:
                     win.activate()
-                    time.sleep(0.5)
-                except:
+                    self.wait(0.5)
+                except Exception:
                     pass
                 break
         
@@ -835,7 +864,7 @@ class NovaOS:
         # Try keyboard shortcut first (Ctrl+N for new document)
         # This works if Word is at home screen or has a document open
         self.press('ctrl', 'n')
-        time.sleep(2.0)
+        self.wait(2.0)
         
         # Verify we have a document window
         doc_found = False
@@ -846,7 +875,7 @@ class NovaOS:
                 print(f"   -> Document opened: '{win.title}'")
                 try:
                     win.activate()
-                except:
+                except Exception:
                     pass
                 break
         
@@ -857,15 +886,15 @@ class NovaOS:
             for px, py in positions:
                 click_x = int(w * px)
                 click_y = int(h * py)
-                pyautogui.click(click_x, click_y)
-                time.sleep(0.5)
+                self.click_at(click_x, click_y)
+                self.wait(0.5)
             
-            time.sleep(2.0)
+            self.wait(2.0)
         
         # Final check - click in document area
         print("   -> Clicking document area...")
-        pyautogui.click(int(w * 0.5), int(h * 0.55))  # Below ribbon
-        time.sleep(0.5)
+        self.click_at(int(w * 0.5), int(h * 0.55))  # Below ribbon
+        self.wait(0.5)
         
         print("   ✅ Word ready!")
         return True
@@ -919,7 +948,7 @@ class NovaOS:
         # Select title and format
         self.press('home')
         self.wait(0.1)
-        pyautogui.hotkey('shift', 'end')
+        self.press('shift', 'end')
         self.wait(0.2)
         
         # Format: Bold + Center + Larger font
@@ -953,7 +982,7 @@ class NovaOS:
         # Format heading: Bold
         self.press('home')
         self.wait(0.1)
-        pyautogui.hotkey('shift', 'end')
+        self.press('shift', 'end')
         self.wait(0.1)
         self.press('ctrl', 'b')
         self.wait(0.1)
@@ -993,7 +1022,7 @@ class NovaOS:
             # Format: Bold
             self.press('home')
             self.wait(0.15)
-            pyautogui.hotkey('shift', 'end')
+            self.press('shift', 'end')
             self.wait(0.15)
             self.press('ctrl', 'b')
             self.wait(0.15)
@@ -1030,7 +1059,7 @@ class NovaOS:
         # Format heading: Bold
         self.press('home')
         self.wait(0.1)
-        pyautogui.hotkey('shift', 'end')
+        self.press('shift', 'end')
         self.wait(0.1)
         self.press('ctrl', 'b')
         self.wait(0.1)
@@ -1086,7 +1115,7 @@ class NovaOS:
             return "ERROR: Could not open Microsoft Word. Please ensure Word is installed."
         
         # Verify Word is actually open before writing
-        time.sleep(1.0)
+        self.wait(1.0)
         word_found = False
         for win in gw.getAllWindows():
             title = win.title.lower()
@@ -1094,8 +1123,8 @@ class NovaOS:
                 word_found = True
                 try:
                     win.activate()
-                    time.sleep(0.5)
-                except:
+                    self.wait(0.5)
+                except Exception:
                     pass
                 break
         
@@ -1281,6 +1310,16 @@ class NovaOS:
         return "Action complete."
 
 
+# --- FUZZY NAME TABLES ---
+_RESOLVER = get_fuzzy_resolver()
+_RESOLVER.register(
+    "known_sites",
+    {name: f"https://{domain}" for name, domain in NovaOS.KNOWN_SITES.items()},
+    "website",
+)
+_RESOLVER.register("direct_urls", NovaOS.DIRECT_URLS, "download")
+
+
 # --- MODULE-LEVEL INSTANCE (for backward compatibility) ---
 _nova_os = NovaOS()
 
@@ -0,0 +1,273 @@
+"""
+Plan Cache - Bounded LRU Cache for Operator Plans
+Repeated commands ("new tab", the same question asked twice) reuse the
+plan built last time instead of re-running the tiers or paying another Groq
+round-trip. Entries expire per intent; LLM-derived plans can optionally be
+kept warm across restarts in a small on-disk tier.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+from app import get_user_data_file
+from app.sentinel_core import Intent
+
+
+# Cache policy:
+# - Plans that are safe to replay expire per intent (INTENT_TTLS).
+# - Stateful, guarded or destructive intents are never cached, so Sentinel's
+#   duplicate and already-open checks see every repeat, and "shut down" /
+#   "close this" are always re-planned (BYPASS_INTENTS).
+# - Answers that depend on when they are asked ("what time is it", today's
+#   weather) are never cached (TIME_SENSITIVE_WORDS).
+# - Conversational answers stay in memory only; only action plans go to
+#   the on-disk tier (MEMORY_ONLY_INTENTS).
+# - A hit skips Sentinel, so the caller records the session context for it
+#   (SentinelCore.record_cached).
+
+# Seconds a plan stays valid, per Sentinel intent. 0 = never cached.
+INTENT_TTLS: Dict[Intent, float] = {
+    Intent.CONVERSATIONAL: 600,      # LLM answers to questions
+    Intent.BROWSER_CONTROL: 3600,
+    Intent.TYPE_TEXT: 3600,
+    Intent.FILE_OPERATION: 3600,
+    Intent.MULTI_STEP: 1800,
+    Intent.SEARCH_QUERY: 1800,
+    Intent.UNKNOWN: 1800,            # Unknown phrasings resolved by the LLM
+}
+
+# Stateful, guarded or destructive intents - must always run through Sentinel
+BYPASS_INTENTS = {
+    Intent.STOP_COMMAND,
+    Intent.OPEN_WEBSITE,
+    Intent.OPEN_APP,
+    Intent.PLAY_MEDIA,
+    Intent.SCREENSHOT,
+    Intent.SYSTEM_CONTROL,           # Shutdown, restart, lock, close, status
+}
+
+# Conversational requests whose answer changes with the clock
+TIME_SENSITIVE_WORDS = re.compile(
+    r'\b(time|date|day|today|tonight|tomorrow|yesterday|now|current|currently|'
+    r'latest|recent|news|weather|temperature|forecast|score|price|stock|'
+    r'week|month|year)\b'
+)
+
+# Intents whose plans are kept in memory but never written to disk
+MEMORY_ONLY_INTENTS = {Intent.CONVERSATIONAL}
+
+# Tiers whose plans are written to the on-disk tier
+PERSIST_TIERS = {"llm"}
+
+
+def normalize_plan_key(text: str) -> str:
+    """Cache key: lowercase, collapsed whitespace, no surrounding punctuation."""
+    text = re.sub(r'\s+', ' ', text.lower())
+    return text.strip(' .,!?')
+
+
+@dataclass
+class PlanCacheStats:
+    """Counters since startup (or the last reset)"""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PlanCache:
+    """
+    Thread-safe LRU cache: normalized text -> plan.
+    Memory entries use time.monotonic(); disk entries use wall-clock expiry
+    so they survive a restart.
+    """
+
+    DISK_FILENAME = "plan_cache.json"
+
+    def __init__(self, max_entries: int = 256, ttls: Optional[Dict[Intent, float]] = None,
+                 persist_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Memory tier capacity (least recently used is evicted)
+            ttls: Per-intent TTL in seconds (defaults to INTENT_TTLS)
+            persist_path: JSON file for the on-disk tier (None = memory only)
+            clock: Monotonic clock for memory expiry (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(INTENT_TTLS if ttls is None else ttls)
+        self.persist_path = persist_path
+        self.stats = PlanCacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # key -> (expires_at, intent name, plan)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # key -> {"expires": wall-clock, "intent": name, "plan": [...]}
+        self._disk: Dict[str, dict] = {}
+        if persist_path:
+            self._load_disk()
+
+    # ==================== LOOKUP ====================
+
+    def bypasses(self, intent: Intent, key: str = "") -> bool:
+        """True if plans for this intent (and normalized key) must never be cached."""
+        if intent in BYPASS_INTENTS or self.ttls.get(intent, 0) <= 0:
+            return True
+        return intent == Intent.CONVERSATIONAL and bool(TIME_SENSITIVE_WORDS.search(key))
+
+    def get(self, key: str, intent: Intent) -> Optional[List[dict]]:
+        """Cached plan for a normalized key, or None."""
+        if self.bypasses(intent, key):
+            with self._lock:
+                self.stats.bypassed += 1
+            return None
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, _, plan = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return _copy_plan(plan)
+                del self._entries[key]
+                self.stats.expirations += 1
+
+            record = self._disk.get(key)
+            if record is not None:
+                remaining = record["expires"] - time.time()
+                if remaining > 0:
+                    self._store(key, now + remaining, record["intent"], record["plan"])
+                    self.stats.hits += 1
+                    self.stats.disk_hits += 1
+                    return _copy_plan(record["plan"])
+                del self._disk[key]
+                self.stats.expirations += 1
+
+            self.stats.misses += 1
+            return None
+
+    # ==================== STORE ====================
+
+    def put(self, key: str, intent: Intent, plan: List[dict], tier: str = "local"):
+        """Store a plan. Bypassed intents and empty plans are ignored."""
+        if not plan or self.bypasses(intent, key):
+            return
+        ttl = self.ttls[intent]
+        with self._lock:
+            self._store(key, self._clock() + ttl, intent.name, _copy_plan(plan))
+            if self.persist_path and tier in PERSIST_TIERS and intent not in MEMORY_ONLY_INTENTS:
+                self._disk[key] = {
+                    "expires": time.time() + ttl,
+                    "intent": intent.name,
+                    "plan": _copy_plan(plan),
+                }
+                self._trim_disk()
+                self._save_disk()
+
+    def _store(self, key: str, expires_at: float, intent_name: str, plan: List[dict]):
+        self._entries[key] = (expires_at, intent_name, plan)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self):
+        """Drop every entry (memory and disk) and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._disk.clear()
+            self.stats = PlanCacheStats()
+            if self.persist_path:
+                self._save_disk()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ==================== DISK TIER ====================
+
+    def _load_disk(self):
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        # Entries written before the current policy may no longer be allowed
+        excluded = {intent.name for intent in BYPASS_INTENTS | MEMORY_ONLY_INTENTS}
+        self._disk = {
+            key: record for key, record in data.items()
+            if isinstance(record, dict) and record.get("expires", 0) > now
+            and record.get("plan") and record.get("intent") not in excluded
+        }
+        self._trim_disk()
+
+    def _trim_disk(self):
+        # Oldest expiry goes first once the disk tier outgrows the memory tier
+        excess = len(self._disk) - self.max_entries
+        if excess > 0:
+            for key in sorted(self._disk, key=lambda k: self._disk[k]["expires"])[:excess]:
+                del self._disk[key]
+
+    def _save_disk(self):
+        tmp_path = self.persist_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._disk, f)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            print(f"[CACHE] Could not write {self.persist_path}: {e}")
+
+    def summary(self) -> dict:
+        """Counters plus current sizes, for logging."""
+        with self._lock:
+            data = asdict(self.stats)
+            data["hit_rate"] = round(self.stats.hit_rate, 3)
+            data["entries"] = len(self._entries)
+            data["disk_entries"] = len(self._disk)
+        return data
+
+
+def _copy_plan(plan: List[dict]) -> List[dict]:
+    # Steps are flat dicts of strings - a per-step copy keeps callers from
+    # mutating the cached plan
+    return [dict(step) for step in plan]
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_plan_cache = None
+
+def get_plan_cache() -> PlanCache:
+    """
+    Get or create the shared plan cache.
+    PLAN_CACHE_SIZE sets the capacity (0 disables caching);
+    PLAN_CACHE_PERSIST=1 enables the on-disk tier for LLM plans.
+    """
+    global _plan_cache
+    if _plan_cache is None:
+        size = int(os.getenv("PLAN_CACHE_SIZE", "256"))
+        persist = os.getenv("PLAN_CACHE_PERSIST", "0").lower() in ("1", "true", "yes")
+        _plan_cache = PlanCache(
+            max_entries=size,
+            ttls=None if size > 0 else {},
+            persist_path=get_user_data_file(PlanCache.DISK_FILENAME) if persist else None,
+        )
+    return _plan_cache
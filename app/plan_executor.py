@@ -0,0 +1,113 @@
+"""
+Plan Executor - Speech and OS Actions as Concurrent Tracks
+A plan mixes spoken steps (RESPONSE, CHAT) with OS actions. Run strictly
+in order, a confirmation placed after its action ("Launching notepad."
+after LAUNCH_SYS) is only heard once the multi-second macro has finished.
+Here each step goes on one of two tracks that run side by side:
+
+- speech: RESPONSE and CHAT, in plan order
+- os: every other action, in plan order
+
+A step waits for the step before it on its own track. A spoken step that
+follows an OS step also waits for that step, so completion reports
+("Captured.", "Done.") are heard once the action has finished. A step's
+"after" list (plan indices) replaces that default: an announcement marked
+{"action": "RESPONSE", "payload": "Launching notepad.", "after": []} is
+spoken while the launch runs, and {"action": "RESPONSE", "payload":
+"Done.", "after": [0]} waits for step 0 only. An OS step that ends the
+plan (returns False) cancels what has not run yet; an exception, e.g.
+CommandCancelled, cancels the other track and propagates.
+"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+
+SPEECH = "speech"
+OS = "os"
+
+SPEECH_ACTIONS = {"RESPONSE", "CHAT"}
+
+
+def track_of(step: dict) -> str:
+    """Track a plan step runs on."""
+    return SPEECH if step.get("action") in SPEECH_ACTIONS else OS
+
+
+class _PlanEnded(Exception):
+    """An OS step asked for the rest of the plan to be skipped."""
+
+
+class PlanExecutor:
+    """Runs one plan's steps on the speech and OS tracks."""
+
+    def __init__(self, speak: Callable[[dict], Awaitable[None]],
+                 act: Callable[[dict], Awaitable[bool]]):
+        """
+        Args:
+            speak: Runs a speech step; returns once the step counts as done
+            act: Runs an OS step; returns False to skip the rest of the plan
+        """
+        self.speak = speak
+        self.act = act
+        # Step currently running on each track (for logging an abort)
+        self.running: Dict[str, Optional[dict]] = {SPEECH: None, OS: None}
+
+    async def run(self, steps: AsyncIterator[dict]):
+        """
+        Run every step of `steps` (a list's items, or streamed steps as they
+        arrive) and return once all have finished or the plan was ended.
+        """
+        finished: List[asyncio.Future] = []
+        last: Dict[str, Optional[int]] = {SPEECH: None, OS: None}
+        tasks: List[asyncio.Task] = []
+        loop = asyncio.get_running_loop()
+        try:
+            async for step in steps:
+                if any(_failed(task) for task in tasks):
+                    break    # Plan already ended or failed; don't start more
+                index = len(finished)
+                track = track_of(step)
+                after = [finished[i] for i in step.get("after", ())
+                         if isinstance(i, int) and 0 <= i < index]
+                if last[track] is not None:
+                    after.append(finished[last[track]])
+                if track == SPEECH and "after" not in step and last[OS] is not None:
+                    after.append(finished[last[OS]])
+                last[track] = index
+                done = loop.create_future()
+                finished.append(done)
+                tasks.append(asyncio.create_task(self._run_step(step, track, after, done)))
+            if tasks:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled steps unwind before the caller moves on
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            if _failed(task):
+                error = task.exception()
+                if isinstance(error, _PlanEnded):
+                    return
+                raise error
+
+    async def _run_step(self, step: dict, track: str, after: List[asyncio.Future],
+                        done: asyncio.Future):
+        try:
+            for future in after:
+                # A failed or cancelled step cancels the steps waiting on it
+                await asyncio.shield(future)
+            self.running[track] = step
+            if track == SPEECH:
+                await self.speak(step)
+            elif await self.act(step) is False:
+                raise _PlanEnded()
+            self.running[track] = None
+            done.set_result(None)
+        finally:
+            done.cancel()    # No-op once the step succeeded
+
+
+def _failed(task: asyncio.Task) -> bool:
+    return task.done() and not task.cancelled() and task.exception() is not None
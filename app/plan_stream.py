@@ -0,0 +1,102 @@
+"""
+Plan Stream - Incremental Parser for Streamed LLM Plans
+Consumes a {"plan": [{...}, {...}]} completion chunk by chunk and hands out
+each step object as soon as its closing brace arrives, so the engine can
+speak or act on step 1 while the model is still generating step 2.
+"""
+
+import json
+from typing import List
+
+
+class PlanStreamParser:
+    """
+    Feed raw completion text with feed(); each call returns the plan steps
+    completed by that chunk. close() returns any steps that could only be
+    recovered from the full text (e.g. the model nested the plan oddly).
+    """
+
+    def __init__(self, key: str = "plan"):
+        self.key = key
+        self.buffer = ""
+        self.emitted = 0
+
+        self._pos = 0              # Next buffer index to scan
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key = None      # Last complete string at top-object level
+        self._plan_depth = None    # Stack depth inside the plan array
+        self._step_start = -1
+
+    def feed(self, chunk: str) -> List[dict]:
+        """Add a chunk of completion text; return steps completed by it."""
+        if not chunk:
+            return []
+        self.buffer += chunk
+        steps = []
+        buffer, stack = self.buffer, self._stack
+
+        for i in range(self._pos, len(buffer)):
+            ch = buffer[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if len(stack) == 1:
+                        self._last_key = buffer[self._string_start + 1:i]
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in '{[':
+                if (ch == '[' and self._plan_depth is None and stack == ['{']
+                        and self._last_key == self.key):
+                    self._plan_depth = 2
+                if ch == '{' and self._plan_depth is not None and len(stack) == self._plan_depth:
+                    self._step_start = i
+                stack.append(ch)
+            elif ch in '}]':
+                if stack:
+                    stack.pop()
+                if self._plan_depth is None:
+                    continue
+                if ch == '}' and len(stack) == self._plan_depth and self._step_start >= 0:
+                    step = self._decode(buffer[self._step_start:i + 1])
+                    self._step_start = -1
+                    if step is not None:
+                        steps.append(step)
+                elif ch == ']' and len(stack) < self._plan_depth:
+                    # Plan array closed - later arrays are not steps
+                    self._plan_depth = -1
+
+        self._pos = len(buffer)
+        self.emitted += len(steps)
+        return steps
+
+    def close(self) -> List[dict]:
+        """Steps recoverable only from the complete text (empty if any were streamed)."""
+        if self.emitted:
+            return []
+        try:
+            data = json.loads(self.buffer)
+        except ValueError:
+            return []
+        plan = data.get(self.key, []) if isinstance(data, dict) else []
+        steps = [step for step in plan if isinstance(step, dict)]
+        self.emitted += len(steps)
+        return steps
+
+    @staticmethod
+    def _decode(text: str):
+        try:
+            step = json.loads(text)
+        except ValueError:
+            return None
+        return step if isinstance(step, dict) else None
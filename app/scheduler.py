@@ -0,0 +1,94 @@
+"""
+Scheduler - Priority Command Queues
+Bounded queues between the engine's pipeline stages. STOP-class commands
+are served before anything else; within a priority, commands keep the
+order they were spoken. A full queue drops its oldest least urgent
+command rather than make the producer wait, so stale commands never pile
+up behind a slow stage.
+"""
+
+import asyncio
+from collections import deque
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Priority(IntEnum):
+    """Lower is served first"""
+    STOP = 0
+    NORMAL = 1
+
+
+class CommandQueue:
+    """
+    asyncio-style queue (get/task_done/join) with priority lanes and
+    drop-oldest instead of blocking when full. Loop-thread only.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = max(1, maxsize)
+        self._lanes: Dict[Priority, deque] = {p: deque() for p in Priority}
+        self._size = 0
+        self._unfinished = 0
+        self._not_empty = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def offer(self, item: Any, priority: Priority = Priority.NORMAL) -> Optional[Any]:
+        """
+        Queue an item without waiting. When full, the oldest item of the
+        least urgent lane is dropped (the new one, if it is less urgent
+        than everything queued). Returns the dropped item, if any.
+        """
+        dropped = None
+        if self._size >= self.maxsize:
+            lane = max(p for p in Priority if self._lanes[p])
+            if lane < priority:
+                return item
+            dropped = self._lanes[lane].popleft()
+            self._size -= 1
+            self._unfinished -= 1
+        self._lanes[priority].append(item)
+        self._size += 1
+        self._unfinished += 1
+        self._finished.clear()
+        self._not_empty.set()
+        return dropped
+
+    def discard(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """Remove (and return) every queued item matching predicate."""
+        removed = []
+        for lane in self._lanes.values():
+            keep = deque()
+            for item in lane:
+                (removed if predicate(item) else keep).append(item)
+            lane.clear()
+            lane.extend(keep)
+        self._size -= len(removed)
+        self._unfinished -= len(removed)
+        if not self._unfinished:
+            self._finished.set()
+        return removed
+
+    async def get(self) -> Any:
+        """Most urgent item, oldest first within a priority."""
+        while not self._size:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        for priority in Priority:
+            if self._lanes[priority]:
+                self._size -= 1
+                return self._lanes[priority].popleft()
+
+    def task_done(self):
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every queued item has been taken and marked done."""
+        await self._finished.wait()
@@ -13,10 +13,14 @@ Prevents infinite loops, enforces intent classification, ensures deterministic b
 import time
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 from enum import Enum, auto
 from collections import deque
 
+from app.keyword_engine import get_keyword_engine
+from app.fuzzy_resolver import get_fuzzy_resolver
+from app.utterance import Utterance
+
 
 # =============================================================================
 # INTENT CLASSIFICATION SYSTEM
@@ -94,6 +98,87 @@ PLAY_PATTERNS = [
     r'play\s+(.+?)(?:\s+on\s+youtube|\s+on\s+spotify|\s+music)?$',
 ]
 
+# Question starters - prefix match, questions are not action requests
+QUESTION_STARTERS = [
+    'what', 'how', 'why', 'when', 'where', 'who',
+    'is it', 'are you', 'can you', 'do you', 'does it',
+    'would', 'could', 'should', 'will it', 'explain', 'tell me',
+]
+
+# "open X" pattern used by the classifier (target is group 1)
+OPEN_TARGET_PATTERNS = [
+    r'(?:open|go\s*to|visit|launch)\s+(.+?)(?:\s*\.com|\s*\.pk|\s*\.org)?$',
+]
+
+
+# =============================================================================
+# COMPILED INTENT AUTOMATON
+# =============================================================================
+
+def _compile_intent_automaton():
+    """
+    Merge the STOP, CONVERSATIONAL, question-starter, PLAY and OPEN patterns
+    into a single precompiled alternation.
+
+    Each pattern becomes its own named branch, listed in classifier priority
+    order. re tries alternatives left to right at position 0, so the branch
+    that matches is the one the old one-pattern-at-a-time loop would have hit.
+
+    Returns (compiled_regex, {branch_name: (intent, target_group_index)})
+    """
+    sources = (
+        [(Intent.STOP_COMMAND, p, False) for p in STOP_PATTERNS] +
+        [(Intent.CONVERSATIONAL, p, False) for p in CONVERSATIONAL_PATTERNS] +
+        [(Intent.CONVERSATIONAL,
+          '(?:' + '|'.join(re.escape(s) for s in QUESTION_STARTERS) + ')', False)] +
+        [(Intent.PLAY_MEDIA, p, True) for p in PLAY_PATTERNS] +
+        [(Intent.OPEN_WEBSITE, p, True) for p in OPEN_TARGET_PATTERNS]
+    )
+
+    branches = []
+    for i, (intent, pattern, _) in enumerate(sources):
+        branches.append(f'(?P<b{i}>{pattern})')
+    automaton = re.compile('|'.join(branches))
+
+    # The captured target is the first group inside its branch
+    table = {}
+    for i, (intent, _, has_target) in enumerate(sources):
+        name = f'b{i}'
+        target_group = automaton.groupindex[name] + 1 if has_target else None
+        table[name] = (intent, target_group)
+
+    return automaton, table
+
+
+_INTENT_AUTOMATON, _INTENT_BRANCHES = _compile_intent_automaton()
+
+
+# =============================================================================
+# KEYWORD TIERS (shared Aho-Corasick automaton)
+# =============================================================================
+
+SCREENSHOT_KEYWORDS = ['screenshot', 'screen shot', 'capture', 'snap']
+
+SYSTEM_KEYWORDS = ['shutdown', 'restart', 'lock', 'sleep', 'hibernate',
+                   'minimize', 'maximize', 'close', 'status', 'battery']
+
+BROWSER_KEYWORDS = ['new tab', 'close tab', 'refresh', 'next tab', 'switch tab']
+
+ESSAY_KEYWORDS = ['write an essay', 'write essay', 'compose an essay',
+                  'write a document', 'write a letter', 'write a report']
+
+FILE_OP_KEYWORDS = ['create folder', 'delete file', 'new folder', 'remove']
+
+MULTI_STEP_KEYWORDS = ['open', 'then', 'after']
+
+_KEYWORDS = get_keyword_engine()
+_KEYWORDS.register("sentinel.screenshot", SCREENSHOT_KEYWORDS)
+_KEYWORDS.register("sentinel.system", SYSTEM_KEYWORDS)
+_KEYWORDS.register("sentinel.browser", BROWSER_KEYWORDS)
+_KEYWORDS.register("sentinel.essay", ESSAY_KEYWORDS)
+_KEYWORDS.register("sentinel.file_op", FILE_OP_KEYWORDS)
+_KEYWORDS.register("sentinel.multi_step", MULTI_STEP_KEYWORDS)
+
 
 # =============================================================================
 # ABSOLUTE DOMAIN MAPPING - NO GUESSING
@@ -169,6 +254,18 @@ DOMAIN_MAP = {
     "figma": "https://www.figma.com",
 }
 
+# Apps the classifier recognizes in "open X"
+APP_NAMES = ['notepad', 'calculator', 'calc', 'explorer', 'settings', 
+             'word', 'excel', 'powerpoint', 'chrome', 'brave', 
+             'firefox', 'vscode', 'code', 'terminal', 'cmd', 
+             'powershell', 'whatsapp', 'discord', 'spotify', 'slack',
+             'task manager', 'file explorer']
+
+# Typo-tolerant lookup for near-miss names ("you tube", "git hub")
+_RESOLVER = get_fuzzy_resolver()
+_RESOLVER.register("domain_map", DOMAIN_MAP, "website")
+_RESOLVER.register("sentinel_apps", {name: name for name in APP_NAMES}, "app")
+
 
 # =============================================================================
 # ACTION EXECUTION GUARD
@@ -191,6 +288,11 @@ class ActionGuard:
     """
     Prevents infinite loops and duplicate actions.
     CRITICAL SAFETY LAYER - DO NOT BYPASS.
+    
+    Duplicate checks are O(1): each (action, target) key keeps a deque of
+    its recent (sequence, timestamp) records, and a time-bucketed index
+    expires stale keys. Sequence numbers preserve the 50-action history
+    window. Times come from a monotonic clock (injectable for tests).
     """
     
     # Cooldown in seconds before same action can repeat
@@ -199,52 +301,105 @@ class ActionGuard:
     # Max times an action can repeat before hard block
     MAX_REPEATS = 2
     
-    def __init__(self):
-        self.history: deque = deque(maxlen=50)  # Last 50 actions
+    # Only the last N recorded actions count as history
+    HISTORY_SIZE = 50
+    
+    # Hard block duration after MAX_REPEATS
+    BLOCK_SECONDS = 30
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.history: deque = deque(maxlen=self.HISTORY_SIZE)  # Last 50 actions (audit trail)
         self.repeat_counts: Dict[str, int] = {}
         self.blocked_until: float = 0
         self.last_action_time: float = 0
+        
+        self._seq = 0
+        # key -> deque of (seq, timestamp), oldest first
+        self._recent: Dict[Tuple[str, str], deque] = {}
+        # expiry bucket -> keys recorded in it
+        self._buckets: Dict[int, List[Tuple[str, str]]] = {}
+        self._oldest_bucket = None
     
     def _action_key(self, action_type: str, target: str) -> str:
         """Generate unique key for action"""
         return f"{action_type}:{target.lower()}"
     
+    def _bucket(self, timestamp: float) -> int:
+        return int(timestamp // self.ACTION_COOLDOWN)
+    
+    def _prune(self, key: Tuple[str, str], now: float) -> Optional[deque]:
+        """Drop records of key that left the history window or the cooldown."""
+        recent = self._recent.get(key)
+        if recent is None:
+            return None
+        oldest_seq = self._seq - self.HISTORY_SIZE
+        while recent and (recent[0][0] <= oldest_seq or
+                          now - recent[0][1] >= self.ACTION_COOLDOWN):
+            recent.popleft()
+        if not recent:
+            del self._recent[key]
+            return None
+        return recent
+    
+    def _expire(self, now: float):
+        """Prune keys from buckets that are entirely past the cooldown."""
+        if self._oldest_bucket is None:
+            return
+        last_expired = self._bucket(now - self.ACTION_COOLDOWN) - 1
+        while self._oldest_bucket <= last_expired:
+            for key in self._buckets.pop(self._oldest_bucket, ()):
+                self._prune(key, now)
+            self._oldest_bucket += 1
+        if not self._buckets:
+            self._oldest_bucket = None
+    
     def can_execute(self, action_type: str, target: str) -> Tuple[bool, str]:
         """
         Check if action can be executed.
         Returns (allowed, reason)
         """
-        now = time.time()
-        key = self._action_key(action_type, target)
+        now = self.clock()
         
         # Check if globally blocked
         if now < self.blocked_until:
             return False, "System paused due to repeated actions. Say 'continue' to resume."
         
-        # Check recent history for duplicates
-        for action in self.history:
-            if action.matches(action_type, target):
-                time_diff = now - action.timestamp
-                
-                if time_diff < self.ACTION_COOLDOWN:
-                    # Increment repeat count
-                    self.repeat_counts[key] = self.repeat_counts.get(key, 0) + 1
-                    
-                    if self.repeat_counts[key] >= self.MAX_REPEATS:
-                        # Hard block
-                        self.blocked_until = now + 30  # 30 second cooldown
-                        return False, f"Blocked: '{target}' was requested {self.MAX_REPEATS}+ times. Pausing for safety."
-                    
-                    return False, f"Already done. {target} was just opened {time_diff:.1f}s ago."
+        self._expire(now)
+        
+        # Oldest matching action still inside the cooldown (and the history)
+        recent = self._prune((action_type, target.lower()), now)
+        if recent:
+            key = self._action_key(action_type, target)
+            time_diff = now - recent[0][1]
+            
+            # Increment repeat count
+            self.repeat_counts[key] = self.repeat_counts.get(key, 0) + 1
+            
+            if self.repeat_counts[key] >= self.MAX_REPEATS:
+                # Hard block
+                self.blocked_until = now + self.BLOCK_SECONDS
+                return False, f"Blocked: '{target}' was requested {self.MAX_REPEATS}+ times. Pausing for safety."
+            
+            return False, f"Already done. {target} was just opened {time_diff:.1f}s ago."
         
         return True, "OK"
     
     def record(self, action_type: str, target: str):
         """Record an executed action"""
-        now = time.time()
+        now = self.clock()
         self.history.append(ExecutedAction(action_type, target, now))
         self.last_action_time = now
         
+        self._seq += 1
+        index_key = (action_type, target.lower())
+        self._recent.setdefault(index_key, deque()).append((self._seq, now))
+        bucket = self._bucket(now)
+        self._buckets.setdefault(bucket, []).append(index_key)
+        if self._oldest_bucket is None or bucket < self._oldest_bucket:
+            self._oldest_bucket = bucket
+        self._expire(now)
+        
         # Decay repeat counts over time
         key = self._action_key(action_type, target)
         if key in self.repeat_counts:
@@ -255,6 +410,9 @@ class ActionGuard:
         self.history.clear()
         self.repeat_counts.clear()
         self.blocked_until = 0
+        self._recent.clear()
+        self._buckets.clear()
+        self._oldest_bucket = None
     
     def force_unblock(self):
         """Unblock after user confirmation"""
@@ -426,45 +584,40 @@ class IntentClassifier:
     """
     
     @staticmethod
-    def classify(text: str) -> Tuple[Intent, Optional[str]]:
+    def classify(text: Union[str, Utterance]) -> Tuple[Intent, Optional[str]]:
         """
         Classify user input into an intent.
         Returns (Intent, extracted_target or None)
         """
-        text_lower = text.lower().strip()
-        
+        # Pure function of the text - memoized on the utterance
+        return Utterance.of(text).derive("sentinel.intent", IntentClassifier._classify)
+    
+    @staticmethod
+    def _classify(utterance: Utterance) -> Tuple[Intent, Optional[str]]:
+        text_lower = utterance.lower
+
+        # 1-5. STOP > CONVERSATIONAL > QUESTION > PLAY > OPEN
+        # One scan of the compiled automaton, branches are in priority order
+        match = _INTENT_AUTOMATON.match(text_lower)
+        intent, target_group = _INTENT_BRANCHES[match.lastgroup] if match else (None, None)
+
         # 1. STOP COMMANDS - Highest priority
-        for pattern in STOP_PATTERNS:
-            if re.match(pattern, text_lower):
-                return Intent.STOP_COMMAND, None
-        
-        # 2. CONVERSATIONAL - Check before any action
-        for pattern in CONVERSATIONAL_PATTERNS:
-            if re.match(pattern, text_lower):
-                return Intent.CONVERSATIONAL, text_lower
-        
-        # 3. Check for question words (not action requests)
-        question_starters = ['what', 'how', 'why', 'when', 'where', 'who', 
-                           'is it', 'are you', 'can you', 'do you', 'does it',
-                           'would', 'could', 'should', 'will it', 'explain', 'tell me']
-        
-        for starter in question_starters:
-            if text_lower.startswith(starter):
-                # It's a question, not an action
-                return Intent.CONVERSATIONAL, text_lower
-        
+        if intent == Intent.STOP_COMMAND:
+            return Intent.STOP_COMMAND, None
+
+        # 2-3. CONVERSATIONAL / QUESTIONS - never actions
+        if intent == Intent.CONVERSATIONAL:
+            return Intent.CONVERSATIONAL, text_lower
+
         # 4. PLAY MEDIA
-        for pattern in PLAY_PATTERNS:
-            match = re.match(pattern, text_lower)
-            if match:
-                song = match.group(1).strip()
-                return Intent.PLAY_MEDIA, song
-        
+        if intent == Intent.PLAY_MEDIA:
+            song = match.group(target_group).strip()
+            return Intent.PLAY_MEDIA, song
+
         # 5. WEBSITE - Check domain map first
         # Pattern: "open X" where X is a known site
-        open_match = re.match(r'(?:open|go\s*to|visit|launch)\s+(.+?)(?:\s*\.com|\s*\.pk|\s*\.org)?$', text_lower)
-        if open_match:
-            target = open_match.group(1).strip()
+        if intent == Intent.OPEN_WEBSITE:
+            target = match.group(target_group).strip()
             
             # Remove common suffixes
             target = re.sub(r'\s*(website|site|page|app)$', '', target).strip()
@@ -474,42 +627,41 @@ class IntentClassifier:
                 return Intent.OPEN_WEBSITE, target
             
             # Check if it's a known app
-            app_names = ['notepad', 'calculator', 'calc', 'explorer', 'settings', 
-                        'word', 'excel', 'powerpoint', 'chrome', 'brave', 
-                        'firefox', 'vscode', 'code', 'terminal', 'cmd', 
-                        'powershell', 'whatsapp', 'discord', 'spotify', 'slack',
-                        'task manager', 'file explorer']
-            
-            if target in app_names:
+            if target in APP_NAMES:
                 return Intent.OPEN_APP, target
             
             # Check for domain-like patterns (has .com, .org, etc.)
             if re.search(r'\.(com|org|net|pk|io|ai|dev|co)$', target):
                 return Intent.OPEN_WEBSITE, target
             
+            # Near-miss names from speech ("you tube", "git hub")
+            near = _RESOLVER.resolve(target, kinds=("website", "app"))
+            if near:
+                if near.kind == "app":
+                    return Intent.OPEN_APP, near.name
+                return Intent.OPEN_WEBSITE, near.name
+            
             # Unknown target - might be website or app
             # Default to website but mark as potentially unknown
             return Intent.OPEN_WEBSITE, target
         
+        # 6-12. KEYWORD TIERS - one automaton pass reports every category hit
+        hits = utterance.keyword_categories()
+        
         # 6. SCREENSHOT
-        if any(kw in text_lower for kw in ['screenshot', 'screen shot', 'capture', 'snap']):
+        if "sentinel.screenshot" in hits:
             return Intent.SCREENSHOT, None
         
         # 7. SYSTEM CONTROL
-        system_keywords = ['shutdown', 'restart', 'lock', 'sleep', 'hibernate',
-                         'minimize', 'maximize', 'close', 'status', 'battery']
-        if any(kw in text_lower for kw in system_keywords):
+        if "sentinel.system" in hits:
             return Intent.SYSTEM_CONTROL, text_lower
         
         # 8. BROWSER CONTROL
-        browser_keywords = ['new tab', 'close tab', 'refresh', 'next tab', 'switch tab']
-        if any(kw in text_lower for kw in browser_keywords):
+        if "sentinel.browser" in hits:
             return Intent.BROWSER_CONTROL, text_lower
         
         # 9. ESSAY/DOCUMENT WRITING - Must come BEFORE TYPE_TEXT
-        essay_patterns = ['write an essay', 'write essay', 'compose an essay',
-                         'write a document', 'write a letter', 'write a report']
-        if any(pattern in text_lower for pattern in essay_patterns):
+        if "sentinel.essay" in hits:
             # Extract topic
             topic = re.sub(r'^(write|compose|create)\s+(an?\s+)?(essay|document|letter|report)\s+(about|on|regarding)?\s*', '', text_lower)
             return Intent.MULTI_STEP, topic.strip() if topic.strip() else text_lower
@@ -520,13 +672,12 @@ class IntentClassifier:
             return Intent.TYPE_TEXT, content
         
         # 11. FILE OPERATION
-        if any(kw in text_lower for kw in ['create folder', 'delete file', 'new folder', 'remove']):
+        if "sentinel.file_op" in hits:
             return Intent.FILE_OPERATION, text_lower
         
         # 12. MULTI-STEP (contains "and")
-        if ' and ' in text_lower and any(kw in text_lower for kw in ['open', 'then', 'after']):
+        if ' and ' in text_lower and "sentinel.multi_step" in hits:
             return Intent.MULTI_STEP, text_lower
-        
         # Default: Unknown - pass to LLM for intelligent handling
         return Intent.UNKNOWN, text_lower
 
@@ -548,10 +699,10 @@ class SentinelCore:
         
         print("[SENTINEL] Core initialized - Safety systems online")
     
-    def process(self, user_input: str) -> dict:
+    def process(self, user_input: Union[str, Utterance]) -> dict:
         """
-        Process user input and return action plan.
-        This is the main entry point.
+        Process user input (text or an already normalized Utterance) and
+        return action plan. This is the main entry point.
         
         Returns:
             {
@@ -562,7 +713,8 @@ class SentinelCore:
                 "reason": "..."
             }
         """
-        user_input = user_input.strip()
+        utterance = Utterance.of(user_input)
+        user_input = utterance.text
         
         if not user_input:
             return {
@@ -574,7 +726,7 @@ class SentinelCore:
             }
         
         # Classify intent
-        intent, target = self.classifier.classify(user_input)
+        intent, target = self.classifier.classify(utterance)
         
         # Handle based on intent
         if intent == Intent.STOP_COMMAND:
@@ -626,6 +778,18 @@ class SentinelCore:
             "reason": "unknown_intent"
         }
     
+    def record_cached(self, user_input: str, intent: Intent, plan: list):
+        """
+        Update the session context for a plan served from the plan cache,
+        which skips process() and its handlers.
+        """
+        if intent == Intent.CONVERSATIONAL:
+            self.context.conversation_count += 1
+        for step in plan:
+            action = step.get("action")
+            if action not in ("CHAT", "RESPONSE"):
+                self.context.update(user_input, action, str(step.get("payload", "")))
+    
     def _handle_stop(self) -> dict:
         """Handle stop/cancel command"""
         self.guard.clear()
@@ -637,74 +801,59 @@ class SentinelCore:
             "reason": ""
         }
     
-    def _handle_conversation(self, user_input: str, target: str) -> dict:
-        """Handle conversational input - simple greetings locally, questions to LLM"""
-        self.context.conversation_count += 1
-        
-        text_lower = (target or user_input).lower().strip()
-        
-        # SIMPLE GREETINGS - handle locally
+    @staticmethod
+    def local_reply_kind(text_lower: str) -> Optional[str]:
+        """
+        Kind of canned reply for small talk answered locally ("greeting",
+        "goodbye", "thanks", "capabilities", "identity", "wellbeing"), or
+        None when the conversation needs the LLM. No side effects.
+        """
+        # SIMPLE GREETINGS (hi there, hello friend)
         if text_lower in ['hello', 'hi', 'hey', 'yo', 'sup', 'howdy']:
-            return {
-                "intent": Intent.CONVERSATIONAL,
-                "plan": [{"action": "RESPONSE", "payload": Personality.get("greeting")}],
-                "response": Personality.get("greeting"),
-                "blocked": False,
-                "reason": ""
-            }
-        
-        # Greetings with extras (hi there, hello friend)
+            return "greeting"
         if re.match(r'^(hello|hi|hey|yo)\b', text_lower) and len(text_lower.split()) <= 3:
-            return {
-                "intent": Intent.CONVERSATIONAL,
-                "plan": [{"action": "RESPONSE", "payload": Personality.get("greeting")}],
-                "response": Personality.get("greeting"),
-                "blocked": False,
-                "reason": ""
-            }
+            return "greeting"
         
-        # GOODBYES - handle locally
+        # GOODBYES
         if any(g in text_lower for g in ['bye', 'goodbye', 'see ya', 'later']):
-            return {
-                "intent": Intent.CONVERSATIONAL,
-                "plan": [{"action": "RESPONSE", "payload": Personality.get("goodbye")}],
-                "response": Personality.get("goodbye"),
-                "blocked": False,
-                "reason": ""
-            }
+            return "goodbye"
         
-        # THANKS - handle locally
+        # THANKS
         if any(g in text_lower for g in ['thank', 'thanks', 'thx']):
-            return {
-                "intent": Intent.CONVERSATIONAL,
-                "plan": [{"action": "RESPONSE", "payload": Personality.get("thanks")}],
-                "response": Personality.get("thanks"),
-                "blocked": False,
-                "reason": ""
-            }
+            return "thanks"
         
-        # Simple bot questions - handle locally
+        # Simple bot questions
         if text_lower in ['what can you do', 'what are your capabilities', 'help']:
-            return {
-                "intent": Intent.CONVERSATIONAL,
-                "plan": [{"action": "RESPONSE", "payload": Personality.get("capabilities")}],
-                "response": Personality.get("capabilities"),
-                "blocked": False,
-                "reason": ""
-            }
-        
+            return "capabilities"
         if text_lower in ['who are you', 'what are you']:
-            response = "SENTINEL-X. Your AI assistant. Built for speed and precision."
-            return {
-                "intent": Intent.CONVERSATIONAL,
-                "plan": [{"action": "RESPONSE", "payload": response}],
-                "response": response,
-                "blocked": False,
-                "reason": ""
-            }
-        
+            return "identity"
         if text_lower in ['how are you', "how're you"]:
-            response = "Operational. Systems nominal."
+            return "wellbeing"
+        return None
+    
+    def defers_to_llm(self, intent: Intent, target: Optional[str], user_input: str) -> bool:
+        """
+        True when process() would hand this classified input to the LLM
+        (empty plan, not blocked). Used to decide whether to start a
+        speculative LLM request; no side effects.
+        """
+        if intent == Intent.CONVERSATIONAL:
+            return self.local_reply_kind((target or user_input).lower().strip()) is None
+        return intent in (Intent.MULTI_STEP, Intent.FILE_OPERATION,
+                          Intent.SEARCH_QUERY, Intent.UNKNOWN)
+    
+    def _handle_conversation(self, user_input: str, target: str) -> dict:
+        """Handle conversational input - simple greetings locally, questions to LLM"""
+        self.context.conversation_count += 1
+        
+        kind = self.local_reply_kind((target or user_input).lower().strip())
+        if kind is not None:
+            if kind == "identity":
+                response = "SENTINEL-X. Your AI assistant. Built for speed and precision."
+            elif kind == "wellbeing":
+                response = "Operational. Systems nominal."
+            else:
+                response = Personality.get(kind)
             return {
                 "intent": Intent.CONVERSATIONAL,
                 "plan": [{"action": "RESPONSE", "payload": response}],
@@ -730,10 +879,14 @@ class SentinelCore:
         target_clean = target.lower().strip()
         target_clean = re.sub(r'\s*(website|site|page)$', '', target_clean).strip()
         
-        # Check domain map FIRST
-        if target_clean in DOMAIN_MAP:
-            url = DOMAIN_MAP[target_clean]
-            
+        # Check domain map FIRST, then near-miss names ("you tube")
+        url = DOMAIN_MAP.get(target_clean)
+        if url is None:
+            near = _RESOLVER.resolve(target_clean, kinds=("website",))
+            if near:
+                target_clean, url = near.name, near.value
+        
+        if url:
             # Safety check
             allowed, reason = self.guard.can_execute("BROWSER", target_clean)
             if not allowed:
@@ -763,7 +916,7 @@ class SentinelCore:
                 "intent": Intent.OPEN_WEBSITE,
                 "plan": [
                     {"action": "BROWSER_DIRECT", "payload": url},
-                    {"action": "RESPONSE", "payload": f"Opening {target_clean}."}
+                    {"action": "RESPONSE", "payload": f"Opening {target_clean}.", "after": []}
                 ],
                 "response": f"Opening {target_clean}.",
                 "blocked": False,
@@ -811,7 +964,7 @@ class SentinelCore:
             "intent": Intent.OPEN_APP,
             "plan": [
                 {"action": "LAUNCH_SYS", "payload": target},
-                {"action": "RESPONSE", "payload": f"Launching {target}."}
+                {"action": "RESPONSE", "payload": f"Launching {target}.", "after": []}
             ],
             "response": f"Launching {target}.",
             "blocked": False,
@@ -847,7 +1000,7 @@ class SentinelCore:
             "intent": Intent.PLAY_MEDIA,
             "plan": [
                 {"action": "PLAY_MUSIC", "payload": song},
-                {"action": "RESPONSE", "payload": f"Playing {song}."}
+                {"action": "RESPONSE", "payload": f"Playing {song}.", "after": []}
             ],
             "response": f"Playing {song}.",
             "blocked": False,
@@ -0,0 +1,106 @@
+"""
+Shortcut Index - Inverted-Index Intent Scorer
+Precomputed word -> pattern index for Windows shortcut intent matching.
+Scoring only touches patterns that share a word with the input (or are
+contained in it), so cost tracks the input, not the vocabulary size.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.keyword_engine import KeywordAutomaton, get_keyword_engine
+
+
+class ShortcutIndex:
+    """
+    Inverted index over an INTENT_PATTERNS-style table
+    ({shortcut_key: [phrase, ...]}).
+
+    Scores are identical to the original linear matcher:
+    - EXACT: text == phrase -> 1.0 (first phrase in table order wins)
+    - CONTAINS: phrase in text -> len(phrase) / len(text) * 0.9
+    - PARTIAL: >= 50% of phrase words in text -> common / words * 0.7
+    Ties go to the phrase that comes first in table order.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]],
+                 engine: Optional[KeywordAutomaton] = None,
+                 category: str = "shortcut"):
+        """
+        Args:
+            patterns: Mapping of shortcut key to trigger phrases
+            engine: Keyword automaton used for containment (shared one by default)
+            category: Category the phrases are registered under in the automaton
+        """
+        self.engine = engine or get_keyword_engine()
+        self.category = category
+
+        # Per-pattern precomputed data, indexed by pattern id (table order)
+        self.keys: List[str] = []
+        self.lengths: List[int] = []
+        self.word_counts: List[int] = []
+
+        self.exact: Dict[str, str] = {}
+        self.word_index: Dict[str, List[int]] = {}
+
+        phrases = []
+        for shortcut_key, key_patterns in patterns.items():
+            for pattern in key_patterns:
+                pattern_lower = pattern.lower()
+                pattern_id = len(self.keys)
+                pattern_words = set(pattern_lower.split())
+
+                self.keys.append(shortcut_key)
+                self.lengths.append(len(pattern_lower))
+                self.word_counts.append(len(pattern_words))
+                self.exact.setdefault(pattern_lower, shortcut_key)
+                for word in pattern_words:
+                    self.word_index.setdefault(word, []).append(pattern_id)
+                phrases.append((pattern_lower, pattern_id))
+
+        self.engine.register(category, phrases)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def score(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Best (shortcut_key, score) for already-normalized text, or (None, 0).
+        No threshold is applied here.
+        """
+        # EXACT MATCH - Highest priority
+        if text in self.exact:
+            return (self.exact[text], 1.0)
+
+        if not text:
+            return (None, 0)
+
+        # CONTAINS candidates - one automaton pass
+        contained = {hit.value for hit in self.engine.scan(text, {self.category})}
+
+        # PARTIAL candidates - count shared words via the inverted index
+        common: Dict[int, int] = {}
+        for word in set(text.split()):
+            for pattern_id in self.word_index.get(word, ()):
+                common[pattern_id] = common.get(pattern_id, 0) + 1
+
+        best_id = None
+        best_score = 0
+        text_len = len(text)
+
+        for pattern_id in sorted(contained.union(common)):
+            if pattern_id in contained:
+                score = self.lengths[pattern_id] / text_len * 0.9
+            else:
+                shared = common[pattern_id]
+                words = self.word_counts[pattern_id]
+                if shared < words * 0.5:
+                    continue
+                score = shared / words * 0.7
+
+            if score > best_score:
+                best_score = score
+                best_id = pattern_id
+
+        if best_id is None:
+            return (None, 0)
+        return (self.keys[best_id], best_score)
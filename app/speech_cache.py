@@ -0,0 +1,282 @@
+"""
+Speech Cache - Content-Addressed Store of Synthesized Speech
+Most replies are canned (the Personality lists, "Opening Chrome.") and were
+re-synthesized through Edge-TTS every time they were said. Synthesized
+audio is now stored under the runtime audio directory, one file per
+(text, voice, rate), named by the hash of the three. A cached reply plays
+without any synthesis; the directory is kept under a size bound by
+evicting the least recently played files.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+try:
+    import edge_tts
+except ImportError:
+    edge_tts = None
+
+from app import get_runtime_audio_dir
+from app.sentinel_core import Personality
+
+
+# Edge-TTS voice and rate of the spoken (non-SAPI) replies
+EDGE_VOICE = "en-GB-RyanNeural"
+EDGE_RATE = "+10%"
+
+# Disk space the cache may use before the least recently played files go
+SPEECH_CACHE_MB = float(os.getenv("SPEECH_CACHE_MB", "32"))
+# Phrases synthesized at once while pre-rendering
+PRERENDER_CONCURRENCY = 4
+
+_partial_ids = itertools.count()
+
+
+def speech_key(text: str, voice: str, rate: str) -> str:
+    """Content address of a phrase: hash of (text, voice, rate)."""
+    text = " ".join(text.split())
+    return hashlib.sha256(f"{voice}\0{rate}\0{text}".encode("utf-8")).hexdigest()[:32]
+
+
+async def edge_audio(text: str, voice: str = EDGE_VOICE, rate: str = EDGE_RATE):
+    """Edge-TTS MP3 audio for `text`, chunk by chunk as it is synthesized."""
+    if edge_tts is None:
+        raise RuntimeError("edge_tts is not installed")
+    comm = edge_tts.Communicate(text, voice, rate=rate)
+    async for chunk in comm.stream():
+        if chunk["type"] == "audio":
+            yield chunk["data"]
+
+
+async def edge_synthesize(text: str, voice: str, rate: str, path: str):
+    """Synthesize `text` with Edge-TTS into an MP3 file."""
+    with open(path, "wb") as f:
+        async for data in edge_audio(text, voice, rate):
+            f.write(data)
+
+
+def static_phrases() -> List[str]:
+    """Every Personality reply that has no {placeholder} to fill in."""
+    phrases = []
+    for name, value in vars(Personality).items():
+        if name.isupper():
+            for phrase in ([value] if isinstance(value, str) else value):
+                if "{" not in phrase and phrase not in phrases:
+                    phrases.append(phrase)
+    return phrases
+
+
+@dataclass
+class SpeechCacheStats:
+    """Counters since startup"""
+    hits: int = 0
+    misses: int = 0
+    rendered: int = 0
+    evictions: int = 0
+    render_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SpeechCache:
+    """
+    Thread-safe LRU of audio files, bounded by total size. Recency is the
+    file's mtime (touched on every hit), so it survives restarts.
+    """
+
+    DIRNAME = "speech_cache"
+    EXTENSION = ".mp3"
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = int(SPEECH_CACHE_MB * 1024 * 1024),
+                 synthesize: Callable[[str, str, str, str], Awaitable[None]] = edge_synthesize):
+        """
+        Args:
+            directory: Where audio files live (default: <runtime audio dir>/speech_cache)
+            max_bytes: Total size kept on disk (least recently played evicted first)
+            synthesize: async (text, voice, rate, path) writing the audio file
+        """
+        self.directory = directory or os.path.join(get_runtime_audio_dir(), self.DIRNAME)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.synthesize = synthesize
+        self.stats = SpeechCacheStats()
+        self._lock = threading.Lock()
+        # key -> file size, least recently played first
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._scan()
+
+    # ==================== LOOKUP ====================
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.EXTENSION)
+
+    def get(self, text: str, voice: str = EDGE_VOICE, rate: str = EDGE_RATE) -> Optional[str]:
+        """Path of the cached audio for this phrase, or None."""
+        key = speech_key(text, voice, rate)
+        with self._lock:
+            if key not in self._files:
+                self.stats.misses += 1
+                return None
+            self._files.move_to_end(key)
+            self.stats.hits += 1
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Deleted behind our back (temp dir cleanup)
+            with self._lock:
+                self._bytes -= self._files.pop(key, 0)
+            return None
+        return path
+
+    # ==================== RENDER ====================
+
+    async def render(self, text: str, voice: str = EDGE_VOICE, rate: str = EDGE_RATE) -> Optional[str]:
+        """Path of the phrase's audio, synthesizing it first on a miss (None on failure)."""
+        path = self.get(text, voice, rate)
+        if path is not None:
+            return path
+        key = speech_key(text, voice, rate)
+        path = self.path_for(key)
+        # Unique partial file, so two renders of one phrase can't clash
+        partial = f"{path}.{next(_partial_ids)}.part"
+        start = time.perf_counter()
+        try:
+            await self.synthesize(text, voice, rate, partial)
+            size = os.path.getsize(partial)
+            if not size:
+                os.remove(partial)
+                return None
+            os.replace(partial, path)
+        except Exception as e:
+            print(f"[SPEECH CACHE] Synthesis failed for \"{text}\": {e}")
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+            return None
+        self._add(key, size, time.perf_counter() - start)
+        return path
+
+    def put(self, text: str, audio: bytes, voice: str = EDGE_VOICE, rate: str = EDGE_RATE) -> Optional[str]:
+        """Store audio synthesized elsewhere (e.g. while it was streamed to the speaker)."""
+        if not audio:
+            return None
+        key = speech_key(text, voice, rate)
+        path = self.path_for(key)
+        partial = f"{path}.{next(_partial_ids)}.part"
+        try:
+            with open(partial, "wb") as f:
+                f.write(audio)
+            os.replace(partial, path)
+        except OSError as e:
+            print(f"[SPEECH CACHE] Could not store \"{text}\": {e}")
+            return None
+        self._add(key, len(audio))
+        return path
+
+    def _add(self, key: str, size: int, render_seconds: float = 0.0):
+        with self._lock:
+            self.stats.rendered += 1
+            self.stats.render_seconds += render_seconds
+            self._bytes += size - self._files.get(key, 0)
+            self._files[key] = size
+            self._files.move_to_end(key)
+            self._evict()
+
+    async def prerender(self, phrases: Iterable[str], voice: str = EDGE_VOICE,
+                        rate: str = EDGE_RATE) -> int:
+        """Make sure every phrase is cached; returns how many were synthesized."""
+        semaphore = asyncio.Semaphore(PRERENDER_CONCURRENCY)
+        before = self.stats.rendered
+
+        async def one(text):
+            async with semaphore:
+                await self.render(text, voice, rate)
+
+        await asyncio.gather(*(one(text) for text in phrases))
+        return self.stats.rendered - before
+
+    def prerender_in_background(self, phrases: Iterable[str], voice: str = EDGE_VOICE,
+                                rate: str = EDGE_RATE) -> threading.Thread:
+        """prerender() on its own thread and event loop (for blocking callers)."""
+        phrases = list(phrases)
+
+        def run():
+            count = asyncio.run(self.prerender(phrases, voice, rate))
+            print(f"[SPEECH CACHE] {count} phrases pre-rendered, "
+                  f"{len(self)} cached ({self.size_bytes / 1024:.0f} KB)")
+
+        thread = threading.Thread(target=run, name="speech-prerender", daemon=True)
+        thread.start()
+        return thread
+
+    # ==================== EVICTION ====================
+
+    def _evict(self):
+        # Keep at least the newest file, even if it alone exceeds the bound
+        while self._bytes > self.max_bytes and len(self._files) > 1:
+            key, size = self._files.popitem(last=False)
+            self._bytes -= size
+            self.stats.evictions += 1
+            try:
+                os.remove(self.path_for(key))
+            except OSError:
+                pass
+
+    def _scan(self):
+        """Index files left by earlier runs, oldest played first."""
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".part"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            elif name.endswith(self.EXTENSION):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name[:-len(self.EXTENSION)], stat.st_size))
+        with self._lock:
+            for _, key, size in sorted(entries):
+                self._files[key] = size
+                self._bytes += size
+            self._evict()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self):
+        return len(self._files)
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_speech_cache = None
+_speech_cache_lock = threading.Lock()
+
+def get_speech_cache() -> SpeechCache:
+    """Get or create the shared speech cache (SPEECH_CACHE_MB)"""
+    global _speech_cache
+    if _speech_cache is None:
+        with _speech_cache_lock:
+            if _speech_cache is None:
+                _speech_cache = SpeechCache()
+    return _speech_cache
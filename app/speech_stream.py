@@ -0,0 +1,252 @@
+"""
+Speech Stream - Play Edge-TTS Audio While It Is Synthesized
+Edge-TTS delivers MP3 in small chunks. Instead of writing the whole reply
+to a file and loading it afterwards (first audio = full synthesis time),
+the chunks are split into MP3 frames, and the frames received so far are
+decoded into a pygame Sound and queued on a mixer channel. Playback starts
+with the first frames and each later segment is queued while the previous
+one plays.
+
+Each segment after the first is decoded together with the last frame of
+the segment before it (MP3 frames borrow bits from their predecessors),
+and that frame's samples are trimmed off again, so segments join without
+clicks.
+"""
+
+import asyncio
+import io
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Tuple
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+# Shortest segment queued while audio is still playing (the first one
+# goes out as soon as any frame arrives)
+MIN_SEGMENT_SECONDS = 0.2
+# How often the player checks whether the channel wants the next segment
+STREAM_POLL_SECONDS = 0.01
+
+
+# =============================================================================
+# MP3 FRAMES
+# =============================================================================
+
+# Layer III bitrates (kbps) by bitrate index; MPEG-1, then MPEG-2 / 2.5
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+def mp3_frame_info(header: bytes) -> Optional[Tuple[int, float]]:
+    """(frame length in bytes, seconds of audio) of a Layer III frame header, or None."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 3
+    layer = (header[1] >> 1) & 3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    padding = (header[2] >> 1) & 1
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    if version == 3:
+        bitrate = _BITRATES_V1[bitrate_index] * 1000
+        return 144 * bitrate // sample_rate + padding, 1152 / sample_rate
+    bitrate = _BITRATES_V2[bitrate_index] * 1000
+    return 72 * bitrate // sample_rate + padding, 576 / sample_rate
+
+
+class Mp3Frames:
+    """Splits an MP3 byte stream, fed in arbitrary chunks, into whole frames."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._started = False
+        self.skipped = 0    # Bytes that were not part of a frame
+
+    def feed(self, data: bytes) -> List[Tuple[bytes, float]]:
+        """Frames completed by `data`, as (frame bytes, seconds)."""
+        buffer = self._buffer
+        buffer.extend(data)
+        if not self._started:
+            # An ID3v2 tag may precede the first frame
+            if len(buffer) < 10:
+                return []
+            if buffer[:3] == b"ID3":
+                size = 10 + (buffer[6] << 21 | buffer[7] << 14 | buffer[8] << 7 | buffer[9])
+                if len(buffer) < size:
+                    return []
+                del buffer[:size]
+            self._started = True
+        frames = []
+        pos = 0
+        while len(buffer) - pos >= 4:
+            info = mp3_frame_info(buffer[pos:pos + 4])
+            if info is None:
+                pos += 1
+                self.skipped += 1
+                continue
+            length, seconds = info
+            if len(buffer) - pos < length:
+                break
+            frames.append((bytes(buffer[pos:pos + length]), seconds))
+            pos += length
+        del buffer[:pos]
+        return frames
+
+
+# =============================================================================
+# OUTPUTS
+# =============================================================================
+
+class MixerOutput:
+    """Queues decoded segments on one pygame mixer channel (one playing, one waiting)."""
+
+    def __init__(self):
+        self._channel = None
+        self._sounds: deque = deque(maxlen=2)   # Keep queued Sounds alive
+        self.started_at: Optional[float] = None
+
+    def queue(self, data: bytes, seconds: float, warmup: bytes = b"", warmup_seconds: float = 0.0):
+        """
+        Args:
+            data: Whole MP3 frames
+            seconds: Audio duration of data
+            warmup: Frame preceding data, decoded first and trimmed off
+            warmup_seconds: Audio duration of warmup
+        """
+        sound = pygame.mixer.Sound(file=io.BytesIO(warmup + data))
+        if warmup:
+            frequency, size, channels = pygame.mixer.get_init()
+            skip = int(warmup_seconds * frequency) * (abs(size) // 8) * channels
+            sound = pygame.mixer.Sound(buffer=sound.get_raw()[skip:])
+        self._sounds.append(sound)
+        if self._channel is None or not self._channel.get_busy():
+            self._channel = sound.play()
+        else:
+            self._channel.queue(sound)
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+
+    def ready(self) -> bool:
+        """True when another segment can be queued."""
+        return self._channel is None or self._channel.get_queue() is None
+
+    def busy(self) -> bool:
+        return self._channel is not None and self._channel.get_busy()
+
+    def stop(self):
+        if self._channel is not None:
+            self._channel.stop()
+
+
+class NullOutput:
+    """Silent output that plays segments for their duration (tests, benchmarks, no pygame)."""
+
+    def __init__(self):
+        self._ends: deque = deque()
+        self.started_at: Optional[float] = None
+
+    def queue(self, data: bytes, seconds: float, warmup: bytes = b"", warmup_seconds: float = 0.0):
+        now = time.perf_counter()
+        start = max(now, self._ends[-1]) if self._ends else now
+        self._ends.append(start + seconds)
+        if self.started_at is None:
+            self.started_at = start
+
+    def _prune(self):
+        now = time.perf_counter()
+        while self._ends and self._ends[0] <= now:
+            self._ends.popleft()
+
+    def ready(self) -> bool:
+        self._prune()
+        return len(self._ends) < 2
+
+    def busy(self) -> bool:
+        self._prune()
+        return bool(self._ends)
+
+    def stop(self):
+        self._ends.clear()
+
+
+# =============================================================================
+# PLAYER
+# =============================================================================
+
+@dataclass(frozen=True)
+class StreamResult:
+    """How one streamed reply went (times in seconds from the start of play())"""
+    first_audio: Optional[float]
+    finished: float
+    audio_seconds: float
+    segments: int
+    underruns: int              # Segments queued after the channel ran dry
+    audio: bytes                # The whole MP3, e.g. for the speech cache
+
+
+class StreamPlayer:
+    """Plays an MP3 chunk stream as it arrives."""
+
+    def __init__(self, output=None, min_segment: float = MIN_SEGMENT_SECONDS):
+        """
+        Args:
+            output: MixerOutput (default) or NullOutput
+            min_segment: Seconds of frames gathered before queuing behind playing audio
+        """
+        self.output = output or MixerOutput()
+        self.min_segment = min_segment
+
+    async def play(self, chunks: AsyncIterator[bytes]) -> StreamResult:
+        """Play `chunks` until the stream ends and the audio has finished."""
+        start = time.perf_counter()
+        output = self.output
+        splitter = Mp3Frames()
+        audio = bytearray()
+        pending: List[Tuple[bytes, float]] = []
+        ended = asyncio.Event()
+
+        async def read():
+            try:
+                async for data in chunks:
+                    audio.extend(data)
+                    pending.extend(splitter.feed(data))
+            finally:
+                ended.set()
+
+        reader = asyncio.create_task(read())
+        warmup, warmup_seconds = b"", 0.0
+        total = 0.0
+        segments = underruns = 0
+        try:
+            while True:
+                if pending and output.ready():
+                    seconds = sum(s for _, s in pending)
+                    playing = output.busy()
+                    if not playing or seconds >= self.min_segment or ended.is_set():
+                        if segments and not playing:
+                            underruns += 1
+                        frames, pending[:] = list(pending), []
+                        data = b"".join(f for f, _ in frames)
+                        output.queue(data, seconds, warmup, warmup_seconds)
+                        warmup, warmup_seconds = frames[-1]
+                        total += seconds
+                        segments += 1
+                if ended.is_set() and not pending and not output.busy():
+                    break
+                await asyncio.sleep(STREAM_POLL_SECONDS)
+            await reader    # Re-raise a failed stream
+        except BaseException:
+            reader.cancel()
+            output.stop()
+            raise
+        first = None if output.started_at is None else output.started_at - start
+        return StreamResult(first, time.perf_counter() - start, total, segments, underruns, bytes(audio))
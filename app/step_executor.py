@@ -0,0 +1,138 @@
+"""
+Step Executor - OS Actions Off the Event Loop
+NovaOS steps (full of waits, window polling and key presses) run on one
+dedicated worker thread, so the engine's event loop keeps capturing
+audio, speaking and serving GUI quick actions while they run. One worker
+because GUI automation steps must never interleave.
+
+Every step gets a time budget for its action. When it runs out, the
+step's cancel token is cancelled and the macro stops at its next cancel
+point. Each step ends in a StepResult with status ok, timeout, error or
+cancelled.
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Optional
+
+from app.cancellation import CancelToken, CommandCancelled, cancel_scope, current_token
+
+
+# Seconds a step may run before it is cancelled, by action
+STEP_TIMEOUT = float(os.getenv("STEP_TIMEOUT", "30"))
+STEP_TIMEOUTS: Dict[str, float] = {
+    "LAUNCH_SYS": 20.0,
+    "BROWSER": 20.0,
+    "BROWSER_DIRECT": 15.0,
+    "PLAY_MUSIC": 30.0,
+    "DOWNLOAD_WEB": 60.0,
+    "SYSTEM_CHECK": 10.0,
+    "SCREENSHOT": 10.0,
+    "TYPE_STRING": 30.0,
+    "PRESS_KEY": 5.0,
+    "MINIMIZE_ALL": 5.0,
+    "TYPE_IN_WORD": 90.0,
+    "WRITE_ESSAY": 300.0,    # LLM essay generation plus typing it into Word
+}
+# Overrides, e.g. STEP_TIMEOUTS="WRITE_ESSAY=600,PLAY_MUSIC=20"
+for _item in filter(None, os.getenv("STEP_TIMEOUTS", "").split(",")):
+    _action, _, _seconds = _item.partition("=")
+    try:
+        STEP_TIMEOUTS[_action.strip().upper()] = float(_seconds)
+    except ValueError:
+        print(f"[STEP] Ignoring bad STEP_TIMEOUTS entry: {_item!r}")
+
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+CANCELLED = "cancelled"
+
+
+@dataclass(frozen=True)
+class StepResult:
+    """How one step ended"""
+    action: Optional[str]
+    status: str                  # ok, timeout, error or cancelled
+    result: Optional[str] = None # What execute_step returned
+    error: str = ""
+    seconds: float = 0.0
+    budget: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+
+def _default_execute(step: dict):
+    # Looked up per call so nova_os is imported (and replaceable) lazily
+    from app import nova_os
+    return nova_os.execute_step(step)
+
+
+class StepExecutor:
+    """Runs steps on one worker thread with per-action timeouts."""
+
+    def __init__(self, execute: Optional[Callable[[dict], str]] = None,
+                 timeouts: Optional[Dict[str, float]] = None, default_timeout: float = STEP_TIMEOUT):
+        """
+        Args:
+            execute: Runs one step (default: nova_os.execute_step)
+            timeouts: Budget per action (default: STEP_TIMEOUTS)
+            default_timeout: Budget for actions not listed
+        """
+        self.execute = execute or _default_execute
+        self.timeouts = STEP_TIMEOUTS if timeouts is None else timeouts
+        self.default_timeout = default_timeout
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nova-step")
+
+    def budget(self, action: Optional[str]) -> float:
+        return self.timeouts.get(action or "", self.default_timeout)
+
+    def _call(self, step: dict, token: CancelToken) -> StepResult:
+        action = step.get("action")
+        start = time.perf_counter()
+        try:
+            with cancel_scope(token):
+                token.check()
+                result = self.execute(step)
+        except CommandCancelled:
+            return StepResult(action, CANCELLED, error=token.reason,
+                              seconds=time.perf_counter() - start)
+        except Exception as e:
+            return StepResult(action, ERROR, error=str(e), seconds=time.perf_counter() - start)
+        seconds = time.perf_counter() - start
+        # execute_step reports its own failures as "Error ..." strings
+        if isinstance(result, str) and result.lower().startswith("error"):
+            return StepResult(action, ERROR, result, error=result, seconds=seconds)
+        return StepResult(action, OK, result, seconds=seconds)
+
+    def submit(self, step: dict, token: Optional[CancelToken] = None) -> Future:
+        """Queue a step on the worker; the future resolves to its StepResult (no timeout)."""
+        context = contextvars.copy_context()
+        return self._pool.submit(context.run, self._call, step, token or CancelToken())
+
+    async def run(self, step: dict, token: Optional[CancelToken] = None) -> StepResult:
+        """
+        Run a step without blocking the loop. The step gets a child of
+        `token` (default: the current command's), cancelled on timeout.
+        """
+        parent = token or current_token()
+        step_token = parent.child() if parent is not None else CancelToken()
+        budget = self.budget(step.get("action"))
+        start = time.perf_counter()
+        future = asyncio.wrap_future(self.submit(step, step_token))
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), budget)
+        except asyncio.TimeoutError:
+            # The macro stops at its next cancel point; don't wait for it
+            step_token.cancel("timeout")
+            return StepResult(step.get("action"), TIMEOUT, error=f"exceeded {budget:g}s",
+                              seconds=time.perf_counter() - start, budget=budget)
+        return replace(result, budget=budget)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,168 @@
+"""
+Tracing - Voice Command Lifecycle Spans
+Records timed spans (capture, endpointing, ASR, planning tiers, steps,
+speech start) for each voice command into a bounded in-memory ring buffer,
+with a per-span-name latency histogram alongside. Spans are exported as
+JSON lines. Recording a span is two clock reads, a tuple append and a
+histogram update, so tracing stays on in production (TRACE_SPANS=0 to
+turn it off).
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+from app.latency import LatencyHistogram, LatencyRecorder
+
+
+TRACE_SPANS = os.getenv("TRACE_SPANS", "1").lower() in ("1", "true", "yes")
+TRACE_BUFFER = int(os.getenv("TRACE_BUFFER", "4096"))
+# JSON-lines file the engine appends spans to when it stops ("" = off)
+TRACE_EXPORT = os.getenv("TRACE_EXPORT", "")
+
+# Trace the current task/thread belongs to (0 = none)
+_current_trace = contextvars.ContextVar("trace_id", default=0)
+
+
+def current_trace() -> int:
+    """Id of the trace being recorded in this context (0 = none)."""
+    return _current_trace.get()
+
+
+class Tracer:
+    """
+    Ring buffer of finished spans plus latency histograms per span name.
+    Spans are (trace_id, name, start, duration, attrs) with start on the
+    perf_counter clock; export() converts it to wall-clock time.
+    """
+
+    def __init__(self, capacity: int = 4096, enabled: bool = True):
+        self.enabled = enabled
+        self.spans: deque = deque(maxlen=capacity)
+        self.latency = LatencyRecorder()
+        self._ids = itertools.count(1)
+        self._epoch_wall = time.time()
+        self._epoch_perf = time.perf_counter()
+        self._export_lock = threading.Lock()
+
+    # ==================== TRACES ====================
+
+    def start_trace(self) -> int:
+        """Start a new trace (one voice command) in the current context."""
+        trace_id = next(self._ids)
+        _current_trace.set(trace_id)
+        return trace_id
+
+    def resume_trace(self, trace_id: int):
+        """Continue an existing trace in the current context (e.g. a later pipeline stage)."""
+        _current_trace.set(trace_id)
+
+    # ==================== SPANS ====================
+
+    def record(self, name: str, start: float, end: Optional[float] = None,
+               trace_id: Optional[int] = None, histogram: Optional[LatencyHistogram] = None,
+               **attrs):
+        """
+        Record a span measured by the caller.
+
+        Args:
+            start, end: time.perf_counter() readings (end defaults to now)
+            trace_id: Defaults to the current trace
+            histogram: Extra histogram that also gets the duration
+        """
+        if end is None:
+            end = time.perf_counter()
+        duration = end - start
+        if histogram is not None:
+            histogram.record(duration)
+        if not self.enabled:
+            return
+        if trace_id is None:
+            trace_id = _current_trace.get()
+        self.spans.append((trace_id, name, start, duration, attrs or None))
+        self.latency.record(name, duration)
+
+    def event(self, name: str, trace_id: Optional[int] = None, **attrs):
+        """Zero-length span marking a point in time (e.g. speech start)."""
+        now = time.perf_counter()
+        self.record(name, now, now, trace_id, **attrs)
+
+    def span(self, name: str, histogram: Optional[LatencyHistogram] = None, **attrs) -> "_Span":
+        """Context manager timing the enclosed block as span `name`."""
+        return _Span(self, name, histogram, attrs)
+
+    # ==================== EXPORT ====================
+
+    def _as_dict(self, span) -> dict:
+        trace_id, name, start, duration, attrs = span
+        record = {
+            "trace": trace_id,
+            "span": name,
+            "start": round(self._epoch_wall + (start - self._epoch_perf), 6),
+            "ms": round(duration * 1000.0, 3),
+        }
+        if attrs:
+            record.update(attrs)
+        return record
+
+    def recent(self, trace_id: Optional[int] = None) -> List[dict]:
+        """Buffered spans (optionally of one trace), oldest first."""
+        return [self._as_dict(s) for s in list(self.spans)
+                if trace_id is None or s[0] == trace_id]
+
+    def export(self, path: str, clear: bool = True) -> int:
+        """Append buffered spans to a JSON-lines file. Returns spans written."""
+        with self._export_lock:
+            spans = list(self.spans)
+            if clear:
+                self.spans.clear()
+            with open(path, "a", encoding="utf-8") as f:
+                for span in spans:
+                    f.write(json.dumps(self._as_dict(span), default=str) + "\n")
+        return len(spans)
+
+    def summary(self) -> str:
+        """Percentiles and histogram per span name, for the log."""
+        return self.latency.report()
+
+
+class _Span:
+    """Context manager behind Tracer.span (a plain class is cheaper than a generator)."""
+
+    __slots__ = ("tracer", "name", "histogram", "attrs", "start")
+
+    def __init__(self, tracer: Tracer, name: str, histogram, attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.histogram = histogram
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.attrs
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, None, None, self.histogram, **self.attrs)
+        return False
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer() -> Tracer:
+    """Get or create the shared tracer (TRACE_SPANS, TRACE_BUFFER)"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer(capacity=TRACE_BUFFER, enabled=TRACE_SPANS)
+    return _tracer
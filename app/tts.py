@@ -0,0 +1,500 @@
+"""
+TTS - Instant Speech Worker
+One worker thread owns the voice: the SAPI COM voice is created once on
+that thread (preferring Zira or David) and reused for every utterance.
+Utterances wait in a small queue. A phrase that is already waiting is not
+queued twice, a full queue drops its oldest phrase so the latest one wins,
+and interrupt() cuts off whatever is playing. Enqueue-to-first-audio
+latency is recorded per voice.
+
+Replies are spoken sentence by sentence: the next sentence is handed to
+the voice as soon as the current one starts playing, so it is synthesized
+while the current one is heard and time to the first word does not grow
+with the length of the answer.
+
+Without pywin32 (e.g. on Linux) a NullVoice stands in: it stays silent for
+as long as the text would take to say, so the worker runs and can be
+benchmarked anywhere.
+"""
+
+import abc
+import os
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    win32com = None
+
+from app.latency import LatencyRecorder
+from app.tracing import get_tracer, current_trace
+
+
+# Utterances that may wait behind the one playing (oldest dropped when full)
+TTS_QUEUE_SIZE = int(os.getenv("TTS_QUEUE_SIZE", "2"))
+# How often the worker looks for an interrupt while a phrase plays
+TTS_POLL_SECONDS = 0.01
+# Longest piece handed to the voice at once; longer sentences are cut at
+# clause breaks (0 = speak each reply in one piece)
+TTS_CHUNK_WORDS = int(os.getenv("TTS_CHUNK_WORDS", "20"))
+
+# Replies longer than SPEAK_MAX_WORDS are cut to their first
+# SPEAK_TRUNCATE_WORDS words (0 = speak everything); document content
+# (essays) is only logged unless SPEAK_CONTENT=1
+SPEAK_MAX_WORDS = int(os.getenv("SPEAK_MAX_WORDS", "50"))
+SPEAK_TRUNCATE_WORDS = int(os.getenv("SPEAK_TRUNCATE_WORDS", "15"))
+SPEAK_CONTENT = os.getenv("SPEAK_CONTENT", "0").lower() in ("1", "true", "yes")
+
+# Enqueue to first audio, per voice ("sapi.first_audio", "null.first_audio")
+TTS_LATENCY = LatencyRecorder()
+
+QUEUED = "queued"
+PLAYED = "played"
+INTERRUPTED = "interrupted"
+DROPPED = "dropped"
+
+
+# =============================================================================
+# WHAT TO SAY
+# =============================================================================
+
+@dataclass(frozen=True)
+class SpeechRules:
+    """Which part of a reply is said aloud (all of it is logged)"""
+    speak_content: bool = SPEAK_CONTENT         # Read out document content (essays...)
+    max_words: int = SPEAK_MAX_WORDS            # Longer replies are cut (0 = no limit)
+    truncate_words: int = SPEAK_TRUNCATE_WORDS  # Words kept of a cut reply
+    truncated_suffix: str = "... Response logged."
+
+    def apply(self, text: str, is_content: bool = False) -> Optional[str]:
+        """The text to speak, or None to stay silent."""
+        if not text or (is_content and not self.speak_content):
+            return None
+        words = text.split()
+        if self.max_words and len(words) > self.max_words:
+            return ' '.join(words[:self.truncate_words]) + self.truncated_suffix
+        return text
+
+
+# Sentence end: punctuation (maybe closing quotes/brackets) then a space
+_SENTENCE_END = re.compile(r'[.!?]+["\')\]]*\s+')
+# Words whose period does not end a sentence
+_ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "st", "vs", "etc", "e.g", "i.e", "approx"}
+
+
+def split_sentences(text: str, max_words: int = TTS_CHUNK_WORDS) -> List[str]:
+    """
+    Split text into the pieces spoken one after another: sentences, with
+    sentences over max_words words cut at their last clause break (comma,
+    semicolon, colon) before the limit. max_words=0 keeps text whole.
+    """
+    text = ' '.join(text.split())
+    if not text or max_words <= 0:
+        return [text] if text else []
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        word = text[start:match.start()].rsplit(' ', 1)[-1].lower()
+        # "Dr. Smith", "e.g. this", initials like "J. K."
+        if word in _ABBREVIATIONS or len(word) == 1 and word.isalpha():
+            continue
+        sentences.append(text[start:match.end()].strip())
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+
+    pieces = []
+    for sentence in sentences:
+        words = sentence.split()
+        while len(words) > max_words:
+            cut = max_words
+            for i in range(max_words - 1, max_words // 2 - 1, -1):
+                if words[i][-1] in ",;:":
+                    cut = i + 1
+                    break
+            pieces.append(' '.join(words[:cut]))
+            words = words[cut:]
+        if words:
+            pieces.append(' '.join(words))
+    return pieces
+
+
+# =============================================================================
+# VOICES
+# =============================================================================
+
+class Voice(abc.ABC):
+    """
+    Speaks one utterance at a time, possibly in several pieces. open() and
+    close() run on the worker thread; start() and append() return at once
+    and wait() polls for completion of everything handed over.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.audio_started: Optional[float] = None   # perf_counter of first audio
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    @abc.abstractmethod
+    def start(self, text: str):
+        """Begin a new utterance with its first piece."""
+
+    @abc.abstractmethod
+    def append(self, text: str):
+        """Queue the next piece, to play right after the ones already handed over."""
+
+    def pending(self) -> int:
+        """Pieces handed over that have not started playing yet."""
+        return 0
+
+    @abc.abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds; True once every piece has finished."""
+
+    @abc.abstractmethod
+    def stop(self):
+        """Silence the voice and drop every piece handed over."""
+
+
+# SpeechVoiceSpeakFlags and SpeechRunState values
+SVSF_ASYNC = 1
+SVSF_PURGE_BEFORE_SPEAK = 2
+SRSE_IS_SPEAKING = 2
+
+
+class SapiVoice(Voice):
+    """Windows SAPI SpVoice, created once on the worker thread."""
+
+    name = "sapi"
+
+    def __init__(self, rate: int = 1):
+        """
+        Args:
+            rate: -10 (slowest) to 10 (fastest)
+        """
+        super().__init__()
+        self.rate = rate
+        self._speaker = None
+        self._last_stream = 0
+
+    def open(self):
+        pythoncom.CoInitialize()
+        speaker = win32com.client.Dispatch("SAPI.SpVoice")
+        speaker.Rate = self.rate
+
+        # Try to get a better voice if available
+        voices = speaker.GetVoices()
+        for i in range(voices.Count):
+            voice = voices.Item(i)
+            name = voice.GetDescription()
+            # Prefer Zira (female) or David (male) - clearer than default
+            if "Zira" in name or "David" in name:
+                speaker.Voice = voice
+                break
+
+        self._speaker = speaker
+
+    def close(self):
+        self._speaker = None
+        pythoncom.CoUninitialize()
+
+    def start(self, text):
+        self.audio_started = None
+        self.append(text)
+
+    def append(self, text):
+        # SAPI queues async phrases and plays them back to back
+        self._last_stream = self._speaker.Speak(text, SVSF_ASYNC)
+
+    def pending(self):
+        return max(0, self._last_stream - self._speaker.Status.CurrentStreamNumber)
+
+    def wait(self, timeout):
+        self._check_started()
+        done = bool(self._speaker.WaitUntilDone(int(timeout * 1000)))
+        self._check_started()
+        return done
+
+    def _check_started(self):
+        if self.audio_started is None and self._speaker.Status.RunningState == SRSE_IS_SPEAKING:
+            self.audio_started = time.perf_counter()
+
+    def stop(self):
+        # Speaking nothing with purge flushes the phrase being played
+        self._speaker.Speak("", SVSF_ASYNC | SVSF_PURGE_BEFORE_SPEAK)
+
+
+class NullVoice(Voice):
+    """
+    Silent voice taking as long as the text would to say (tests, benchmarks,
+    no SAPI). Each piece is "synthesized" from when it is handed over, then
+    played after the piece before it; if it is not ready in time, the wait
+    is added to `gaps`.
+    """
+
+    name = "null"
+
+    def __init__(self, words_per_minute: float = 180.0, first_audio: float = 0.0,
+                 synthesis_per_word: float = 0.0):
+        """
+        Args:
+            words_per_minute: Speaking rate the playing time is derived from
+            first_audio: Seconds of "synthesis" before a piece can play
+            synthesis_per_word: Extra synthesis seconds per word of the piece
+        """
+        super().__init__()
+        self.words_per_minute = words_per_minute
+        self.first_audio = first_audio
+        self.synthesis_per_word = synthesis_per_word
+        self.gaps = 0.0                 # Seconds of silence between pieces
+        self._stopped = threading.Event()
+        self._starts: List[float] = []  # When each piece starts playing
+        self._end = 0.0
+
+    def start(self, text):
+        self.audio_started = None
+        self.gaps = 0.0
+        self._stopped.clear()
+        self._starts = []
+        self.append(text)
+
+    def append(self, text):
+        words = len(text.split())
+        ready = time.perf_counter() + self.first_audio + self.synthesis_per_word * words
+        if self._starts and ready > self._end:
+            self.gaps += ready - self._end
+        begin = max(ready, self._end) if self._starts else ready
+        self._starts.append(begin)
+        self._end = begin + words * 60.0 / self.words_per_minute
+
+    def pending(self):
+        now = time.perf_counter()
+        return sum(1 for begin in self._starts if begin > now)
+
+    def wait(self, timeout):
+        remaining = self._end - time.perf_counter()
+        if self._stopped.wait(max(0.0, min(timeout, remaining))):
+            return True
+        now = time.perf_counter()
+        if self.audio_started is None and now >= self._starts[0]:
+            self.audio_started = self._starts[0]
+        return now >= self._end
+
+    def stop(self):
+        self._stopped.set()
+
+
+def default_voice(rate: int = 1) -> Voice:
+    """SAPI when pywin32 is installed, otherwise the silent NullVoice."""
+    return SapiVoice(rate) if win32com is not None else NullVoice()
+
+
+# =============================================================================
+# SPEECH WORKER
+# =============================================================================
+
+@dataclass
+class SpeechHandle:
+    """One queued phrase; status moves from queued to played, interrupted or dropped."""
+    text: str
+    trace_id: int
+    queued_at: float                    # perf_counter
+    pieces: List[str]                   # Sentences, spoken one after another
+    first_audio: Optional[float] = None # perf_counter
+    status: str = QUEUED
+
+    def __post_init__(self):
+        self._started = threading.Event()
+        self._done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the phrase has finished (or was dropped)."""
+        return self._done.wait(timeout)
+
+    def wait_started(self, timeout: Optional[float] = None) -> bool:
+        """Block until the phrase is heard (or has ended without being heard)."""
+        return self._started.wait(timeout)
+
+    def _finish(self, status: Optional[str] = None):
+        if status is not None:
+            self.status = status
+        self._started.set()
+        self._done.set()
+
+
+class InstantTTS:
+    """
+    Ultra-fast text-to-speech using Windows SAPI.
+    Latency: ~20ms (vs 500-1000ms for Edge-TTS)
+    """
+
+    # Common responses to pre-optimize
+    SHORT_RESPONSES = {
+        "done", "ok", "opened", "created", "deleted", "error",
+        "listening", "processing", "executing", "complete",
+        "yes", "no", "starting", "stopping", "ready"
+    }
+
+    def __init__(self, rate=4, voice: Optional[Voice] = None, maxsize: int = TTS_QUEUE_SIZE,
+                 chunk_words: int = TTS_CHUNK_WORDS):
+        """
+        Args:
+            rate: -10 (slowest) to 10 (fastest), default 4 for snappy responses
+            voice: Voice to speak with (default: SAPI, NullVoice without pywin32)
+            maxsize: Utterances that may wait behind the one playing
+            chunk_words: Longest piece handed to the voice (0 = whole replies)
+        """
+        self.rate = rate
+        self.voice = voice or default_voice(rate)
+        self.maxsize = max(1, maxsize)
+        self.chunk_words = chunk_words
+        self.dropped = 0
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+        self._interrupt = threading.Event()
+        self._thread = None
+        self._closed = False
+
+    def speak(self, text, interrupt=False) -> SpeechHandle:
+        """
+        Instant non-blocking speak.
+        Returns immediately, audio plays in background.
+
+        Args:
+            text: Phrase to say (a phrase already waiting is not queued twice)
+            interrupt: Cut off what is playing and drop everything waiting
+        """
+        handle = SpeechHandle(text, current_trace(), time.perf_counter(),
+                              split_sentences(text, self.chunk_words) or [text])
+        with self._cond:
+            if interrupt:
+                self._drop_waiting()
+                self._interrupt.set()
+            else:
+                for waiting in self._queue:
+                    if waiting.text == text:
+                        return waiting
+                if len(self._queue) >= self.maxsize:
+                    self._drop(self._queue.popleft())
+            self._queue.append(handle)
+            self._cond.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="nova-tts", daemon=True)
+                self._thread.start()
+        return handle
+
+    def speak_wait(self, text, timeout: Optional[float] = None):
+        """Blocking speak - waits for completion."""
+        self.speak(text).wait(timeout)
+
+    def interrupt(self):
+        """Stop speaking now and forget everything waiting."""
+        with self._cond:
+            self._drop_waiting()
+            self._interrupt.set()
+
+    def close(self):
+        """Interrupt and stop the worker thread (its voice is released)."""
+        with self._cond:
+            self._closed = True
+            self._drop_waiting()
+            self._interrupt.set()
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def is_short(self, text):
+        """Check if text should use instant TTS."""
+        if not text:
+            return False
+        words = text.lower().split()
+        # Short = under 10 words OR contains common short response
+        return len(words) <= 10 or any(w in self.SHORT_RESPONSES for w in words)
+
+    def _drop(self, handle):
+        self.dropped += 1
+        handle._finish(DROPPED)
+        get_tracer().event("tts.dropped", trace_id=handle.trace_id)
+
+    def _drop_waiting(self):
+        while self._queue:
+            self._drop(self._queue.popleft())
+
+    def _run(self):
+        try:
+            self.voice.open()
+        except Exception as e:
+            # Keep draining the queue silently rather than pile it up
+            print(f"SAPI Error: {e}")
+            self.voice = NullVoice()
+        try:
+            while True:
+                with self._cond:
+                    while not self._queue and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    handle = self._queue.popleft()
+                    self._interrupt.clear()
+                try:
+                    self._say(handle)
+                except Exception as e:
+                    print(f"SAPI Error: {e}")
+                finally:
+                    handle._finish()
+        finally:
+            self.voice.close()
+
+    def _say(self, handle):
+        """Play one phrase piece by piece, stopping early on interrupt."""
+        tracer = get_tracer()
+        tracer.record("tts.queue", handle.queued_at, trace_id=handle.trace_id)
+        voice = self.voice
+        pieces = iter(handle.pieces)
+        voice.start(next(pieces))
+        remaining = len(handle.pieces) - 1
+        while True:
+            # Hand over the next piece once the previous one is playing,
+            # so it is synthesized while that one is heard
+            if remaining and not voice.pending():
+                voice.append(next(pieces))
+                remaining -= 1
+            done = voice.wait(TTS_POLL_SECONDS)
+            if handle.first_audio is None and voice.audio_started is not None:
+                handle.first_audio = voice.audio_started
+                tracer.record("tts.first_audio", handle.queued_at, handle.first_audio,
+                              trace_id=handle.trace_id,
+                              histogram=TTS_LATENCY.get(f"{voice.name}.first_audio"))
+                tracer.event("speech_start", trace_id=handle.trace_id,
+                             words=len(handle.text.split()))
+                handle._started.set()
+            if done and not remaining:
+                handle.status = PLAYED
+                return
+            if self._interrupt.is_set():
+                voice.stop()
+                handle.status = INTERRUPTED
+                return
+
+
+# Global instant TTS engine
+_instant_tts = None
+
+def get_instant_tts():
+    """Get or create the global instant TTS engine."""
+    global _instant_tts
+    if _instant_tts is None:
+        _instant_tts = InstantTTS(rate=1)  # Slower for clarity (was 4)
+    return _instant_tts
@@ -0,0 +1,49 @@
+"""
+Utterance - Normalize Once, Share Across Tiers
+One immutable view of a command (lowercase, tokens, word set) built once
+per request and handed to Sentinel, FastPath and the LLM guard, so none of
+them re-lowercases, re-splits or re-scans the same text. Values derived by
+a tier (intent, keyword hits) are memoized on the utterance.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, FrozenSet, Tuple, Union
+
+from app.keyword_engine import get_keyword_engine
+
+
+@dataclass(frozen=True)
+class Utterance:
+    """A normalized user command"""
+    raw: str                     # As heard
+    text: str                    # Surrounding whitespace stripped
+    lower: str                   # Lowercase, stripped
+    bare: str                    # Lowercase, stripped, apostrophes removed
+    tokens: Tuple[str, ...]      # Whitespace tokens of `lower`
+    words: FrozenSet[str]        # Whitespace tokens of `bare`
+    _derived: dict = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def of(cls, text: Union[str, "Utterance"]) -> "Utterance":
+        """Normalize text (an Utterance is returned as is)."""
+        if isinstance(text, Utterance):
+            return text
+        stripped = text.strip()
+        lower = stripped.lower()
+        bare = lower.replace("'", "")
+        return cls(text, stripped, lower, bare, tuple(lower.split()), frozenset(bare.split()))
+
+    def __str__(self):
+        return self.text
+
+    def derive(self, name: str, compute: Callable[["Utterance"], Any]) -> Any:
+        """compute(self), memoized under name. Results must be immutable."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            return self._derived.setdefault(name, compute(self))
+
+    def keyword_categories(self) -> FrozenSet[str]:
+        """Categories of the shared keyword automaton found in `lower`."""
+        return self.derive("keywords", lambda u: frozenset(get_keyword_engine().categories(u.lower)))
+
@@ -0,0 +1,250 @@
+"""
+VAD - Voice Activity Detection and Endpointing
+Per-chunk features (RMS energy, zero-crossing rate, spectral flatness)
+computed with NumPy, compared against running noise statistics. Loud
+chunks are speech outright; marginal ones also need to look unlike the
+background (more tonal, or a different zero-crossing rate), which stops
+noise bursts from opening or holding an utterance.
+
+The Endpointer ends an utterance after an adaptive hangover: short after
+clean, confident speech, up to the old fixed pause on noisy input, and
+never shorter than the longest pause the speaker already made.
+
+Replaces audioop (removed in Python 3.13). Without NumPy the detector
+falls back to energy only.
+"""
+
+import array
+import math
+import os
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Noise floor: EWMA time constant, threshold = floor * ratio (as in
+# speech_recognition's ambient adjustment), and a floor for dead-silent input
+NOISE_TIME_CONSTANT = 1.0
+THRESHOLD_RATIO = 1.5
+MIN_ENERGY_THRESHOLD = 100
+
+# Every chunk calibrates the floor at first; "speech" with no quieter chunk
+# for this long means the background got louder
+CALIBRATION_SECONDS = 0.3
+RECALIBRATE_SECONDS = 5.0
+
+# Above this SNR a chunk is speech on energy alone; between the energy
+# threshold and this it also has to differ spectrally from the noise - be
+# more tonal, or cross zero at a different rate, by at least this factor
+STRONG_SNR_DB = 12.0
+SPECTRAL_RATIO = 1.5
+
+# Hangover after the last speech chunk (seconds)
+VAD_MIN_HANGOVER = float(os.getenv("VAD_MIN_HANGOVER", "0.4"))
+VAD_MAX_HANGOVER = float(os.getenv("VAD_MAX_HANGOVER", "1.0"))
+CLEAN_SNR_DB = STRONG_SNR_DB                       # Mean speech SNR for the shortest hangover
+NOISY_SNR_DB = 20.0 * math.log10(THRESHOLD_RATIO)  # ... and the longest (at the threshold)
+PAUSE_FACTOR = 1.5       # Hangover >= this x the longest pause so far
+MIN_SPEECH_SECONDS = 0.1 # Speech needed before an utterance counts as started
+
+
+def chunk_rms(buffer: bytes, sample_width: int) -> float:
+    """RMS of little-endian signed PCM (unsigned for 8-bit), like audioop.rms."""
+    if np is not None:
+        return float(np.sqrt(np.mean(np.square(_samples(buffer, sample_width))))) if buffer else 0.0
+    samples = _array_samples(buffer, sample_width)
+    return math.sqrt(sum(s * s for s in samples) / len(samples)) if samples else 0.0
+
+
+def _samples(buffer: bytes, sample_width: int):
+    usable = len(buffer) - len(buffer) % sample_width
+    if sample_width == 1:
+        return np.frombuffer(buffer, dtype=np.uint8, count=usable).astype(np.float64) - 128.0
+    dtype = {2: "<i2", 4: "<i4"}[sample_width]
+    return np.frombuffer(buffer, dtype=dtype, count=usable // sample_width).astype(np.float64)
+
+
+def _array_samples(buffer: bytes, sample_width: int):
+    usable = len(buffer) - len(buffer) % sample_width
+    if sample_width == 1:
+        return [b - 128 for b in buffer[:usable]]
+    samples = array.array({2: "h", 4: "i"}[sample_width])
+    samples.frombytes(buffer[:usable])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+
+@dataclass(frozen=True)
+class VadFrame:
+    """Features and decision for one chunk"""
+    rms: float
+    snr_db: float         # Relative to the noise floor
+    zcr: float            # Zero crossings per sample (0-1)
+    flatness: float       # Spectral flatness (0 = tonal, 1 = white)
+    is_speech: bool
+
+
+class VoiceActivityDetector:
+    """
+    Classifies chunks as speech or not and keeps the running noise
+    statistics (floor, flatness, zero-crossing rate) from non-speech chunks.
+    """
+
+    def __init__(self, sample_rate: int, sample_width: int, chunk: int,
+                 spectral: bool = True, min_threshold: float = MIN_ENERGY_THRESHOLD,
+                 threshold_ratio: float = THRESHOLD_RATIO,
+                 time_constant: float = NOISE_TIME_CONSTANT):
+        """
+        Args:
+            sample_rate, sample_width, chunk: Stream format (chunk in frames)
+            spectral: Use zero-crossing rate and flatness (needs NumPy);
+                False = energy threshold only
+        """
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.chunk_seconds = chunk / sample_rate
+        self.spectral = spectral and np is not None
+        self.min_threshold = min_threshold
+        self.threshold_ratio = threshold_ratio
+        self.alpha = 1.0 - math.exp(-self.chunk_seconds / time_constant)
+
+        self.noise_floor: Optional[float] = None
+        self.noise_flatness = 1.0
+        self.noise_zcr = 0.5
+        self.energy_threshold = float(min_threshold)
+        self.chunks = 0
+
+        self._calibration_chunks = max(1, round(CALIBRATION_SECONDS / self.chunk_seconds))
+        self._recalibrate_chunks = max(1, round(RECALIBRATE_SECONDS / self.chunk_seconds))
+        self._loud_run = 0
+        self._loud_min = 0.0
+        self._window = None
+
+    # ==================== FEATURES ====================
+
+    def features(self, buffer: bytes):
+        """(rms, zcr, flatness) of one chunk."""
+        if not self.spectral:
+            return chunk_rms(buffer, self.sample_width), 0.0, 1.0
+        x = _samples(buffer, self.sample_width)
+        if len(x) < 2:
+            return 0.0, 0.0, 1.0
+        rms = float(np.sqrt(np.mean(np.square(x))))
+        zcr = float(np.count_nonzero(np.signbit(x[1:]) != np.signbit(x[:-1]))) / (len(x) - 1)
+        if self._window is None or len(self._window) != len(x):
+            self._window = np.hanning(len(x))
+        power = np.square(np.abs(np.fft.rfft(x * self._window))) + 1e-10
+        flatness = float(np.exp(np.mean(np.log(power))) / np.mean(power))
+        return rms, zcr, flatness
+
+    # ==================== DECISION ====================
+
+    def process(self, buffer: bytes) -> VadFrame:
+        """Classify one chunk and update the noise statistics."""
+        rms, zcr, flatness = self.features(buffer)
+        self.chunks += 1
+
+        reference = self.energy_threshold / self.threshold_ratio
+        snr_db = 20.0 * math.log10(max(rms, 1e-6) / max(reference, 1e-6))
+
+        if self.chunks <= self._calibration_chunks:
+            is_speech = False
+        elif rms <= self.energy_threshold:
+            is_speech = False
+        elif snr_db >= STRONG_SNR_DB or not self.spectral:
+            is_speech = True
+        else:
+            # Marginal energy - must also sound unlike the background
+            zcr_ratio = (zcr + 1e-3) / (self.noise_zcr + 1e-3)
+            is_speech = (flatness * SPECTRAL_RATIO <= self.noise_flatness or
+                         not 1.0 / SPECTRAL_RATIO < zcr_ratio < SPECTRAL_RATIO)
+
+        if rms <= self.energy_threshold or self.chunks <= self._calibration_chunks:
+            self._loud_run = 0
+            self._update_noise(rms, zcr, flatness)
+        else:
+            self._loud_run += 1
+            self._loud_min = rms if self._loud_run == 1 else min(self._loud_min, rms)
+            if self._loud_run >= self._recalibrate_chunks:
+                # Nobody talks for that long without a pause - it's the room
+                self.noise_floor = None
+                self._update_noise(self._loud_min, zcr, flatness)
+                self._loud_run = 0
+
+        return VadFrame(rms, snr_db, zcr, flatness, is_speech)
+
+    def _update_noise(self, rms: float, zcr: float, flatness: float):
+        if self.noise_floor is None:
+            self.noise_floor = float(rms)
+            self.noise_zcr, self.noise_flatness = zcr, flatness
+        else:
+            a = self.alpha
+            self.noise_floor += a * (rms - self.noise_floor)
+            self.noise_zcr += a * (zcr - self.noise_zcr)
+            self.noise_flatness += a * (flatness - self.noise_flatness)
+        self.energy_threshold = max(self.min_threshold, self.noise_floor * self.threshold_ratio)
+
+
+# =============================================================================
+# ENDPOINTING
+# =============================================================================
+
+class Endpointer:
+    """
+    Tracks one utterance chunk by chunk (in audio time) and decides when it
+    has ended. feed() returns True on the chunk that ends it.
+    """
+
+    def __init__(self, chunk_seconds: float, min_hangover: float = VAD_MIN_HANGOVER,
+                 max_hangover: float = VAD_MAX_HANGOVER, min_speech: float = MIN_SPEECH_SECONDS):
+        self.chunk_seconds = chunk_seconds
+        self.min_hangover = min(min_hangover, max_hangover)
+        self.max_hangover = max_hangover
+        self.min_speech = min_speech
+
+        self.speech_started = False
+        self.ended = False
+        self.silence = 0.0           # Current run of non-speech after speech
+        self.longest_pause = 0.0
+        self._onset = 0.0            # Speech run not yet confirmed as a start
+        self._speech_chunks = 0
+        self._snr_total = 0.0
+
+    def hangover(self) -> float:
+        """Silence that ends the utterance, from its SNR and pauses so far."""
+        if not self._speech_chunks:
+            return self.max_hangover
+        snr = self._snr_total / self._speech_chunks
+        noisy = min(1.0, max(0.0, (CLEAN_SNR_DB - snr) / (CLEAN_SNR_DB - NOISY_SNR_DB)))
+        hang = self.min_hangover + noisy * (self.max_hangover - self.min_hangover)
+        return min(self.max_hangover, max(hang, PAUSE_FACTOR * self.longest_pause))
+
+    def feed(self, frame: VadFrame) -> bool:
+        if self.ended:
+            return True
+        if frame.is_speech:
+            if not self.speech_started:
+                self._onset += self.chunk_seconds
+                if self._onset + 1e-9 >= self.min_speech:
+                    self.speech_started = True
+            if self.silence:
+                self.longest_pause = max(self.longest_pause, self.silence)
+            self.silence = 0.0
+            self._speech_chunks += 1
+            self._snr_total += min(frame.snr_db, 40.0)
+        elif self.speech_started:
+            self.silence += self.chunk_seconds
+            if self.silence + 1e-9 >= self.hangover():
+                self.ended = True
+        else:
+            # A blip too short to be speech
+            self._onset = 0.0
+            self._speech_chunks = 0
+            self._snr_total = 0.0
+        return self.ended
@@ -0,0 +1,6 @@
+"""
+Auto-BOT Benchmarks
+Standalone latency benchmarks. Run from the project root, e.g.:
+
+    python -m benchmarks.bench_intent_classifier
+"""
@@ -0,0 +1,63 @@
+"""
+Abort Benchmark
+Time-to-abort: from "stop" (token cancelled at a random moment) until a
+running macro actually stops. The macro replays the wait sequence of
+NovaOS.launch_word_robust through NovaOS.wait (no keys are pressed).
+Before cancel tokens the macro always ran to the end.
+
+Usage:
+    python -m benchmarks.bench_abort [trials] [time_scale]
+"""
+
+import random
+import statistics
+import sys
+import threading
+import time
+
+from app.cancellation import CancelToken, CommandCancelled, cancel_scope
+from app.nova_os import _nova_os
+
+# Waits (seconds) of a fresh launch_word_robust, in order
+WORD_LAUNCH_WAITS = (1.0, 1.5, 6.0, 0.5, 0.5, 2.0, 0.5)
+
+
+def macro(scale):
+    for seconds in WORD_LAUNCH_WAITS:
+        _nova_os.wait(seconds * scale)
+
+
+def trial(rng, scale, cancellable):
+    """Seconds from the stop to the macro actually ending."""
+    token = CancelToken()
+    stop_at = rng.uniform(0.0, sum(WORD_LAUNCH_WAITS) * scale)
+    timer = threading.Timer(stop_at, token.cancel)
+    timer.start()
+    try:
+        if cancellable:
+            with cancel_scope(token):
+                macro(scale)
+        else:
+            macro(scale)
+    except CommandCancelled:
+        pass
+    ended = time.perf_counter()
+    timer.join()
+    return ended - token.cancelled_at
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    scale = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    rng = random.Random(0)
+    print(f"{trials} stops at random points of a {sum(WORD_LAUNCH_WAITS) * scale:.1f}s macro\n")
+    print(f"{'':<16} {'p50':>9} {'p95':>9} {'max':>9}")
+    for label, cancellable in (("run to the end", False), ("cancel token", True)):
+        latencies = sorted(trial(rng, scale, cancellable) for _ in range(trials))
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+        print(f"{label:<16} {statistics.median(latencies) * 1000:7.1f}ms {p95 * 1000:7.1f}ms "
+              f"{latencies[-1] * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
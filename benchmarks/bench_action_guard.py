@@ -0,0 +1,144 @@
+"""
+ActionGuard Benchmark
+Replays a seeded stream of mixed actions (repeats, bursts, unique targets)
+through the indexed ActionGuard and the previous linear-scan guard on a
+simulated clock, checks that every decision matches, then measures
+throughput on the real clock.
+
+Usage:
+    python -m benchmarks.bench_action_guard [actions] [actions_per_sec]
+"""
+
+import random
+import sys
+import time
+from collections import deque
+
+from app.sentinel_core import ActionGuard, ExecutedAction
+
+
+class LinearActionGuard:
+    """The guard before indexing - scans the 50-entry history on every check."""
+
+    ACTION_COOLDOWN = 5.0
+    MAX_REPEATS = 2
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.history = deque(maxlen=50)
+        self.repeat_counts = {}
+        self.blocked_until = 0
+        self.last_action_time = 0
+
+    def _action_key(self, action_type, target):
+        return f"{action_type}:{target.lower()}"
+
+    def can_execute(self, action_type, target):
+        now = self.clock()
+        if now < self.blocked_until:
+            return False, "System paused due to repeated actions. Say 'continue' to resume."
+        key = self._action_key(action_type, target)
+        for action in self.history:
+            if action.matches(action_type, target):
+                time_diff = now - action.timestamp
+                if time_diff < self.ACTION_COOLDOWN:
+                    self.repeat_counts[key] = self.repeat_counts.get(key, 0) + 1
+                    if self.repeat_counts[key] >= self.MAX_REPEATS:
+                        self.blocked_until = now + 30
+                        return False, f"Blocked: '{target}' was requested {self.MAX_REPEATS}+ times. Pausing for safety."
+                    return False, f"Already done. {target} was just opened {time_diff:.1f}s ago."
+        return True, "OK"
+
+    def record(self, action_type, target):
+        now = self.clock()
+        self.history.append(ExecutedAction(action_type, target, now))
+        self.last_action_time = now
+        key = self._action_key(action_type, target)
+        if key in self.repeat_counts:
+            self.repeat_counts[key] = max(0, self.repeat_counts[key] - 1)
+
+    def clear(self):
+        self.history.clear()
+        self.repeat_counts.clear()
+        self.blocked_until = 0
+
+    def force_unblock(self):
+        self.blocked_until = 0
+        self.repeat_counts.clear()
+
+
+class SimulatedClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+ACTION_TYPES = ["BROWSER", "LAUNCH_SYS", "PLAY_MUSIC", "SCREENSHOT"]
+HOT_TARGETS = ["YouTube", "youtube", "notepad", "Chrome", "lofi beats", "full"]
+
+
+def workload(n, actions_per_sec, seed=0):
+    """(gap seconds, op, action_type, target) - ops: check, unblock, clear."""
+    rng = random.Random(seed)
+    mean_gap = 1.0 / actions_per_sec
+    ops = []
+    for i in range(n):
+        # Bursts of back-to-back requests mixed with long pauses
+        roll = rng.random()
+        gap = 0.0 if roll < 0.2 else (rng.uniform(2.0, 12.0) if roll > 0.97 else rng.expovariate(1 / mean_gap))
+        r = rng.random()
+        if r < 0.002:
+            ops.append((gap, "clear", None, None))
+        elif r < 0.01:
+            ops.append((gap, "unblock", None, None))
+        else:
+            target = rng.choice(HOT_TARGETS) if rng.random() < 0.6 else f"site{rng.randrange(5000)}.com"
+            ops.append((gap, "check", rng.choice(ACTION_TYPES), target))
+    return ops
+
+
+def run(guard, ops, clock=None):
+    decisions = []
+    for gap, op, action_type, target in ops:
+        if clock is not None:
+            clock.now += gap
+        if op == "clear":
+            guard.clear()
+        elif op == "unblock":
+            guard.force_unblock()
+        else:
+            allowed, reason = guard.can_execute(action_type, target)
+            if allowed:
+                guard.record(action_type, target)
+            decisions.append((allowed, reason))
+    return decisions
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 100_000.0
+
+    # Equivalence on a simulated clock: long enough to cover expiry and blocks
+    for gap_rate in (rate, 2.0, 0.5):
+        ops = workload(min(n, 20_000), gap_rate, seed=int(gap_rate))
+        clock_a, clock_b = SimulatedClock(), SimulatedClock()
+        expected = run(LinearActionGuard(clock_a), ops, clock_a)
+        actual = run(ActionGuard(clock_b), ops, clock_b)
+        mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+        blocked = sum(1 for allowed, _ in actual if not allowed)
+        print(f"{gap_rate:>9g} actions/s simulated: {len(actual)} decisions, "
+              f"{blocked} refused, {mismatches} mismatches")
+
+    ops = workload(n, rate)
+    print(f"\n{n} mixed actions (target rate {rate:g}/s):")
+    for label, guard in (("linear", LinearActionGuard()), ("indexed", ActionGuard())):
+        start = time.perf_counter()
+        run(guard, ops)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<8}: {elapsed / n * 1e6:6.2f} us/action, {n / elapsed:>10,.0f} actions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Speech Recognition Backend Benchmark
+Runs labelled WAV files through each recognizer backend on its own and
+reports latency percentiles and word error rate, to pick the fastest
+backend that is accurate enough for ASR_BACKENDS. Without files it checks
+the chain itself on the synthetic corpus: replay transcripts behind a
+failing backend, so only the fallback overhead is measured.
+
+Usage:
+    python -m benchmarks.bench_asr [backends] [transcripts.txt wav ...]
+
+transcripts.txt has one line per WAV, in the same order.
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+
+import speech_recognition as sr
+
+from app.main import ASR_LATENCY, RecognizerBackend, RecognizerChain, ReplayBackend
+from benchmarks.wav_corpus import build_corpus
+
+
+class OfflineNetwork(RecognizerBackend):
+    """Fails like an online backend with no connection."""
+
+    name = "offline-network"
+
+    def recognize(self, audio):
+        raise sr.RequestError("recognition connection failed: [Errno 101] Network is unreachable")
+
+
+def word_errors(reference, hypothesis):
+    """(word edit distance, reference length), case- and punctuation-insensitive."""
+    def words(text):
+        return "".join(c if c.isalnum() or c.isspace() else " " for c in text.lower()).split()
+    ref, hyp = words(reference), words(hypothesis)
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        current = [i]
+        for j, h in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (r != h)))
+        previous = current
+    return previous[-1], len(ref)
+
+
+def load(paths):
+    audio = []
+    for path in paths:
+        with sr.AudioFile(path) as source:
+            audio.append(sr.Recognizer().record(source))
+    return audio
+
+
+def run_backend(chain, audio, transcripts):
+    """Latencies (s), word error rate and failures for one single-backend chain."""
+    latencies, errors, words, failed = [], 0, 0, 0
+    for clip, reference in zip(audio, transcripts):
+        start = time.perf_counter()
+        try:
+            text, _ = chain.recognize(clip)
+        except (sr.UnknownValueError, sr.RequestError):
+            text = ""
+            failed += 1
+        latencies.append(time.perf_counter() - start)
+        e, n = word_errors(reference, text)
+        errors += e
+        words += n
+    return latencies, errors / max(1, words), failed
+
+
+def compare(names, transcripts_path, paths):
+    with open(transcripts_path, encoding="utf-8") as f:
+        transcripts = [line.strip() for line in f]
+    audio = load(paths)
+    recognizer = sr.Recognizer()
+    print(f"{len(audio)} clips\n")
+    print(f"{'backend':<10} {'p50':>8} {'p95':>8} {'WER':>7} {'failed':>7}")
+    for name in names:
+        # replay reads the reference transcripts back - a 0% WER sanity check
+        chain = RecognizerChain.from_config(recognizer, [name], replay_file=transcripts_path)
+        if not chain.names:
+            print(f"{name:<10} not available")
+            continue
+        latencies, wer, failed = run_backend(chain, audio, transcripts)
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+        print(f"{name:<10} {statistics.median(latencies) * 1000:6.0f}ms {p95 * 1000:6.0f}ms "
+              f"{wer:>7.1%} {failed:>7}")
+
+
+def fallback_overhead(rounds=200):
+    clips = build_corpus(tempfile.mkdtemp(prefix="autobot_asr_"), per_condition=1)
+    audio = load([clip.path for clip in clips])
+    transcripts = [f"open notepad {i}" for i in range(len(audio))] * rounds
+
+    chains = [("replay", RecognizerChain([ReplayBackend(transcripts)])),
+              ("offline-network -> replay", RecognizerChain([OfflineNetwork(), ReplayBackend(transcripts)]))]
+    for label, chain in chains:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for clip in audio:
+                chain.recognize(clip)
+        per_call = (time.perf_counter() - start) / (rounds * len(audio))
+        print(f"{label:<28} {per_call * 1e6:6.1f} us per utterance")
+    print(f"\n{ASR_LATENCY.report()}")
+
+
+def main():
+    names = sys.argv[1].split(",") if len(sys.argv) > 1 else ["google", "whisper", "vosk"]
+    if len(sys.argv) > 3:
+        compare(names, sys.argv[2], sys.argv[3:])
+    else:
+        print("No labelled WAVs given - measuring chain fallback overhead\n")
+        fallback_overhead()
+
+
+if __name__ == "__main__":
+    main()
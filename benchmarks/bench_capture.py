@@ -0,0 +1,190 @@
+"""
+Capture Stream Benchmark
+Replays synthetic WAV clips through the persistent CaptureStream and
+reports how quickly a turn starts listening (vs. the old per-turn device
+open plus 300 ms ambient calibration), how closely the EWMA noise floor
+tracks a background level that changes mid-stream, that the threaded
+path delivers every chunk, and how late event-loop callbacks run while a
+turn is listening (old blocking device read + 10 ms sleep inside the
+coroutine vs. awaiting chunks from the ring buffer).
+
+Usage:
+    python -m benchmarks.bench_capture [speed]
+"""
+
+import asyncio
+import math
+import os
+import random
+import sys
+import tempfile
+import statistics
+import time
+
+from app.audio_capture import CaptureStream, PcmBuffer, WavFileSource
+from benchmarks.wav_corpus import SAMPLE_RATE, build_corpus, write_wav
+
+# What every turn used to spend before the user could speak (plus device open)
+OLD_CALIBRATION_SECONDS = 0.3
+
+# Event-loop probe period while measuring lag
+TICK_SECONDS = 0.005
+
+
+def turn_start_latency(path, speed, turns=5):
+    """Seconds from listen() to the first chunk, over several turns."""
+    async def turns_on_loop(capture):
+        latencies = []
+        for _ in range(turns):
+            # Between turns (planning, execution) the thread keeps reading
+            await asyncio.sleep(0.2 / speed)
+            start = time.perf_counter()
+            capture.listen()
+            item = await capture.read(timeout=1.0)
+            latencies.append(time.perf_counter() - start)
+            capture.stop_listening()
+            if item is None:
+                break
+        return latencies
+
+    source = WavFileSource(path, realtime=True, speed=speed)
+    with CaptureStream(source) as capture:
+        return asyncio.run(turns_on_loop(capture))
+
+
+def noise_floor_tracking(directory):
+    """Noise at three levels; how long the threshold takes to settle at each."""
+    rng = random.Random(0)
+    levels = [(0.005, 8.0), (0.03, 8.0), (0.01, 8.0)]   # (rms, seconds)
+    samples = []
+    for rms, seconds in levels:
+        samples += [rng.gauss(0, rms) for _ in range(int(seconds * SAMPLE_RATE))]
+    path = os.path.join(directory, "noise_steps.wav")
+    write_wav(path, samples)
+
+    source = WavFileSource(path)
+    capture = CaptureStream(source)
+    source.open()
+    chunk_seconds = capture.chunk / capture.sample_rate
+    rows = []
+    t = 0.0
+    for rms, seconds in levels:
+        target = rms * 32767 * capture.vad.threshold_ratio
+        settled = None
+        end = t + seconds
+        while t < end:
+            buffer = source.read(capture.chunk)
+            if not buffer:
+                break
+            capture.process(buffer)
+            t += chunk_seconds
+            error = abs(capture.energy_threshold - target) / target
+            if error <= 0.1 and settled is None:
+                settled = t - (end - seconds)
+            elif error > 0.1:
+                settled = None
+        rows.append((rms * 32767, target, capture.energy_threshold, settled))
+    source.close()
+    return rows
+
+
+def threaded_replay(clip, speed):
+    """Chunks delivered by the capture thread vs. chunks in the file."""
+    source = WavFileSource(clip.path, realtime=True, speed=speed)
+    frames = os.path.getsize(clip.path) // 2
+    expected = math.ceil(frames / source.CHUNK)
+    capture = CaptureStream(source)
+
+    async def consume():
+        capture.listen()
+        received = 0
+        with capture:
+            while await capture.read(timeout=1.0) is not None:
+                received += 1
+        return received
+
+    return asyncio.run(consume()), expected
+
+
+async def _probe(lags, done):
+    """Record how late a periodic TICK_SECONDS timer fires."""
+    while not done.is_set():
+        due = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - due))
+
+
+def loop_lag(path, speed, blocking):
+    """Timer lateness (seconds) while one turn reads the whole clip."""
+    async def old_turn(source, capture):
+        # The pre-ring loop: device read inside the coroutine, then a sleep
+        frames = []
+        while True:
+            buffer = source.read(source.CHUNK)
+            if not buffer:
+                break
+            capture.process(buffer)
+            frames.append(buffer)
+            await asyncio.sleep(0.01)
+        return b"".join(frames)
+
+    async def new_turn(capture):
+        utterance = PcmBuffer.for_stream(capture)
+        capture.listen()
+        while True:
+            item = await capture.read(timeout=1.0)
+            if item is None or not utterance.append(item[0]):
+                break
+        capture.stop_listening()
+        return utterance.getvalue()
+
+    async def run():
+        lags, done = [], asyncio.Event()
+        probe = asyncio.create_task(_probe(lags, done))
+        source = WavFileSource(path, realtime=True, speed=speed)
+        capture = CaptureStream(source)
+        start = time.perf_counter()
+        if blocking:
+            source.open()
+            audio = await old_turn(source, capture)
+            source.close()
+        else:
+            with capture:
+                audio = await new_turn(capture)
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe
+        return lags, len(audio), elapsed
+
+    return asyncio.run(run())
+
+
+def main():
+    speed = float(sys.argv[1]) if len(sys.argv) > 1 else 4.0
+    directory = tempfile.mkdtemp(prefix="autobot_capture_")
+    clips = build_corpus(directory, per_condition=1)
+
+    latencies = turn_start_latency(clips[0].path, speed)
+    worst = max(latencies) * 1000
+    print(f"turn start: first chunk {sum(latencies) / len(latencies) * 1000:.2f} ms after listen() "
+          f"(worst {worst:.2f} ms), was >= {OLD_CALIBRATION_SECONDS * 1000:.0f} ms calibration + device open")
+
+    print("\nnoise floor (int16 RMS): level -> target threshold, estimate, time to settle within 10%")
+    for level, target, estimate, settled in noise_floor_tracking(directory):
+        settle = f"{settled:.2f}s" if settled is not None else "not settled"
+        print(f"  {level:7.0f} -> {target:7.0f}  estimate {estimate:7.0f}  {settle}")
+
+    received, expected = threaded_replay(clips[-1], speed * 4)
+    print(f"\nthreaded replay at {speed * 4:g}x: {received}/{expected} chunks delivered")
+
+    print(f"\nevent loop lag at 1x ({TICK_SECONDS * 1000:.0f} ms timer): p50 / p99 / max, turn length")
+    for label, blocking in (("blocking read + sleep(0.01)", True), ("awaited ring buffer", False)):
+        lags, size, elapsed = loop_lag(clips[0].path, 1.0, blocking)
+        lags.sort()
+        p99 = lags[min(len(lags) - 1, int(0.99 * len(lags)))]
+        print(f"  {label:<28} {statistics.median(lags) * 1000:6.2f} / {p99 * 1000:6.2f} / "
+              f"{lags[-1] * 1000:6.2f} ms   {size // 2 / SAMPLE_RATE:.2f}s audio in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
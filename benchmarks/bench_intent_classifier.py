@@ -0,0 +1,195 @@
+"""
+IntentClassifier Microbenchmark
+Compares the compiled single-pass intent automaton against the original
+pattern-by-pattern classifier on a golden corpus.
+
+Usage:
+    python -m benchmarks.bench_intent_classifier [iterations]
+"""
+
+import re
+import sys
+import time
+
+from app.fuzzy_resolver import get_fuzzy_resolver
+from app.sentinel_core import (
+    IntentClassifier,
+    Intent,
+    DOMAIN_MAP,
+    STOP_PATTERNS,
+    CONVERSATIONAL_PATTERNS,
+    PLAY_PATTERNS,
+)
+
+
+# Utterances covering every classifier branch, including near misses
+GOLDEN_CORPUS = [
+    # Stop
+    "stop", "Stop!", "cancel", "abort.", "halt", "nevermind", "never mind",
+    "quit", "exit", "stop the music",
+    # Conversational
+    "hello", "hi there", "hey jarvis", "good morning", "whats up", "what's up doc",
+    "how's it going", "thanks", "thank you so much", "bye", "see ya later",
+    "ok", "okay!", "cool", "awesome...", "who are you", "what are you",
+    "what can you do", "can you help me", "tell me about yourself", "how are you",
+    "are you there", "what is machine learning", "how does the internet work",
+    "do you like music", "explain quantum computing", "describe a cat",
+    # Question starters
+    "whatever happens", "however you like", "who", "is it raining",
+    "would you kindly", "could be better", "should i", "will it rain",
+    "tell me a joke",
+    # Play
+    "play blinding lights", "play lofi hip hop on youtube",
+    "play despacito on spotify", "play jazz music", "play x",
+    # Open
+    "open youtube", "open youtube website", "go to github", "goto reddit",
+    "visit stackoverflow.com", "visit stack overflow", "launch notepad",
+    "open notepad app", "open task manager", "open example.io",
+    "open you tube", "open olx.pk", "open wikipedia.org", "open my files",
+    "open git hub", "open stack over flow", "open discrod", "launch note pad",
+    "open linkdin", "open calculater", "open whatsap",
+    # Keyword tiers
+    "take a screenshot", "screen shot please", "lock the computer",
+    "battery level", "status report", "new tab", "refresh this page",
+    "write an essay about dogs", "compose an essay on climate change",
+    "write a letter to my boss", "type hello world", "create folder projects",
+    "remove the file", "open notepad and then type hi", "search cats and dogs",
+    "random gibberish", "", "   ",
+]
+
+# Ordinary words a few edits from a known name: the target must stay as said
+NOT_NAMES = {
+    "open print": "print",
+    "open email": "email",
+    "open chatbot": "chatbot",
+    "open interest": "interest",
+    "open telegraph": "telegraph",
+    "launch to hello": "to hello",
+    "open what stop": "what stop",
+    "open calculate": "calculate",
+    "open notepad++": "notepad++",
+}
+GOLDEN_CORPUS += list(NOT_NAMES)
+
+
+def classify_sequential(text):
+    """Original classifier: one re.match per pattern, keyword lists scanned in Python."""
+    text_lower = text.lower().strip()
+
+    for pattern in STOP_PATTERNS:
+        if re.match(pattern, text_lower):
+            return Intent.STOP_COMMAND, None
+
+    for pattern in CONVERSATIONAL_PATTERNS:
+        if re.match(pattern, text_lower):
+            return Intent.CONVERSATIONAL, text_lower
+
+    question_starters = ['what', 'how', 'why', 'when', 'where', 'who',
+                         'is it', 'are you', 'can you', 'do you', 'does it',
+                         'would', 'could', 'should', 'will it', 'explain', 'tell me']
+    for starter in question_starters:
+        if text_lower.startswith(starter):
+            return Intent.CONVERSATIONAL, text_lower
+
+    for pattern in PLAY_PATTERNS:
+        match = re.match(pattern, text_lower)
+        if match:
+            return Intent.PLAY_MEDIA, match.group(1).strip()
+
+    open_match = re.match(r'(?:open|go\s*to|visit|launch)\s+(.+?)(?:\s*\.com|\s*\.pk|\s*\.org)?$', text_lower)
+    if open_match:
+        target = open_match.group(1).strip()
+        target = re.sub(r'\s*(website|site|page|app)$', '', target).strip()
+        if target in DOMAIN_MAP:
+            return Intent.OPEN_WEBSITE, target
+        app_names = ['notepad', 'calculator', 'calc', 'explorer', 'settings',
+                     'word', 'excel', 'powerpoint', 'chrome', 'brave',
+                     'firefox', 'vscode', 'code', 'terminal', 'cmd',
+                     'powershell', 'whatsapp', 'discord', 'spotify', 'slack',
+                     'task manager', 'file explorer']
+        if target in app_names:
+            return Intent.OPEN_APP, target
+        if re.search(r'\.(com|org|net|pk|io|ai|dev|co)$', target):
+            return Intent.OPEN_WEBSITE, target
+        # Near-miss lookup (added with the fuzzy resolver, kept for parity)
+        near = get_fuzzy_resolver().resolve(target, kinds=("website", "app"))
+        if near:
+            return (Intent.OPEN_APP if near.kind == "app" else Intent.OPEN_WEBSITE), near.name
+        return Intent.OPEN_WEBSITE, target
+
+    if any(kw in text_lower for kw in ['screenshot', 'screen shot', 'capture', 'snap']):
+        return Intent.SCREENSHOT, None
+
+    system_keywords = ['shutdown', 'restart', 'lock', 'sleep', 'hibernate',
+                       'minimize', 'maximize', 'close', 'status', 'battery']
+    if any(kw in text_lower for kw in system_keywords):
+        return Intent.SYSTEM_CONTROL, text_lower
+
+    browser_keywords = ['new tab', 'close tab', 'refresh', 'next tab', 'switch tab']
+    if any(kw in text_lower for kw in browser_keywords):
+        return Intent.BROWSER_CONTROL, text_lower
+
+    essay_patterns = ['write an essay', 'write essay', 'compose an essay',
+                      'write a document', 'write a letter', 'write a report']
+    if any(pattern in text_lower for pattern in essay_patterns):
+        topic = re.sub(r'^(write|compose|create)\s+(an?\s+)?(essay|document|letter|report)\s+(about|on|regarding)?\s*', '', text_lower)
+        return Intent.MULTI_STEP, topic.strip() if topic.strip() else text_lower
+
+    if text_lower.startswith('type '):
+        return Intent.TYPE_TEXT, text_lower[5:]
+
+    if any(kw in text_lower for kw in ['create folder', 'delete file', 'new folder', 'remove']):
+        return Intent.FILE_OPERATION, text_lower
+
+    if ' and ' in text_lower and any(kw in text_lower for kw in ['open', 'then', 'after']):
+        return Intent.MULTI_STEP, text_lower
+
+    return Intent.UNKNOWN, text_lower
+
+
+def check_golden():
+    """
+    Both classifiers must agree on every utterance in the corpus, and
+    NOT_NAMES must not be resolved to a known site or app.
+    """
+    mismatches = []
+    for text in GOLDEN_CORPUS:
+        expected = classify_sequential(text)
+        actual = IntentClassifier.classify(text)
+        if expected != actual:
+            mismatches.append((text, expected, actual))
+        elif text in NOT_NAMES and actual[1] != NOT_NAMES[text]:
+            mismatches.append((text, NOT_NAMES[text], actual))
+    return mismatches
+
+
+def time_classifier(fn, iterations):
+    """Return mean microseconds per utterance."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in GOLDEN_CORPUS:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(GOLDEN_CORPUS)) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    mismatches = check_golden()
+    if mismatches:
+        for text, expected, actual in mismatches:
+            print(f"MISMATCH {text!r}: expected {expected}, compiled={actual}")
+        sys.exit(1)
+    print(f"Golden corpus: {len(GOLDEN_CORPUS)} utterances, all match.")
+
+    before = time_classifier(classify_sequential, iterations)
+    after = time_classifier(IntentClassifier.classify, iterations)
+
+    print(f"sequential : {before:7.2f} us/utterance")
+    print(f"compiled   : {after:7.2f} us/utterance")
+    print(f"speedup    : {before / after:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+End-to-End LLM Latency Benchmark
+Drives get_operator_plan (LLM-bound commands) and generate_essay through the
+offline fake LLM server and reports p50/p95/p99 latency. Runs are
+deterministic for a given set of arguments.
+
+Usage:
+    python -m benchmarks.bench_llm_latency [iterations] [ttfb_ms] [tokens_per_sec] [error_rate]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.fake_llm_server import FakeLLMServer
+
+# Every command must reach the LLM tier
+os.environ["PLAN_CACHE_SIZE"] = "0"
+os.environ["LOCAL_INTENT_TIER"] = "0"
+os.environ.setdefault("GROQ_API_KEY", "offline-benchmark")
+
+from app.latency import LatencyHistogram
+
+
+LLM_COMMANDS = [
+    "find me something relaxing to do",
+    "summarize the plot of hamlet",
+    "create folder projects and open it",
+    "set up my workspace for coding",
+]
+
+ESSAY_TOPICS = ["renewable energy", "the printing press", "urban gardening"]
+
+
+def measure(fn, args_cycle, iterations):
+    histogram = LatencyHistogram()
+    results = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        results.append(fn(args_cycle[i % len(args_cycle)]))
+        histogram.record(time.perf_counter() - start)
+    return histogram, results
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    ttfb_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 150.0
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 800.0
+    error_rate = float(sys.argv[4]) if len(sys.argv) > 4 else 0.0
+
+    server = FakeLLMServer(tokens_per_sec=rate, ttfb=ttfb_ms / 1000.0, error_rate=error_rate)
+    with server:
+        # The shared Groq client reads GROQ_BASE_URL when it is first built
+        os.environ["GROQ_BASE_URL"] = server.base_url
+        from app import nova_brain
+
+        # Silence the per-request tier and client logging
+        stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+        try:
+            plan_hist, plans = measure(nova_brain.get_operator_plan, LLM_COMMANDS, iterations)
+            essay_hist, essays = measure(nova_brain.generate_essay, ESSAY_TOPICS, iterations)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    failed_plans = sum(1 for p in plans if p["plan"][0].get("payload", "").startswith("Had an issue"))
+    # The stand-in titles essays "On <Topic>"; anything else is the local fallback
+    fallback_essays = sum(1 for e in essays if not e.get("title", "").startswith("On "))
+
+    print(f"fake server: TTFB {ttfb_ms:g} ms, {rate:g} tokens/s, error rate {error_rate:g} "
+          f"({server.requests} requests, {server.errors} injected errors)")
+    print(f"{'':<18} {'n':>4} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for label, histogram in (("get_operator_plan", plan_hist), ("generate_essay", essay_hist)):
+        s = histogram.summary()
+        print(f"{label:<18} {s['count']:>4} {s['p50_ms']:>7.1f}ms {s['p95_ms']:>7.1f}ms {s['p99_ms']:>7.1f}ms")
+    print(f"failed plans: {failed_plans}/{len(plans)}, fallback essays: {fallback_essays}/{len(essays)}")
+
+
+if __name__ == "__main__":
+    main()
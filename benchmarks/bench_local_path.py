@@ -0,0 +1,81 @@
+"""
+Local Path Benchmark
+Drives get_operator_plan over commands the local tiers (Sentinel, FastPath,
+nearest phrasing) answer without the LLM, with the plan cache off, and
+prints the end-to-end percentiles and the per-tier spans.
+
+Usage:
+    python -m benchmarks.bench_local_path [rounds]
+"""
+
+import os
+import sys
+import time
+
+# Every repeat must reach the tiers, not the plan cache
+os.environ["PLAN_CACHE_SIZE"] = "0"
+os.environ.setdefault("GROQ_API_KEY", "offline-benchmark")
+
+from app import nova_brain
+from app.latency import LatencyHistogram
+
+
+COMMANDS = [
+    # Sentinel
+    "open youtube", "open notepad", "play lofi beats", "take a screenshot",
+    "new tab", "type hello world", "hello", "stop",
+    # FastPath
+    "thanks", "what can you do", "who are you", "lock my pc", "status",
+    "write an essay on renewable energy", "open you tube",
+    # Nearest phrasing
+    "bring up the task manager", "reopen the tab i closed", "make text bigger",
+]
+
+
+class NoLLM(nova_brain.LLMProcessor):
+    """Fails the run if a command falls through to the LLM."""
+
+    def __init__(self):
+        pass
+
+    def process(self, user_text):
+        raise AssertionError(f"reached the LLM: {user_text}")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    nova_brain._llm = NoLLM()
+    sentinel = nova_brain.get_sentinel()
+    histogram = LatencyHistogram(max_samples=rounds * len(COMMANDS))
+
+    # Silence the per-command tier logging
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    try:
+        # Build the nearest-phrasing index outside the timed loop
+        nova_brain.get_operator_plan(COMMANDS[-1])
+        nova_brain.TIER_LATENCY.histograms.clear()
+        for _ in range(rounds):
+            for command in COMMANDS:
+                sentinel.guard.clear()
+                start = time.perf_counter()
+                nova_brain.get_operator_plan(command)
+                histogram.record(time.perf_counter() - start)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    s = histogram.summary()
+    print(f"get_operator_plan (local): n={s['count']} mean={s['mean_ms'] * 1000:.1f}us "
+          f"p50={s['p50_ms'] * 1000:.1f}us p95={s['p95_ms'] * 1000:.1f}us "
+          f"p99={s['p99_ms'] * 1000:.1f}us")
+    print(f"{'tier':<10} {'n':>6} {'mean':>9} {'p50':>9} {'p95':>9}")
+    for name in ("normalize", "classify", "sentinel", "fast", "nearest"):
+        t = nova_brain.TIER_LATENCY.get(name).summary()
+        if t["count"]:
+            print(f"{name:<10} {t['count']:>6} {t['mean_ms'] * 1000:>7.1f}us "
+                  f"{t['p50_ms'] * 1000:>7.1f}us {t['p95_ms'] * 1000:>7.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Nearest-Intent Tier Benchmark
+Query latency of the TF-IDF nearest-neighbour tier (NumPy and pure Python)
+and how many labelled paraphrases it answers correctly, wrongly, or leaves
+to the LLM at a few thresholds.
+
+Usage:
+    python -m benchmarks.bench_nearest_intent [iterations]
+"""
+
+import sys
+import time
+
+import app.nearest_intent as nearest_intent
+from app.nova_actions import INTENT_PATTERNS, match_intent
+from app.nova_brain import SYSTEM_PROMPT
+
+
+# (utterance, expected shortcut key or None = should reach the LLM)
+PARAPHRASES = [
+    ("bring up the task manager", "task_manager"),
+    ("lock up my computer please", "lock_pc"),
+    ("can you please lock my pc", "lock_pc"),
+    ("please take a screen capture", "screenshot_full"),
+    ("go back a page", "undo"),  # "go back" is an undo phrase in INTENT_PATTERNS
+    ("can you undo that", "undo"),
+    ("reopen the tab i closed", "reopen_tab"),
+    ("make text bigger", "zoom_in"),
+    ("print this page", "print"),
+    ("open the file explorer", "file_explorer"),
+    ("switch over to the next window", "switch_window"),
+    ("i want to see my clipboard", "clipboard_history"),
+    ("what is rust", None),
+    ("open yahoo", None),
+    ("write a poem about cats", None),
+    ("turn the volume up", None),
+    ("check my email", None),
+    ("open my downloads", None),
+    # Close in trigrams, different (or negated) command
+    ("unlock my computer", None),
+    ("save everything", None),
+    ("delete everything", None),
+    ("don't take a screenshot", None),
+    ("never minimize all", None),
+]
+
+
+def shortcut_of(match):
+    """Shortcut key a nearest match would execute (via its WINDOWS_SHORTCUT payload)."""
+    if match is None:
+        return None
+    for step in match.plan:
+        if step.get("action") == "WINDOWS_SHORTCUT":
+            return match_intent(step["payload"])[0]
+    return step.get("action")
+
+
+def time_queries(index, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text, _ in PARAPHRASES:
+            index.query(text)
+    return (time.perf_counter() - start) / (iterations * len(PARAPHRASES)) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    index = nearest_intent.build_nearest_intent_index(SYSTEM_PROMPT, INTENT_PATTERNS)
+    print(f"{len(index)} phrasings indexed")
+
+    for threshold in (0.6, 0.7, 0.8):
+        correct = wrong = to_llm = 0
+        for text, expected in PARAPHRASES:
+            actual = shortcut_of(index.query(text, threshold))
+            if actual is None:
+                to_llm += 1
+            elif actual == expected:
+                correct += 1
+            else:
+                wrong += 1
+        print(f"threshold {threshold:.1f}: {correct} answered correctly, "
+              f"{wrong} wrong, {to_llm} left to the LLM")
+
+    backends = [("numpy", nearest_intent.np)] if nearest_intent.np is not None else []
+    backends.append(("python", None))
+    for label, module in backends:
+        nearest_intent.np = module
+        index = nearest_intent.build_nearest_intent_index(SYSTEM_PROMPT, INTENT_PATTERNS)
+        print(f"{label:<6}: {time_queries(index, iterations):7.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
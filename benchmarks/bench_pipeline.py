@@ -0,0 +1,138 @@
+"""
+Pipeline Benchmark
+Plays spoken commands (synthetic WAV clips, transcripts looked up per
+clip) at a real-time pace into the engine while every OS step takes a
+fixed time, and compares the staged pipeline with the old serial loop
+(listen -> recognize -> plan -> execute, listening only while idle).
+Reports commands executed and the latency from the end of each utterance
+to the end of its command.
+
+Usage:
+    python -m benchmarks.bench_pipeline [step_seconds] [speed]
+"""
+
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import wave
+
+import speech_recognition as sr
+
+from app import main as bot
+from app.audio_capture import CaptureStream, WavFileSource
+from app.main import NovaBotEngine, RecognizerBackend
+from app.sentinel_core import SessionContext, get_sentinel
+from benchmarks.wav_corpus import build_corpus
+
+# Local-tier commands (no LLM round-trip), one per clip
+APPS = ("notepad", "calculator", "chrome", "explorer", "word", "excel")
+
+
+class ClipTranscripts(RecognizerBackend):
+    """Finds which clip an utterance came from and returns its transcript."""
+
+    name = "clips"
+
+    def __init__(self, clips, transcripts):
+        self.clips = []
+        for clip, text in zip(clips, transcripts):
+            with wave.open(clip.path, "rb") as w:
+                self.clips.append((w.readframes(w.getnframes()), text))
+
+    def recognize(self, audio):
+        data = audio.frame_data
+        middle = len(data) // 2 & ~1
+        probe = data[middle:middle + 2048]
+        for pcm, text in self.clips:
+            if probe and pcm.find(probe) >= 0:
+                return text
+        raise sr.UnknownValueError()
+
+
+class SlowSteps:
+    """Stands in for nova_os.execute_step: sleeps, records when each app finished."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.finished = {}
+
+    def __call__(self, step):
+        time.sleep(self.seconds)
+        self.finished[str(step.get("payload", "")).lower()] = time.perf_counter()
+        return f"Opened {step.get('payload')}"
+
+
+async def serial_loop(engine):
+    """The loop before the pipeline: listens only between commands."""
+    engine.capture = capture = CaptureStream(engine.audio_source).start()
+    while engine._running:
+        capture.listen()
+        try:
+            audio = await engine._listen_with_level_monitoring(capture, timeout=10)
+        finally:
+            capture.stop_listening()
+        if audio is None:
+            if capture.ended:
+                break
+            continue
+        try:
+            text, _ = engine.asr.recognize(audio)
+        except (sr.UnknownValueError, sr.RequestError):
+            continue
+        await engine._execute_plan(engine._plan_steps(text))
+    capture.stop()
+
+
+def run(mode, clips, step_seconds, speed):
+    transcripts = [f"open {app}" for app in APPS[:len(clips)]]
+    # Same commands in every run - forget what the last run opened
+    get_sentinel().guard.clear()
+    get_sentinel().context = SessionContext()
+    steps = SlowSteps(step_seconds)
+    bot.nova_os.execute_step = steps
+    source = WavFileSource([c.path for c in clips], realtime=True, speed=speed, trailing_silence=1.5)
+    engine = NovaBotEngine(audio_source=source, log_callback=lambda m: None,
+                           asr_backends=[ClipTranscripts(clips, transcripts)])
+
+    async def muted(text, is_content=False):
+        pass
+    engine.speak = muted
+    engine._running = True
+
+    start = time.perf_counter()
+    asyncio.run(serial_loop(engine) if mode == "serial" else engine._listen_and_execute())
+    elapsed = time.perf_counter() - start
+
+    # Utterance ends on the wall clock, from the clip labels
+    latencies, offset = [], 0.0
+    for clip, app in zip(clips, APPS):
+        with wave.open(clip.path, "rb") as w:
+            length = w.getnframes() / w.getframerate()
+        spoken = start + (offset + clip.speech_end) / speed
+        if app in steps.finished:
+            latencies.append(steps.finished[app] - spoken)
+        offset += length
+    return len(latencies), latencies, elapsed
+
+
+def main():
+    # Longer than the gap between clips, so the serial loop misses commands
+    step_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 6.0
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    corpus = build_corpus(tempfile.mkdtemp(prefix="autobot_pipeline_"), per_condition=2)
+    # Same SNR throughout, so consecutive clips keep one noise level
+    clips = [c for c in corpus if c.snr_db == 20][:len(APPS)]
+    print(f"{len(clips)} commands at {speed:g}x speed, {step_seconds:g}s per OS step\n")
+
+    print(f"{'':<10} {'executed':>9} {'latency p50':>12} {'max':>8} {'total':>8}")
+    for mode in ("serial", "pipeline"):
+        executed, latencies, elapsed = run(mode, clips, step_seconds, speed)
+        p50 = statistics.median(latencies) if latencies else float("nan")
+        worst = max(latencies) if latencies else float("nan")
+        print(f"{mode:<10} {executed:>5}/{len(clips):<3} {p50:>11.2f}s {worst:>7.2f}s {elapsed:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
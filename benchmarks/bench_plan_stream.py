@@ -0,0 +1,53 @@
+"""
+Streaming Plan Benchmark
+Runs LLMProcessor against the local fake LLM server and compares when the
+first plan step is available: streamed (PlanStreamParser) vs. waiting for
+the whole completion.
+
+Usage:
+    python -m benchmarks.bench_plan_stream [runs] [tokens_per_sec]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.fake_llm_server import DEFAULT_PLAN, FakeLLMServer
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 200.0
+
+    with FakeLLMServer(tokens_per_sec=rate) as server:
+        os.environ["GROQ_BASE_URL"] = server.base_url
+        from app.nova_brain import LLMProcessor
+        llm = LLMProcessor()
+
+        full, first, last = [], [], []
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = llm.process("take notes")
+            full.append(time.perf_counter() - start)
+            assert result["plan"] == DEFAULT_PLAN["plan"], result
+
+            start = time.perf_counter()
+            steps = []
+            for step in llm.stream("take notes"):
+                if not steps:
+                    first.append(time.perf_counter() - start)
+                steps.append(step)
+            last.append(time.perf_counter() - start)
+            assert steps == DEFAULT_PLAN["plan"], steps
+
+    def mean_ms(values):
+        return sum(values) / len(values) * 1000
+
+    print(f"{runs} runs at {rate:g} tokens/s, {len(DEFAULT_PLAN['plan'])}-step plan")
+    print(f"blocking  : first step after {mean_ms(full):7.1f} ms")
+    print(f"streaming : first step after {mean_ms(first):7.1f} ms "
+          f"(last after {mean_ms(last):.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Plan Tracks Benchmark
+Time until the first and the last reply of a plan is heard, and until
+the whole plan is done, for mixed speech/action plans: every step in
+order (the old loop) vs. the PlanExecutor's speech and OS tracks, with
+completion reports waiting for their action by default. Actions are
+blocking macros run on the StepExecutor; speech goes through InstantTTS
+on the silent NullVoice.
+
+Usage:
+    python -m benchmarks.bench_plan_tracks [macro_seconds] [speed]
+"""
+
+import asyncio
+import sys
+import time
+
+from app import cancellation
+from app.plan_executor import SPEECH_ACTIONS, PlanExecutor
+from app.step_executor import StepExecutor
+from app.tts import InstantTTS, NullVoice
+
+FIRST_AUDIO = 0.05
+PLANS = {
+    "launch + confirm": [
+        {"action": "LAUNCH_SYS", "payload": "notepad"},
+        {"action": "RESPONSE", "payload": "Launching notepad.", "after": []},
+    ],
+    "essay": [
+        {"action": "RESPONSE", "payload": "Writing an essay about the ocean."},
+        {"action": "LAUNCH_SYS", "payload": "winword"},
+        {"action": "WRITE_ESSAY", "payload": "the ocean"},
+        {"action": "RESPONSE", "payload": "Essay complete. Check Word."},
+    ],
+    "announce, act, report": [
+        {"action": "RESPONSE", "payload": "Opening notepad and typing your note."},
+        {"action": "LAUNCH_SYS", "payload": "notepad"},
+        {"action": "TYPE_STRING", "payload": "buy milk"},
+        {"action": "RESPONSE", "payload": "Your note is written down, anything else?"},
+    ],
+}
+# Macro length per action, as a multiple of macro_seconds
+WEIGHTS = {"LAUNCH_SYS": 1.0, "TYPE_STRING": 0.5, "WRITE_ESSAY": 3.0}
+
+
+def macro(seconds):
+    """Blocking action in 100 ms slices, like NovaOS macros between key presses."""
+    def run(step):
+        end = time.perf_counter() + seconds * WEIGHTS.get(step["action"], 1.0)
+        while time.perf_counter() < end:
+            cancellation.sleep(min(0.1, max(0.0, end - time.perf_counter())))
+        return "done"
+    return run
+
+
+async def run_plan(plan, tracks, seconds, speed):
+    tts = InstantTTS(voice=NullVoice(words_per_minute=180.0 * speed, first_audio=FIRST_AUDIO))
+    steps = StepExecutor(macro(seconds))
+    start = time.perf_counter()
+    heard = []
+
+    async def speak(step):
+        handle = tts.speak(step["payload"])
+        await asyncio.to_thread(handle.wait_started)
+        heard.append(handle.first_audio)
+
+    async def act(step):
+        await steps.run(step)
+        return True
+
+    async def listed():
+        for step in plan:
+            yield step
+
+    if tracks:
+        await PlanExecutor(speak, act).run(listed())
+    else:
+        for step in plan:
+            await (speak(step) if step["action"] in SPEECH_ACTIONS else act(step))
+    total = time.perf_counter() - start
+    tts.close()
+    return min(heard) - start, max(heard) - start, total
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    print(f"LAUNCH_SYS macro {seconds:g}s, speech at {speed:g}x 180 wpm (NullVoice)\n")
+    print(f"{'':<22} | {'in order':^26} | {'tracks':^26}")
+    print(f"{'plan':<22} | {'first':>8} {'last':>8} {'done':>8} | {'first':>8} {'last':>8} {'done':>8}")
+    for name, plan in PLANS.items():
+        row = []
+        for tracks in (False, True):
+            first, last, total = asyncio.run(run_plan(plan, tracks, seconds, speed))
+            row.append(f"{first:7.2f}s {last:7.2f}s {total:7.2f}s")
+        print(f"{name:<22} | {row[0]} | {row[1]}")
+
+
+if __name__ == "__main__":
+    main()
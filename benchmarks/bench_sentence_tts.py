@@ -0,0 +1,62 @@
+"""
+Sentence-Chunked TTS Benchmark
+Time to the first word, total time and silence between pieces for CHAT
+answers of one to eight sentences, spoken as one piece (the whole answer
+synthesized before anything plays) vs. sentence by sentence (the next
+sentence synthesized while the current one plays).
+
+Runs on the silent NullVoice: synthesis takes first_audio plus
+synth_ms per word of the piece, and speech plays at `speed` x 180 words
+per minute to keep the run short.
+
+Usage:
+    python -m benchmarks.bench_sentence_tts [synth_ms] [speed]
+"""
+
+import sys
+import time
+
+from app.tts import InstantTTS, NullVoice
+
+FIRST_AUDIO = 0.05
+SENTENCES = (1, 2, 4, 8)
+ANSWER = [
+    "Black holes form when massive stars collapse at the end of their lives.",
+    "Their gravity is so strong that not even light can escape.",
+    "The boundary around them is called the event horizon.",
+    "Anything that crosses it, including light, can never come back out.",
+    "Supermassive black holes sit at the centre of most large galaxies.",
+    "The one in our galaxy is about four million times the mass of the Sun.",
+    "Astronomers photographed its shadow for the first time in 2022.",
+    "Smaller ones are found by the X-rays from gas falling into them.",
+]
+
+
+def speak(sentences, chunk_words, synth, speed):
+    voice = NullVoice(words_per_minute=180.0 * speed, first_audio=FIRST_AUDIO,
+                      synthesis_per_word=synth)
+    tts = InstantTTS(voice=voice, chunk_words=chunk_words)
+    handle = tts.speak(" ".join(ANSWER[:sentences]))
+    handle.wait()
+    total = time.perf_counter() - handle.queued_at
+    tts.close()
+    return handle.first_audio - handle.queued_at, total, voice.gaps
+
+
+def main():
+    synth = (float(sys.argv[1]) if len(sys.argv) > 1 else 15.0) / 1000.0
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    print(f"synthesis {FIRST_AUDIO * 1000:.0f} ms + {synth * 1000:g} ms/word, "
+          f"speech at {speed:g}x 180 wpm (NullVoice)\n")
+    print(f"{'sentences':>9} {'words':>6} | {'one piece: first word':>21} {'total':>7} | "
+          f"{'by sentence: first word':>23} {'total':>7} {'gaps':>7}")
+    for count in SENTENCES:
+        words = len(" ".join(ANSWER[:count]).split())
+        whole_first, whole_total, _ = speak(count, 0, synth, speed)
+        first, total, gaps = speak(count, 20, synth, speed)
+        print(f"{count:>9} {words:>6} | {whole_first * 1000:19.0f}ms {whole_total:6.2f}s | "
+              f"{first * 1000:21.0f}ms {total:6.2f}s {gaps * 1000:5.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
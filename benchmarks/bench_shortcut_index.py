@@ -0,0 +1,101 @@
+"""
+Shortcut Intent Matching Benchmark
+Compares the original linear match_intent scorer against the inverted-index
+ShortcutIndex, on the real INTENT_PATTERNS table and on one grown 10x.
+
+Usage:
+    python -m benchmarks.bench_shortcut_index [iterations]
+"""
+
+import sys
+import time
+
+from app.keyword_engine import KeywordAutomaton
+from app.nova_actions import INTENT_PATTERNS, normalize_intent
+from app.shortcut_index import ShortcutIndex
+
+
+QUERIES = [
+    "lock my pc", "open task manager please", "close this window now",
+    "switch to another window", "minimize everything", "take screenshot",
+    "snip this region", "copy that", "undo that please", "reopen closed tab",
+    "open incognito mode", "zoom in a little", "show me the clipboard history",
+    "what time is it", "play some music", "create new folder on desktop",
+    "make the window bigger", "go back", "refresh page", "open emoji picker",
+]
+
+
+def match_linear(patterns, text):
+    """Original scorer: every phrase of every shortcut, sets rebuilt per phrase."""
+    best_match = None
+    best_score = 0
+
+    for shortcut_key, key_patterns in patterns.items():
+        for pattern in key_patterns:
+            pattern_lower = pattern.lower()
+
+            if text == pattern_lower:
+                return (shortcut_key, 1.0)
+
+            if pattern_lower in text:
+                score = len(pattern_lower) / len(text) * 0.9
+                if score > best_score:
+                    best_score = score
+                    best_match = shortcut_key
+            else:
+                pattern_words = set(pattern_lower.split())
+                text_words = set(text.split())
+                common_words = pattern_words & text_words
+
+                if common_words and len(common_words) >= len(pattern_words) * 0.5:
+                    score = len(common_words) / len(pattern_words) * 0.7
+                    if score > best_score:
+                        best_score = score
+                        best_match = shortcut_key
+
+    return (best_match, best_score)
+
+
+def grow_table(patterns, factor):
+    """Return a table with `factor` times as many shortcuts (synthetic variants)."""
+    grown = dict(patterns)
+    for n in range(1, factor):
+        for shortcut_key, key_patterns in patterns.items():
+            grown[f"{shortcut_key}_v{n}"] = [f"{p} variant{n}" for p in key_patterns]
+    return grown
+
+
+def time_fn(fn, queries, iterations):
+    """Return mean microseconds per query."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for q in queries:
+            fn(q)
+    return (time.perf_counter() - start) / (iterations * len(queries)) * 1e6
+
+
+def run(label, patterns, iterations):
+    index = ShortcutIndex(patterns, engine=KeywordAutomaton())
+    queries = [normalize_intent(q) for q in QUERIES]
+
+    for q in queries:
+        expected = match_linear(patterns, q)
+        actual = index.score(q)
+        if expected != actual:
+            print(f"MISMATCH {q!r}: linear={expected} index={actual}")
+            sys.exit(1)
+
+    linear = time_fn(lambda q: match_linear(patterns, q), queries, iterations)
+    indexed = time_fn(index.score, queries, iterations)
+    print(f"{label:<6} {len(index):>5} phrases | linear {linear:8.1f} us | "
+          f"index {indexed:6.1f} us | {linear / indexed:5.1f}x")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    run("1x", INTENT_PATTERNS, iterations)
+    run("10x", grow_table(INTENT_PATTERNS, 10), iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Speculative LLM Benchmark
+Drives get_operator_plan in sequential and speculative mode over a mix of
+local and LLM-bound commands, with the Groq call replaced by a fixed-delay
+stand-in, and prints the per-mode latency histograms.
+
+Usage:
+    python -m benchmarks.bench_speculative_llm [rounds] [llm_ms]
+"""
+
+import os
+import sys
+import time
+
+# Every repeat must reach the tiers, not the plan cache
+os.environ["PLAN_CACHE_SIZE"] = "0"
+
+from app import nova_brain
+
+
+COMMANDS = [
+    # Local tiers
+    "status report", "new tab", "type hello world", "take a screenshot",
+    "what can you do", "minimize", "lock the computer", "hello", "thanks",
+    # LLM-bound
+    "what is the capital of australia", "summarize the plot of hamlet",
+    "find me something relaxing to do", "explain how vaccines work",
+    "create folder projects and open it",
+]
+
+
+class DelayedLLM(nova_brain.LLMProcessor):
+    """LLMProcessor with the network round-trip replaced by a sleep."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def process(self, user_text: str) -> dict:
+        self.calls += 1
+        time.sleep(self.delay)
+        return {
+            "plan": [{"action": "CHAT", "payload": "Stand-in answer."}],
+            "fast_path": False,
+            "intent": "llm_processed",
+        }
+
+
+def run(speculative: bool, rounds: int, llm: DelayedLLM):
+    nova_brain.SPECULATIVE_LLM = speculative
+    for _ in range(rounds):
+        for command in COMMANDS:
+            nova_brain.get_sentinel().guard.clear()
+            nova_brain.get_operator_plan(command)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 250) / 1000.0
+
+    llm = DelayedLLM(delay)
+    nova_brain._llm = llm
+
+    # Silence the per-command tier logging
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    try:
+        run(False, rounds, llm)
+        sequential_calls = llm.calls
+        run(True, rounds, llm)
+        speculative_calls = llm.calls - sequential_calls
+        nova_brain._get_llm_executor().shutdown(wait=True)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(nova_brain.plan_latency_report())
+    print(f"LLM calls: sequential={sequential_calls} speculative={speculative_calls}")
+
+
+if __name__ == "__main__":
+    main()
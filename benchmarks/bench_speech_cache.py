@@ -0,0 +1,95 @@
+"""
+Speech Cache Benchmark
+Time until a reply's audio is ready to play, over a stream of replies
+shaped like real use (Personality phrases plus "Opening <app>." templates):
+no cache (synthesize every reply), a cold cache, and a cache whose static
+Personality phrases were pre-rendered at startup.
+
+Uses Edge-TTS when installed (needs network). Otherwise a stand-in
+synthesizer waits synth_ms per phrase and writes a dummy file, so the
+numbers show the cache's effect, not Edge-TTS's speed.
+
+Usage:
+    python -m benchmarks.bench_speech_cache [replies] [synth_ms]
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from app.sentinel_core import Personality
+from app.speech_cache import SpeechCache, edge_synthesize, edge_tts, static_phrases
+
+CATEGORIES = ["done", "already", "blocked", "greeting", "thanks", "unknown_site", "essay"]
+APPS = ["chrome", "spotify", "notepad", "word", "calculator", "youtube", "gmail", "discord"]
+
+
+def reply_stream(count, seed=0):
+    rng = random.Random(seed)
+    random.seed(seed)    # Personality.get picks with the random module
+    replies = []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            replies.append(Personality.get(rng.choice(CATEGORIES)))
+        else:
+            replies.append(f"Opening {rng.choice(APPS).title()}.")
+    return replies
+
+
+def stand_in(seconds):
+    async def synthesize(text, voice, rate, path):
+        await asyncio.sleep(seconds)
+        with open(path, "wb") as f:
+            f.write(b"\0" * (400 * len(text.split())))
+    return synthesize
+
+
+async def run(replies, synthesize, mode):
+    directory = tempfile.mkdtemp(prefix="speech_cache_")
+    try:
+        cache = SpeechCache(directory, synthesize=synthesize)
+        prerender = 0.0
+        if mode == "pre-rendered":
+            start = time.perf_counter()
+            await cache.prerender(static_phrases())
+            prerender = time.perf_counter() - start
+        hits, misses = cache.stats.hits, cache.stats.misses
+        ready = []
+        for text in replies:
+            start = time.perf_counter()
+            if mode == "no cache":
+                path = os.path.join(directory, "response.mp3")
+                await synthesize(text, "", "", path)
+            else:
+                await cache.render(text)
+            ready.append(time.perf_counter() - start)
+        hits, misses = cache.stats.hits - hits, cache.stats.misses - misses
+        return sorted(ready), hits / (hits + misses) if mode != "no cache" else 0.0, prerender
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    synth_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 400.0
+    if edge_tts is not None:
+        synthesize, label = edge_synthesize, "Edge-TTS"
+    else:
+        synthesize, label = stand_in(synth_ms / 1000.0), f"stand-in synthesizer ({synth_ms:.0f} ms)"
+    replies = reply_stream(count)
+    print(f"{count} replies, {len(set(replies))} distinct, {len(static_phrases())} static phrases; {label}\n")
+    print(f"{'':<14} {'p50':>9} {'p95':>9} {'mean':>9} {'hit rate':>9} {'startup':>9}")
+    for mode in ("no cache", "cold cache", "pre-rendered"):
+        ready, hit_rate, prerender = asyncio.run(run(replies, synthesize, mode))
+        p95 = ready[min(len(ready) - 1, int(0.95 * len(ready)))]
+        print(f"{mode:<14} {statistics.median(ready) * 1000:7.2f}ms {p95 * 1000:7.2f}ms "
+              f"{statistics.mean(ready) * 1000:7.2f}ms {hit_rate:8.0%} {prerender:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
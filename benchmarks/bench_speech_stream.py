@@ -0,0 +1,95 @@
+"""
+Speech Stream Benchmark
+First-audio latency of an Edge-TTS reply: the file path (write the whole
+stream to response.mp3, then play it) vs. streaming playback (queue MP3
+frames on the mixer as they arrive). Also total time to the end of the
+audio and how often streaming ran dry (underruns), for replies of one to
+four sentences.
+
+Uses Edge-TTS when installed (needs network). Otherwise a stand-in stream
+sends valid 24 kHz MP3 frames: the first chunk after ttfb_ms, the rest at
+`speed` x real time. Playback is silent (NullOutput) either way, so timings
+measure delivery, not the sound card.
+
+Usage:
+    python -m benchmarks.bench_speech_stream [ttfb_ms] [speed]
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from app.speech_cache import edge_audio, edge_tts
+from app.speech_stream import Mp3Frames, NullOutput, StreamPlayer
+
+SENTENCE = "The weather in London today is mild with light rain expected this evening."
+SENTENCES = (1, 2, 4)
+# MPEG-2 Layer III, 48 kbps, 24 kHz, mono: 144-byte frames of 24 ms (Edge-TTS's format)
+FRAME = bytes([0xFF, 0xF3, 0x64, 0xC4]) + bytes(140)
+FRAME_SECONDS = 576 / 24000
+SECONDS_PER_WORD = 0.33
+FRAMES_PER_CHUNK = 4
+
+
+def stand_in(ttfb, speed):
+    async def stream(text, voice=None, rate=None):
+        frames = int(len(text.split()) * SECONDS_PER_WORD / FRAME_SECONDS)
+        await asyncio.sleep(ttfb)
+        for sent in range(0, frames, FRAMES_PER_CHUNK):
+            count = min(FRAMES_PER_CHUNK, frames - sent)
+            yield FRAME * count
+            await asyncio.sleep(count * FRAME_SECONDS / speed)
+    return stream
+
+
+async def file_path(audio, text, directory):
+    """Old speak(): whole stream to a file, then load and play it."""
+    start = time.perf_counter()
+    path = os.path.join(directory, "response.mp3")
+    with open(path, "wb") as f:
+        async for data in audio(text):
+            f.write(data)
+    if not os.path.getsize(path):
+        return None, None
+    with open(path, "rb") as f:
+        frames = Mp3Frames().feed(f.read())
+    output = NullOutput()
+    output.queue(b"", sum(s for _, s in frames))
+    first = output.started_at - start
+    while output.busy():
+        await asyncio.sleep(0.005)
+    return first, time.perf_counter() - start
+
+
+async def streamed(audio, text):
+    result = await StreamPlayer(NullOutput()).play(audio(text))
+    return result.first_audio, result.finished, result.underruns
+
+
+def main():
+    ttfb = (float(sys.argv[1]) if len(sys.argv) > 1 else 300.0) / 1000.0
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 4.0
+    if edge_tts is not None:
+        audio, label = edge_audio, "Edge-TTS"
+    else:
+        audio, label = stand_in(ttfb, speed), f"stand-in stream (first chunk {ttfb * 1000:.0f} ms, {speed:g}x real time)"
+    directory = tempfile.mkdtemp(prefix="speech_stream_")
+    print(f"{label}\n")
+    print(f"{'sentences':>9} {'file: first audio':>18} {'stream: first audio':>20} "
+          f"{'file: done':>11} {'stream: done':>13} {'underruns':>10}")
+    try:
+        for count in SENTENCES:
+            text = " ".join([SENTENCE] * count)
+            file_first, file_done = asyncio.run(file_path(audio, text, directory))
+            first, done, underruns = asyncio.run(streamed(audio, text))
+            print(f"{count:>9} {file_first * 1000:16.0f}ms {first * 1000:18.0f}ms "
+                  f"{file_done:10.2f}s {done:12.2f}s {underruns:>10}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Step Executor Benchmark
+How late a 5 ms event-loop timer fires while a blocking 2 s macro runs:
+called inside the coroutine (the old engine) vs. on the StepExecutor
+worker. Also the executor's round-trip overhead for an empty step, and
+how soon a step that overruns its budget is stopped.
+
+Usage:
+    python -m benchmarks.bench_steps [macro_seconds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from app import cancellation
+from app.step_executor import StepExecutor
+
+TICK_SECONDS = 0.005
+
+
+def macro(seconds):
+    """Waits in 100 ms slices, like NovaOS macros between actions."""
+    def run(step):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            cancellation.sleep(0.1)
+        return "done"
+    return run
+
+
+async def probe(lags, done):
+    while not done.is_set():
+        due = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - due))
+
+
+async def loop_lag(seconds, on_loop):
+    lags, done = [], asyncio.Event()
+    task = asyncio.create_task(probe(lags, done))
+    await asyncio.sleep(0.05)
+    step = {"action": "TYPE_IN_WORD"}
+    if on_loop:
+        macro(seconds)(step)
+    else:
+        await StepExecutor(macro(seconds)).run(step)
+    done.set()
+    await task
+    return sorted(lags)
+
+
+async def overhead(rounds=500):
+    executor = StepExecutor(lambda step: "ok")
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await executor.run({"action": "PRESS_KEY"})
+    return (time.perf_counter() - start) / rounds
+
+
+async def timeout_stop(budget=0.5):
+    finished = []
+
+    def slow(step):
+        try:
+            macro(10.0)(step)
+        finally:
+            finished.append(time.perf_counter())
+    executor = StepExecutor(slow, timeouts={"SLOW": budget})
+    result = await executor.run({"action": "SLOW"})
+    stopped_at = time.perf_counter()
+    while not finished:
+        await asyncio.sleep(0.001)
+    return result, finished[0] - stopped_at
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    print(f"event loop lag during a {seconds:g}s macro ({TICK_SECONDS * 1000:.0f} ms timer): p50 / max")
+    for label, on_loop in (("on the loop", True), ("step executor", False)):
+        lags = asyncio.run(loop_lag(seconds, on_loop))
+        print(f"  {label:<14} {statistics.median(lags) * 1000:8.2f} / {lags[-1] * 1000:8.2f} ms "
+              f"({len(lags)} ticks)")
+
+    print(f"\nexecutor round trip: {asyncio.run(overhead()) * 1e6:.0f} us per step")
+
+    result, lingered = asyncio.run(timeout_stop())
+    print(f"over budget: status={result.status} after {result.seconds:.2f}s "
+          f"(budget {result.budget:g}s), macro stopped {lingered * 1000:.1f} ms later")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Tracing Overhead Benchmark
+Cost of recording a span (context manager and explicit record) with the
+tracer enabled and disabled, against an empty loop, plus a JSON-lines
+export of a full ring buffer.
+
+Usage:
+    python -m benchmarks.bench_tracing [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from app.tracing import Tracer
+
+
+def per_call_ns(fn, iterations):
+    start = time.perf_counter()
+    fn(iterations)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    def baseline(n):
+        for _ in range(n):
+            pass
+
+    print(f"{'':<22} {'ns/span':>8}")
+    print(f"{'empty loop':<22} {per_call_ns(baseline, iterations):>8.0f}")
+    for enabled in (True, False):
+        tracer = Tracer(capacity=4096, enabled=enabled)
+        tracer.start_trace()
+
+        def with_span(n):
+            for _ in range(n):
+                with tracer.span("step", action="LAUNCH_SYS"):
+                    pass
+
+        def with_record(n):
+            for _ in range(n):
+                tracer.record("asr", time.perf_counter())
+
+        label = "enabled" if enabled else "disabled"
+        print(f"{'span() ' + label:<22} {per_call_ns(with_span, iterations):>8.0f}")
+        print(f"{'record() ' + label:<22} {per_call_ns(with_record, iterations):>8.0f}")
+
+    tracer = Tracer(capacity=4096)
+    tracer.start_trace()
+    for i in range(4096):
+        tracer.record("plan.sentinel", time.perf_counter(), tier="sentinel")
+    path = os.path.join(tempfile.mkdtemp(), "traces.jsonl")
+    start = time.perf_counter()
+    count = tracer.export(path)
+    print(f"\nexport: {count} spans in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({os.path.getsize(path) // count} bytes/span)")
+    print(tracer.summary())
+
+
+if __name__ == "__main__":
+    main()
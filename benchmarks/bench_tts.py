@@ -0,0 +1,113 @@
+"""
+TTS Worker Benchmark
+A burst of spoken confirmations arriving faster than they can be said:
+enqueue-to-first-audio latency, how stale the newest phrase is by the time
+it is heard, and how many phrases played. Compares the old path (fresh
+voice per utterance behind an unbounded single-thread executor) with the
+InstantTTS worker (one voice, bounded latest-wins queue). Also how fast
+interrupt() silences a playing phrase.
+
+Runs on Linux with the silent NullVoice (spoken at twice normal speed to
+keep the run short); pass "sapi" on Windows to use the real voice.
+
+Usage:
+    python -m benchmarks.bench_tts [null|sapi] [phrases] [gap_ms]
+"""
+
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.tts import InstantTTS, NullVoice, SapiVoice, PLAYED
+
+PHRASES = [
+    "Opening Chrome.",
+    "Volume up.",
+    "Done.",
+    "Screenshot saved to your desktop.",
+    "Opening Spotify.",
+    "Minimizing all windows.",
+    "Got it.",
+    "Opening YouTube.",
+]
+
+
+def make_voice(kind):
+    if kind == "sapi":
+        return SapiVoice(rate=1)
+    return NullVoice(words_per_minute=360.0, first_audio=0.02)
+
+
+def legacy(kind, phrases, gap):
+    """Old InstantTTS: new voice per phrase, every phrase queued and played."""
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def say(text, queued_at):
+        voice = make_voice(kind)
+        voice.open()
+        try:
+            voice.start(text)
+            while not voice.wait(0.01):
+                pass
+            return voice.audio_started - queued_at
+        finally:
+            voice.close()
+
+    futures = []
+    for text in phrases:
+        futures.append(executor.submit(say, text, time.perf_counter()))
+        time.sleep(gap)
+    latencies = [f.result() for f in futures]
+    executor.shutdown()
+    return latencies, latencies[-1], len(latencies)
+
+
+def worker(kind, phrases, gap):
+    tts = InstantTTS(voice=make_voice(kind))
+    handles = []
+    for text in phrases:
+        handles.append(tts.speak(text))
+        time.sleep(gap)
+    for handle in handles:
+        handle.wait()
+    tts.close()
+    played = [u for u in handles if u.status == PLAYED]
+    latencies = [u.first_audio - u.queued_at for u in played]
+    newest = handles[-1]
+    return latencies, newest.first_audio - newest.queued_at, len(played)
+
+
+def interrupt_latency(kind, trials=10):
+    tts = InstantTTS(voice=make_voice(kind))
+    latencies = []
+    for _ in range(trials):
+        handle = tts.speak("This is a long answer that keeps going for quite a while longer.")
+        time.sleep(0.3)
+        start = time.perf_counter()
+        tts.interrupt()
+        handle.wait()
+        latencies.append(time.perf_counter() - start)
+    tts.close()
+    return sorted(latencies)
+
+
+def main():
+    kind = sys.argv[1] if len(sys.argv) > 1 else "null"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    gap = (float(sys.argv[3]) if len(sys.argv) > 3 else 150.0) / 1000.0
+    phrases = [PHRASES[i % len(PHRASES)] for i in range(count)]
+    print(f"{count} phrases, one every {gap * 1000:.0f} ms ({kind} voice)\n")
+    print(f"{'':<22} {'p50':>9} {'max':>9} {'newest heard':>13} {'played':>7}")
+    for label, run in (("fresh voice, FIFO", legacy), ("worker, latest-wins", worker)):
+        latencies, newest, played = run(kind, phrases, gap)
+        print(f"{label:<22} {statistics.median(latencies) * 1000:7.0f}ms "
+              f"{max(latencies) * 1000:7.0f}ms {newest * 1000:11.0f}ms {played:>4}/{count}")
+
+    latencies = interrupt_latency(kind)
+    print(f"\ninterrupt to silence: p50 {statistics.median(latencies) * 1000:.1f} ms, "
+          f"max {latencies[-1] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
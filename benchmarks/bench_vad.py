@@ -0,0 +1,117 @@
+"""
+VAD Benchmark
+Runs the synthetic WAV corpus through the old endpointing (energy
+threshold over the noise floor, fixed 1.0 s pause) and the NumPy VAD with
+adaptive hangover. Reports chunk accuracy, utterances cut off before the
+last word, and end-of-speech latency (endpoint minus true end of speech),
+plus the per-chunk cost.
+
+Usage:
+    python -m benchmarks.bench_vad [clips_per_condition]
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+
+import app.vad as vad
+from app.audio_capture import WavFileSource
+from benchmarks.wav_corpus import build_corpus
+
+
+def chunk_labels(clip, chunk_seconds, count):
+    """True for chunks that are mostly inside a word."""
+    labels = []
+    for i in range(count):
+        start, end = i * chunk_seconds, (i + 1) * chunk_seconds
+        overlap = sum(max(0.0, min(e, end) - max(s, start)) for s, e in clip.speech)
+        labels.append(overlap > chunk_seconds / 2)
+    return labels
+
+
+def read_chunks(path):
+    source = WavFileSource(path)
+    source.open()
+    chunks = []
+    while True:
+        buffer = source.read(source.CHUNK)
+        if len(buffer) < source.CHUNK * source.SAMPLE_WIDTH:
+            break
+        chunks.append(buffer)
+    source.close()
+    return source, chunks
+
+
+def run(clip, spectral, hangover):
+    """(chunk decisions, endpoint time or None) for one clip."""
+    source, chunks = read_chunks(clip.path)
+    detector = vad.VoiceActivityDetector(source.SAMPLE_RATE, source.SAMPLE_WIDTH,
+                                         source.CHUNK, spectral=spectral)
+    if hangover is None:
+        endpointer = vad.Endpointer(detector.chunk_seconds)
+    else:
+        # Old loop: first loud chunk starts the utterance, fixed pause ends it
+        endpointer = vad.Endpointer(detector.chunk_seconds, hangover, hangover, min_speech=0.0)
+    decisions, endpoint = [], None
+    for i, buffer in enumerate(chunks):
+        frame = detector.process(buffer)
+        decisions.append(frame.is_speech)
+        if endpoint is None and endpointer.feed(frame):
+            endpoint = (i + 1) * detector.chunk_seconds
+    return decisions, endpoint, detector.chunk_seconds
+
+
+def evaluate(clips, spectral, hangover):
+    correct = total = cut_off = missed = 0
+    latencies = []
+    for clip in clips:
+        decisions, endpoint, chunk_seconds = run(clip, spectral, hangover)
+        labels = chunk_labels(clip, chunk_seconds, len(decisions))
+        correct += sum(d == l for d, l in zip(decisions, labels))
+        total += len(labels)
+        if endpoint is None:
+            missed += 1
+        elif endpoint < clip.speech_end - 0.05:
+            cut_off += 1
+        else:
+            latencies.append(endpoint - clip.speech_end)
+    return correct / total, cut_off, missed, latencies
+
+
+def chunk_cost_us(clip, spectral, rounds=5):
+    source, chunks = read_chunks(clip.path)
+    detector = vad.VoiceActivityDetector(source.SAMPLE_RATE, source.SAMPLE_WIDTH,
+                                         source.CHUNK, spectral=spectral)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for buffer in chunks:
+            detector.process(buffer)
+    return (time.perf_counter() - start) / (rounds * len(chunks)) * 1e6
+
+
+def main():
+    per_condition = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    clips = build_corpus(tempfile.mkdtemp(prefix="autobot_vad_"), per_condition=per_condition)
+    print(f"{len(clips)} clips (white/brown/hum noise at 20/10/5 dB SNR)\n")
+
+    print(f"{'':<30} {'accuracy':>8} {'cut off':>8} {'missed':>7} {'EoS p50':>8} {'EoS p95':>8}")
+    runs = [("energy + fixed 1.0s pause", False, 1.0), ("VAD + adaptive hangover", True, None)]
+    for label, spectral, hangover in runs:
+        accuracy, cut_off, missed, latencies = evaluate(clips, spectral, hangover)
+        latencies.sort()
+        p50 = statistics.median(latencies) if latencies else float("nan")
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else float("nan")
+        print(f"{label:<30} {accuracy:>8.1%} {cut_off:>8} {missed:>7} "
+              f"{p50 * 1000:>6.0f}ms {p95 * 1000:>6.0f}ms")
+
+    print(f"\nper chunk: spectral {chunk_cost_us(clips[0], True):.0f} us, "
+          f"energy only {chunk_cost_us(clips[0], False):.0f} us")
+    if vad.np is not None:
+        vad.np, numpy = None, vad.np
+        print(f"energy only without NumPy: {chunk_cost_us(clips[0], False):.0f} us")
+        vad.np = numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Fake LLM Server - Offline OpenAI/Groq-Compatible Stand-In
+Serves POST .../chat/completions (plain or SSE streaming) and GET .../models
+with scripted, deterministic replies. Time-to-first-byte, token rate and
+injected HTTP errors are configurable, so latency work can be measured
+without the real API. Point the app at it with
+GROQ_BASE_URL=http://127.0.0.1:<port>.
+
+Usage:
+    python -m benchmarks.fake_llm_server [port] [tokens_per_sec] [ttfb_ms] [error_rate]
+"""
+
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Tuple, Union
+
+
+DEFAULT_PLAN = {
+    "plan": [
+        {"action": "RESPONSE", "payload": "On it."},
+        {"action": "LAUNCH_SYS", "payload": "notepad"},
+        {"action": "TYPE_STRING", "payload": "Meeting notes for today"},
+        {"action": "RESPONSE", "payload": "Notes are ready."},
+    ]
+}
+
+ESSAY_REQUEST = re.compile(r'essay on: "(.+?)"')
+
+
+def essay_reply(user_text: str) -> str:
+    """A complete essay in the structure generate_essay validates."""
+    match = ESSAY_REQUEST.search(user_text)
+    topic = match.group(1) if match else "the topic"
+    sentence = f"This paragraph discusses {topic} in measured, formal prose."
+    return json.dumps({
+        "title": f"On {topic.title()}",
+        "introduction": " ".join([sentence] * 4),
+        "body": [" ".join([sentence] * 5) for _ in range(4)],
+        "conclusion": " ".join([sentence] * 3),
+    })
+
+
+def default_reply(user_text: str) -> str:
+    """Scripted reply: the same four-step plan for every request."""
+    return json.dumps(DEFAULT_PLAN)
+
+
+# (pattern, reply) - first pattern found in the user message wins
+Reply = Union[str, Callable[[str], str]]
+DEFAULT_SCRIPT: List[Tuple[str, Reply]] = [
+    (ESSAY_REQUEST.pattern, essay_reply),
+]
+
+
+def split_tokens(text: str, size: int = 4):
+    """Rough tokenizer - fixed-size character slices."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class FakeLLMServer:
+    """
+    Threaded HTTP server speaking the chat completions protocol.
+    Use as a context manager or call start()/stop().
+    """
+
+    def __init__(self, reply: Callable[[str], str] = default_reply,
+                 tokens_per_sec: float = 200.0, host: str = "127.0.0.1", port: int = 0,
+                 ttfb: float = 0.0, script: Optional[List[Tuple[str, Reply]]] = None,
+                 error_rate: float = 0.0, error_status: int = 500,
+                 error_every: int = 0, seed: int = 0):
+        """
+        Args:
+            reply: Maps the last user message to the completion text when
+                no script pattern matches
+            tokens_per_sec: Generation rate (streamed and non-streamed)
+            host, port: Bind address (port 0 = any free port)
+            ttfb: Seconds before the response headers are sent
+            script: (regex, reply) pairs tried before `reply`
+                (defaults to DEFAULT_SCRIPT, which answers essay requests)
+            error_rate: Fraction of completions answered with error_status
+            error_status: HTTP status of injected errors (e.g. 429, 500, 503)
+            error_every: Also fail every Nth completion (0 = off)
+            seed: Seed for the error-injection RNG (runs are repeatable)
+        """
+        self.reply = reply
+        self.tokens_per_sec = tokens_per_sec
+        self.ttfb = ttfb
+        self.script = [(re.compile(p), r) for p, r in (DEFAULT_SCRIPT if script is None else script)]
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_every = error_every
+
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._counter_lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ==================== BEHAVIOUR ====================
+
+    def _token_delay(self) -> float:
+        return 1.0 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+    def _next_request_fails(self) -> bool:
+        """Count the request and decide (deterministically) whether to fail it."""
+        with self._counter_lock:
+            self.requests += 1
+            fail = bool(self.error_every) and self.requests % self.error_every == 0
+            # Always draw, so the sequence does not depend on error_every
+            if self._rng.random() < self.error_rate:
+                fail = True
+            if fail:
+                self.errors += 1
+            return fail
+
+    def _content_for(self, user_text: str) -> str:
+        for pattern, reply in self.script:
+            if pattern.search(user_text):
+                return reply(user_text) if callable(reply) else reply
+        return self.reply(user_text)
+
+    # ==================== PROTOCOL ====================
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                # Model listing - used by the client warm-up
+                if not self.path.endswith("/models"):
+                    self.send_error(404)
+                    return
+                self._json(200, {"object": "list", "data": []})
+
+            def do_POST(self):
+                if not self.path.endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                if server.ttfb > 0:
+                    time.sleep(server.ttfb)
+
+                if server._next_request_fails():
+                    self._json(server.error_status, {"error": {
+                        "message": "Injected failure from the fake LLM server.",
+                        "type": "server_error",
+                        "code": str(server.error_status),
+                    }})
+                    return
+
+                messages = body.get("messages", [])
+                user_text = next((m.get("content", "") for m in reversed(messages)
+                                  if m.get("role") == "user"), "")
+                content = server._content_for(user_text)
+                model = body.get("model", "fake-model")
+
+                if body.get("stream"):
+                    self._stream(content, model)
+                else:
+                    self._complete(content, model)
+
+            def _json(self, status, data):
+                payload = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _complete(self, content, model):
+                time.sleep(server._token_delay() * len(split_tokens(content)))
+                self._json(200, {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                })
+
+            def _stream(self, content, model):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                delay = server._token_delay()
+                tokens = split_tokens(content)
+                for i, token in enumerate(tokens):
+                    time.sleep(delay)
+                    self._event({
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{
+                            "index": 0,
+                            "delta": {"role": "assistant", "content": token} if i == 0
+                                     else {"content": token},
+                            "finish_reason": None,
+                        }],
+                    })
+                self._event({
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                })
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+            def _event(self, data):
+                self.wfile.write(b"data: " + json.dumps(data).encode("utf-8") + b"\n\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 200.0
+    ttfb_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    error_rate = float(sys.argv[4]) if len(sys.argv) > 4 else 0.0
+    server = FakeLLMServer(tokens_per_sec=rate, port=port, ttfb=ttfb_ms / 1000.0,
+                           error_rate=error_rate)
+    print(f"Fake LLM server on {server.base_url} ({rate:g} tokens/s, "
+          f"TTFB {ttfb_ms:g} ms, error rate {error_rate:g}) - Ctrl+C to stop")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()